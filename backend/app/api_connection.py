@@ -1,9 +1,29 @@
-from fastapi import FastAPI
+import logging
+import time
+import uuid
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from backend.app import auth_routes, expenses, group_routes, shopping_list_routes, chores_routes, events
+from backend.app.logging_config import configure_logging, request_id_var
+from backend.app.tracing import configure_tracing, instrument_app
+from backend.app.background import start_background_worker, stop_background_worker
+from backend.app import auth_routes, expenses, group_routes, shopping_list_routes, chores_routes, events, calendar_routes
+
+configure_logging()
+configure_tracing()
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the periodic background tasks alongside the API"""
+    await start_background_worker()
+    yield
+    await stop_background_worker()
 
 
-app = FastAPI(title="HomeBase API")
+app = FastAPI(title="HomeBase API", lifespan=lifespan)
 
 # CORS configuration
 app.add_middleware(
@@ -12,8 +32,33 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+
+@app.middleware("http")
+async def request_context(request: Request, call_next):
+    """Tag every log record of a request with its request id"""
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    token = request_id_var.set(request_id)
+    started = time.perf_counter()
+    try:
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        logger.info(
+            "%s %s -> %s",
+            request.method,
+            request.url.path,
+            response.status_code,
+            extra={"duration_ms": round((time.perf_counter() - started) * 1000, 2)},
+        )
+        return response
+    finally:
+        request_id_var.reset(token)
+
+
+instrument_app(app)
+
 # Include all routers with proper prefixes
 app.include_router(auth_routes.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(expenses.router, tags=["Expenses"])
@@ -21,6 +66,7 @@ app.include_router(group_routes.router, prefix="/api", tags=["Groups"])
 app.include_router(shopping_list_routes.router, tags=["shopping-lists"])
 app.include_router(chores_routes.router, prefix="/api", tags=["Chores"]) 
 app.include_router(events.router, prefix="/api", tags=["Events"])
+app.include_router(calendar_routes.router, prefix="/api", tags=["Calendar"])
 
 @app.get("/")
 def root():
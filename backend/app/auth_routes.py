@@ -103,7 +103,7 @@ async def register(user_data: ProfileCreate, conn = Depends(get_db)):
             new_user_id = cursor.fetchone()['profile_id']
             conn.commit()
 
-            logger.info(f"New user registered: {new_user_id}")
+            logger.info("New user registered: %s", new_user_id)
 
             # Create access token
             access_token = create_access_token(new_user_id)
@@ -120,14 +120,14 @@ async def register(user_data: ProfileCreate, conn = Depends(get_db)):
         raise
     except PsycopgError as e:
         conn.rollback()
-        logger.error(f"Database error during registration: {e}")
+        logger.error("Database error during registration: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error occurred"
         )
     except Exception as e:
         conn.rollback()
-        logger.error(f"Unexpected error during registration: {e}")
+        logger.error("Unexpected error during registration: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred"
@@ -160,7 +160,7 @@ async def login(credentials: UserLogin, conn = Depends(get_db)):
                     detail="Incorrect email or password"
                 )
 
-            logger.info(f"User logged in: {profile_id}")
+            logger.info("User logged in: %s", profile_id)
 
             # Create access token
             access_token = create_access_token(profile_id)
@@ -174,13 +174,13 @@ async def login(credentials: UserLogin, conn = Depends(get_db)):
     except HTTPException:
         raise
     except PsycopgError as e:
-        logger.error(f"Database error during login: {e}")
+        logger.error("Database error during login: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error occurred"
         )
     except Exception as e:
-        logger.error(f"Unexpected error during login: {e}")
+        logger.error("Unexpected error during login: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred"
@@ -236,7 +236,7 @@ async def refresh_token(authorization: str = Header(None), conn = Depends(get_db
                     detail="User not found"
                 )
         
-        logger.info(f"Token refreshed for user: {user_id}")
+        logger.info("Token refreshed for user: %s", user_id)
         
         # Create new token
         new_access_token = create_access_token(int(user_id))
@@ -247,7 +247,7 @@ async def refresh_token(authorization: str = Header(None), conn = Depends(get_db
         }
         
     except JWTError as e:
-        logger.warning(f"JWT error during token refresh: {e}")
+        logger.warning("JWT error during token refresh: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
@@ -255,7 +255,7 @@ async def refresh_token(authorization: str = Header(None), conn = Depends(get_db
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error during token refresh: {e}")
+        logger.error("Unexpected error during token refresh: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred"
@@ -267,7 +267,7 @@ async def logout(user_id: str = Depends(get_current_user_from_token)):
     Logout endpoint. Since JWTs are stateless, this mainly acknowledges
     the logout request. The client should clear the token.
     """
-    logger.info(f"User logged out: {user_id}")
+    logger.info("User logged out: %s", user_id)
     return {
         "message": "Logged out successfully"
     }
@@ -305,13 +305,13 @@ async def get_current_user(
     except HTTPException:
         raise
     except PsycopgError as e:
-        logger.error(f"Database error fetching user: {e}")
+        logger.error("Database error fetching user: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error occurred"
         )
     except Exception as e:
-        logger.error(f"Unexpected error fetching user: {e}")
+        logger.error("Unexpected error fetching user: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred"
@@ -372,7 +372,7 @@ async def update_user(
             
             conn.commit()
             
-            logger.info(f"User updated: {user_id}")
+            logger.info("User updated: %s", user_id)
 
             return UserResponse(
                 profile_id=updated_user['profile_id'],
@@ -386,14 +386,14 @@ async def update_user(
         raise
     except PsycopgError as e:
         conn.rollback()
-        logger.error(f"Database error updating user: {e}")
+        logger.error("Database error updating user: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error occurred"
         )
     except Exception as e:
         conn.rollback()
-        logger.error(f"Unexpected error updating user: {e}")
+        logger.error("Unexpected error updating user: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred"
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+import os
+from typing import Callable, Dict, Optional, Tuple
+
+from backend.db.chore_digests import scan_overdue_chores
+from backend.db.chore_stats import rollup_chore_weeks
+from backend.db.chore_templates import materialize_chore_templates
+from backend.db.recurring_expense_calendar import process_calendar_outbox
+
+logger = logging.getLogger(__name__)
+
+# Tunables (environment overrides)
+CALENDAR_OUTBOX_INTERVAL = float(os.getenv("CALENDAR_OUTBOX_INTERVAL", "5.0"))
+CHORE_SCHEDULER_INTERVAL = float(os.getenv("CHORE_SCHEDULER_INTERVAL", "3600.0"))
+CHORE_ROLLUP_INTERVAL = float(os.getenv("CHORE_ROLLUP_INTERVAL", "3600.0"))
+CHORE_OVERDUE_INTERVAL = float(os.getenv("CHORE_OVERDUE_INTERVAL", "300.0"))
+
+# name -> (handler(), interval in seconds); synchronous, run in a thread
+PERIODIC_TASKS: Dict[str, Tuple[Callable[[], object], float]] = {}
+
+
+def register_periodic(name: str, interval: float):
+    """Decorator registering a task to run every `interval` seconds"""
+    def decorator(func):
+        PERIODIC_TASKS[name] = (func, interval)
+        return func
+    return decorator
+
+
+class PeriodicTask:
+    """Runs a function every `interval` seconds, or sooner when woken"""
+
+    def __init__(self, name: str, func: Callable[[], object], interval: float):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def wake(self):
+        if self._loop and self._wake:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def _run(self):
+        while True:
+            self._wake.clear()
+            try:
+                await asyncio.to_thread(self.func)
+            except Exception:
+                logger.exception("Periodic task %s failed", self.name)
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+_periodic: Dict[str, PeriodicTask] = {}
+
+
+async def start_background_worker():
+    """
+    Start the in-process periodic tasks unless disabled with
+    BACKGROUND_WORKER=0
+    """
+    if os.getenv("BACKGROUND_WORKER", "1") == "0":
+        logger.info("Background worker disabled")
+        return
+
+    for name, (func, interval) in PERIODIC_TASKS.items():
+        _periodic[name] = PeriodicTask(name, func, interval)
+        await _periodic[name].start()
+    logger.info("Background tasks started: %s", ", ".join(_periodic))
+
+
+async def stop_background_worker():
+    for task in _periodic.values():
+        await task.stop()
+    _periodic.clear()
+    logger.info("Background tasks stopped")
+
+
+def wake_task(name: str):
+    """Run a periodic task now instead of at its next interval"""
+    task = _periodic.get(name)
+    if task:
+        task.wake()
+
+
+# ==================== PERIODIC TASKS ====================
+
+@register_periodic("calendar_outbox", CALENDAR_OUTBOX_INTERVAL)
+def drain_calendar_outbox():
+    process_calendar_outbox()
+
+
+@register_periodic("chore_scheduler", CHORE_SCHEDULER_INTERVAL)
+def run_chore_scheduler():
+    materialize_chore_templates()
+
+
+@register_periodic("chore_stats_rollup", CHORE_ROLLUP_INTERVAL)
+def run_chore_stats_rollup():
+    rollup_chore_weeks()
+
+
+@register_periodic("chore_overdue_scan", CHORE_OVERDUE_INTERVAL)
+def run_chore_overdue_scan():
+    scan_overdue_chores()
@@ -0,0 +1,248 @@
+import hashlib
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from typing import Iterator, List
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+
+from backend.app.auth_routes import get_current_user_from_token
+from backend.app.ics import render_calendar
+from backend.app.security import create_feed_token, decode_feed_token
+from backend.db.cache import VersionedCache
+from backend.db.connection import get_connection
+from backend.db.event_queries import get_calendar_version, iter_calendar_events
+from backend.db.recurring_expense_calendar import (
+    expense_event_text,
+    expense_occurrences,
+    get_recurring_expenses,
+)
+from backend.db.recurrence import to_rrule
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Feeds include events that ended up to this many days ago
+FEED_PAST_DAYS = int(os.getenv("CALENDAR_FEED_PAST_DAYS", "180"))
+
+# How long clients may reuse a feed before revalidating
+FEED_MAX_AGE = int(os.getenv("CALENDAR_FEED_MAX_AGE", "300"))
+
+ICS_MEDIA_TYPE = "text/calendar; charset=utf-8"
+
+# Rendered feed bodies, keyed by scope and valid while its version is current
+feed_cache = VersionedCache(max_entries=int(os.getenv("CALENDAR_FEED_CACHE_SIZE", "500")))
+
+
+def _feed_events(rows) -> Iterator[dict]:
+    for row in rows:
+        yield {
+            "uid": f"event-{row['event_id']}@homebase",
+            "summary": row["event_name"],
+            "start": row["event_datetime_start"],
+            "end": row["event_datetime_end"],
+            "description": row["event_notes"],
+            "location": row["event_location"],
+            "rrule": to_rrule(row) if row["recurrence_freq"] else None,
+            "exdates": row["recurrence_exdates"],
+        }
+
+
+def _expense_events(expenses: List[dict], since: datetime) -> Iterator[dict]:
+    """Occurrences of recurring expenses, generated on the fly"""
+    for expense in expenses:
+        summary, description = expense_event_text(expense)
+        for occurrence in expense_occurrences(expense):
+            start = occurrence.replace(tzinfo=timezone.utc)
+            end = start + timedelta(hours=1)
+            if end <= since:
+                continue
+            yield {
+                "uid": f"expense-{expense['item_id']}-{start:%Y%m%d}@homebase",
+                "summary": summary,
+                "start": start,
+                "end": end,
+                "description": description,
+            }
+
+
+def _etag(version: tuple) -> str:
+    return '"' + hashlib.sha1(repr(version).encode()).hexdigest()[:20] + '"'
+
+
+def _serve_feed(request: Request, cache_key, version: tuple, name: str,
+                event_rows, expense_group_ids: List[int], since: datetime) -> Response:
+    """
+    Answer a feed request: 304 if the client's copy is current, the cached
+    body if this version was rendered before, otherwise stream a fresh
+    rendering and cache it once complete
+    """
+    etag = _etag(version)
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={FEED_MAX_AGE}"}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+        event_rows.close()
+        return Response(status_code=304, headers=headers)
+
+    body = feed_cache.get(cache_key, version)
+    if body is not None:
+        event_rows.close()
+        return Response(content=body, media_type=ICS_MEDIA_TYPE, headers=headers)
+
+    def stream():
+        chunks = []
+        try:
+            expenses = get_recurring_expenses(expense_group_ids) if expense_group_ids else []
+            events = chain(_feed_events(event_rows), _expense_events(expenses, since))
+            for text in render_calendar(name, events):
+                chunk = text.encode("utf-8")
+                chunks.append(chunk)
+                yield chunk
+        finally:
+            event_rows.close()
+        feed_cache.put(cache_key, version, b"".join(chunks))
+
+    return StreamingResponse(stream(), media_type=ICS_MEDIA_TYPE, headers=headers)
+
+
+def _feed_profile_id(token: str) -> int:
+    """Profile of a feed token, checked against its current feed_token_version"""
+    decoded = decode_feed_token(token)
+    if decoded is not None:
+        profile_id, version = decoded
+        if _feed_token_version(profile_id) == version:
+            return profile_id
+    raise HTTPException(status_code=401, detail="Invalid calendar feed token")
+
+
+def _feed_token_version(profile_id: int, rotate: bool = False):
+    """A profile's feed token version, first incremented if `rotate`; None if no such profile"""
+    conn = get_connection()
+    cur = conn.cursor()
+    try:
+        if rotate:
+            cur.execute("""
+                UPDATE profile SET feed_token_version = feed_token_version + 1
+                WHERE profile_id = %s
+                RETURNING feed_token_version
+            """, (profile_id,))
+        else:
+            cur.execute(
+                "SELECT feed_token_version FROM profile WHERE profile_id = %s", (profile_id,)
+            )
+        row = cur.fetchone()
+        conn.commit()
+        return row["feed_token_version"] if row else None
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+        conn.close()
+
+
+def _feed_urls(request: Request, profile_id: int, version: int) -> dict:
+    token = create_feed_token(profile_id, version)
+    base = str(request.base_url).rstrip("/")
+    return {
+        "token": token,
+        "profile_feed_url": f"{base}/api/calendar/profiles/{profile_id}.ics?token={token}",
+        "group_feed_url_template": f"{base}/api/calendar/groups/{{group_id}}.ics?token={token}",
+    }
+
+
+def _lookup_name(query: str, params: tuple):
+    conn = get_connection()
+    cur = conn.cursor()
+    try:
+        cur.execute(query, params)
+        row = cur.fetchone()
+        return row["name"] if row else None
+    finally:
+        cur.close()
+        conn.close()
+
+
+@router.get("/calendar/feed-token")
+async def get_feed_token(
+    request: Request,
+    user_id: str = Depends(get_current_user_from_token),
+):
+    """Token and subscription URL for the current user's calendar feeds"""
+    version = _feed_token_version(int(user_id))
+    if version is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return _feed_urls(request, int(user_id), version)
+
+
+@router.post("/calendar/feed-token/rotate")
+async def rotate_feed_token(
+    request: Request,
+    user_id: str = Depends(get_current_user_from_token),
+):
+    """
+    Revoke every feed URL handed out so far (e.g. after one leaked) and
+    return new ones
+    """
+    version = _feed_token_version(int(user_id), rotate=True)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    logger.info("Rotated calendar feed token of profile %s", user_id)
+    return _feed_urls(request, int(user_id), version)
+
+
+@router.get("/calendar/profiles/{profile_id}.ics")
+def get_profile_feed(profile_id: int, token: str, request: Request):
+    """iCalendar feed of a profile's events and its groups' recurring expenses"""
+    if _feed_profile_id(token) != profile_id:
+        raise HTTPException(status_code=403, detail="Token is not valid for this profile")
+
+    try:
+        version = get_calendar_version(profile_id=profile_id)
+        group_ids = [group_id for group_id, _ in version[3]]
+        name = _lookup_name(
+            "SELECT profile_name AS name FROM profile WHERE profile_id = %s", (profile_id,)
+        )
+        if name is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
+
+        since = datetime.now(timezone.utc) - timedelta(days=FEED_PAST_DAYS)
+        rows = iter_calendar_events(profile_id=profile_id, since=since)
+        return _serve_feed(request, ("profile", profile_id), version,
+                           f"{name} - HomeBase", rows, group_ids, since)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error serving calendar feed for profile %s: %s", profile_id, e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/calendar/groups/{group_id}.ics")
+def get_group_feed(group_id: int, token: str, request: Request):
+    """iCalendar feed of a group's events and recurring expenses"""
+    profile_id = _feed_profile_id(token)
+
+    try:
+        name = _lookup_name("""
+            SELECT g.group_name AS name
+            FROM "Group" g
+            JOIN groupprofile gp ON gp.group_id = g.group_id
+            WHERE g.group_id = %s AND gp.profile_id = %s
+        """, (group_id, profile_id))
+        if name is None:
+            raise HTTPException(status_code=403, detail="Not a member of this group")
+
+        version = get_calendar_version(group_id=group_id)
+        since = datetime.now(timezone.utc) - timedelta(days=FEED_PAST_DAYS)
+        rows = iter_calendar_events(group_id=group_id, since=since)
+        return _serve_feed(request, ("group", group_id), version,
+                           f"{name} - HomeBase", rows, [group_id], since)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error serving calendar feed for group %s: %s", group_id, e)
+        raise HTTPException(status_code=500, detail=str(e))
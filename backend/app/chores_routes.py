@@ -1,22 +1,51 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
+import os
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from datetime import datetime
+from typing import List, Optional
 from backend.db.pydanticmodels import (
     ChoreCreate, 
+    ChoreBulkCreate,
     Chore, 
+    ChoreCreated,
     ChoreWithAssignees, 
     ChoreAssign, 
-    ChoreStatusUpdate
+    ChoreStatusUpdate,
+    ChoreTemplateCreate,
+    ChoreTemplate,
+    ChoreAutoAssign,
+    ChoreBatchStatusUpdate,
 )
 from backend.db.chores_queries import (
-    create_chore, get_chore_by_id, get_chores_for_group,
-    get_chores_with_assignees, assign_chore_to_profile,
+    create_chore, create_chores_bulk, get_chore_by_id, get_chores_for_group,
+    render_chores_with_assignees, assign_chore_to_profile,
     unassign_chore_from_profile, update_chore_status,
-    toggle_chore_status, get_chores_for_profile, update_chore, delete_chore
+    toggle_chore_status, get_chores_for_profile, update_chore, delete_chore,
+    auto_assign_chores, get_chore_workloads, update_chore_statuses,
+    encode_chore_cursor, decode_chore_cursor,
+    DEFAULT_PROFILE_CHORE_PAGE, MAX_PROFILE_CHORE_PAGE
 )
+from backend.db.chore_templates import (
+    create_chore_template, get_chore_templates, delete_chore_template
+)
+from backend.db.chore_stats import get_leaderboard
+from backend.db.chore_digests import get_chore_digest, mark_chore_digest_seen
+from backend.db.cache import VersionedCache, get_scope_versions
+from backend.db.connection import PoolTimeout
+from backend.app.background import wake_task
 
 # Create router instead of FastAPI app
 router = APIRouter()
 
+# Serialized detailed chore lists, keyed by group and valid while its
+# 'chores' scope version is current
+chore_view_cache = VersionedCache(max_entries=int(os.getenv("CHORE_VIEW_CACHE_SIZE", "1000")))
+
+# Response when every pooled database connection stays busy (PoolTimeout)
+DATABASE_BUSY = dict(status_code=503, detail="Database is busy, try again shortly",
+                     headers={"Retry-After": "1"})
+
 # ==================== CHORE MANAGEMENT ====================
 
 @router.post("/chores", status_code=201, response_model=Chore)
@@ -25,24 +54,37 @@ async def create_chore_endpoint(chore: ChoreCreate):  # Renamed to avoid conflic
     Create a new chore for a group
     """
     try:
-        chore_id = create_chore(  # Changed from chore_queries.create_chore
+        return create_chore(  # Changed from chore_queries.create_chore
             group_id=chore.group_id,
             name=chore.name,
             due_date=chore.due_date,
-            notes=chore.notes
+            notes=chore.notes,
+            effort=chore.effort
         )
         
-        created_chore = get_chore_by_id(chore_id)  # Changed
-        
-        if not created_chore:
-            raise HTTPException(status_code=500, detail="Failed to retrieve created chore")
-        
-        return created_chore
-        
+    except PoolTimeout:
+        raise HTTPException(**DATABASE_BUSY)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating chore: {str(e)}")
 
 
+@router.post("/chores/bulk", status_code=201, response_model=List[ChoreCreated])
+async def create_chores_bulk_endpoint(request: ChoreBulkCreate):
+    """
+    Create many chores, each with its assignees, in one transaction
+    Body: { "chores": [{ "group_id": 1, "name": "Dishes", "assignee_ids": [5] }, ...] }
+    """
+    try:
+        return create_chores_bulk([chore.model_dump() for chore in request.chores])
+        
+    except PoolTimeout:
+        raise HTTPException(**DATABASE_BUSY)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error creating chores: {str(e)}")
+
+
 @router.get("/chores/{chore_id}", response_model=Chore)
 async def get_chore(chore_id: int):
     """
@@ -79,49 +121,129 @@ async def get_group_chores(group_id: int):
 async def get_group_chores_with_assignees(group_id: int):
     """
     Get all chores for a group WITH assignee information
+    Served from the chore view cache until a chore or assignment of the group changes
     """
     try:
-        chores = get_chores_with_assignees(group_id)  # Changed
-        return chores
+        version = get_scope_versions("chores", [group_id])[group_id]
+        body = chore_view_cache.get(group_id, version)
+        if body is None:
+            version, body = render_chores_with_assignees(group_id)
+            chore_view_cache.put(group_id, version, body)
         
+        return Response(content=body, media_type="application/json")
+        
+    except PoolTimeout:
+        raise HTTPException(**DATABASE_BUSY)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching chores: {str(e)}")
 
 
 @router.get("/profiles/{profile_id}/chores")
-async def get_profile_chores(profile_id: int):
+async def get_profile_chores(
+    profile_id: int,
+    status: Optional[str] = Query(None, pattern="^(pending|completed)$"),
+    group_id: Optional[int] = None,
+    due_after: Optional[datetime] = None,
+    due_before: Optional[datetime] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PROFILE_CHORE_PAGE),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page")
+):
     """
-    Get all chores assigned to a specific profile/roommate
+    Get the chores assigned to a specific profile/roommate, soonest due first
+    Filter with ?status=pending, ?group_id=, ?due_after= and ?due_before=
+    All chores are returned unless ?limit= is given; then, when more chores follow,
+    the X-Next-Cursor response header holds the cursor for the next page
     """
+    after = None
+    if cursor:
+        try:
+            after = decode_chore_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if limit is None:
+            limit = DEFAULT_PROFILE_CHORE_PAGE
+    
     try:
-        chores = get_chores_for_profile(profile_id)  # Changed
-        return chores
+        chores, has_more = get_chores_for_profile(
+            profile_id,
+            status=status,
+            group_id=group_id,
+            due_after=due_after,
+            due_before=due_before,
+            limit=limit,
+            after=after
+        )
+        
+        headers = {}
+        if has_more:
+            headers["X-Next-Cursor"] = encode_chore_cursor(chores[-1])
+        return JSONResponse(jsonable_encoder(chores), headers=headers)
         
+    except PoolTimeout:
+        raise HTTPException(**DATABASE_BUSY)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching chores: {str(e)}")
 
 
+@router.get("/profiles/{profile_id}/chores/digest")
+async def get_profile_chore_digest(profile_id: int):
+    """
+    Get the overdue chores collected for a profile since it last saw its digest
+    """
+    try:
+        digest = get_chore_digest(profile_id)
+        
+        if not digest:
+            return {"profile_id": profile_id, "chores": []}
+        
+        return digest
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching chore digest: {str(e)}")
+
+
+@router.post("/profiles/{profile_id}/chores/digest/seen", status_code=200)
+async def mark_profile_chore_digest_seen(profile_id: int):
+    """
+    Mark a profile's digest as seen; chores that fall due later start a new one
+    """
+    try:
+        seen = mark_chore_digest_seen(profile_id)
+        
+        if not seen:
+            raise HTTPException(status_code=404, detail=f"No open chore digest for profile {profile_id}")
+        
+        return {"message": f"Chore digest of profile {profile_id} marked as seen"}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error updating chore digest: {str(e)}")
+
+
 @router.put("/chores/{chore_id}", response_model=Chore)
 async def update_chore_endpoint(chore_id: int, chore_update: ChoreCreate):  # Renamed
     """
     Update chore details (name, due_date, notes)
     """
     try:
-        success = update_chore(  # Changed
+        updated_chore = update_chore(  # Changed
             chore_id=chore_id,
             name=chore_update.name,
             due_date=chore_update.due_date,
-            notes=chore_update.notes
+            notes=chore_update.notes,
+            effort=chore_update.effort
         )
         
-        if not success:
+        if not updated_chore:
             raise HTTPException(status_code=404, detail=f"Chore {chore_id} not found")
         
-        updated_chore = get_chore_by_id(chore_id)  # Changed
         return updated_chore
         
     except HTTPException:
         raise
+    except PoolTimeout:
+        raise HTTPException(**DATABASE_BUSY)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error updating chore: {str(e)}")
 
@@ -194,8 +316,88 @@ async def unassign_chore(chore_id: int, profile_id: int):
         raise HTTPException(status_code=500, detail=f"Error unassigning chore: {str(e)}")
 
 
+@router.post("/groups/{group_id}/chores/auto-assign")
+async def auto_assign_chores_endpoint(group_id: int, request: ChoreAutoAssign):
+    """
+    Assign chores to the members with the least accumulated workload
+    (effort of the chores they were given before)
+    Body: { "chore_ids": [1, 2], "assignees_per_chore": 1 } or {} for every unassigned chore
+    """
+    try:
+        assigned = auto_assign_chores(
+            group_id=group_id,
+            chore_ids=request.chore_ids,
+            assignees_per_chore=request.assignees_per_chore,
+            candidate_ids=request.candidate_ids
+        )
+        
+        return {
+            "message": f"Assigned {len(assigned)} chore(s)",
+            "assignments": assigned
+        }
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error auto-assigning chores: {str(e)}")
+
+
+@router.get("/groups/{group_id}/chores/workload")
+async def get_chore_workload_endpoint(group_id: int):
+    """
+    Get each member's chore workload in a group, least loaded first
+    """
+    try:
+        return get_chore_workloads(group_id)
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching workload: {str(e)}")
+
+
+@router.get("/groups/{group_id}/chores/leaderboard")
+async def get_chore_leaderboard_endpoint(group_id: int, weeks: int = Query(4, ge=1, le=52)):
+    """
+    Get each member's chore completion stats in a group, most completions first
+    Includes overdue completions, on-time streaks and totals for the last `weeks` weeks
+    """
+    try:
+        return get_leaderboard(group_id, weeks)
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching leaderboard: {str(e)}")
+
+
 # ==================== CHORE STATUS ====================
 
+@router.patch("/chores/status")
+async def update_chore_statuses_endpoint(request: ChoreBatchStatusUpdate):
+    """
+    Change many chore statuses in one request
+    Body: { "changes": [{ "chore_id": 1, "profile_id": 5, "status": "completed" }, ...] }
+    status may also be "toggle"
+    """
+    try:
+        updated = update_chore_statuses([change.model_dump() for change in request.changes])
+        
+        found = {(u["chore_id"], u["profile_id"]) for u in updated}
+        not_found = [
+            {"chore_id": c.chore_id, "profile_id": c.profile_id}
+            for c in request.changes
+            if (c.chore_id, c.profile_id) not in found
+        ]
+        
+        return {
+            "message": f"Updated {len(updated)} chore assignment(s)",
+            "updated": updated,
+            "not_found": not_found
+        }
+        
+    except PoolTimeout:
+        raise HTTPException(**DATABASE_BUSY)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error updating statuses: {str(e)}")
+
+
 @router.patch("/chores/{chore_id}/status/{profile_id}")
 async def update_chore_status_endpoint(chore_id: int, profile_id: int, status_update: ChoreStatusUpdate):  # Renamed
     """
@@ -258,4 +460,57 @@ async def toggle_chore_status_endpoint(chore_id: int, profile_id: int):  # Renam
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error toggling status: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error toggling status: {str(e)}")
+
+
+# ==================== RECURRING CHORES ====================
+
+@router.post("/groups/{group_id}/chore-templates", status_code=201, response_model=ChoreTemplate)
+async def create_chore_template_endpoint(group_id: int, template: ChoreTemplateCreate):
+    """
+    Create a recurring chore; the scheduler materializes its upcoming
+    occurrences and assigns them by the rotation policy
+    """
+    try:
+        created = create_chore_template(group_id=group_id, **template.model_dump())
+        wake_task('chore_scheduler')
+        return created
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error creating recurring chore: {str(e)}")
+
+
+@router.get("/groups/{group_id}/chore-templates", response_model=List[ChoreTemplate])
+async def get_chore_templates_endpoint(group_id: int):
+    """
+    Get the recurring chores of a group
+    """
+    try:
+        return get_chore_templates(group_id)
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching recurring chores: {str(e)}")
+
+
+@router.delete("/chore-templates/{template_id}", status_code=200)
+async def delete_chore_template_endpoint(template_id: int):
+    """
+    Stop a recurring chore, removing its upcoming occurrences nobody has completed
+    """
+    try:
+        removed = delete_chore_template(template_id)
+        
+        if removed is None:
+            raise HTTPException(status_code=404, detail=f"Recurring chore {template_id} not found")
+        
+        return {
+            "message": f"Recurring chore {template_id} deleted successfully",
+            "upcoming_chores_removed": removed
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error deleting recurring chore: {str(e)}")
@@ -1,7 +1,9 @@
 # backend/app/event_routes.py
 
-from fastapi import APIRouter, HTTPException, Depends
-from datetime import datetime
+import logging
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import JSONResponse
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 
 from backend.app.auth_routes import get_current_user_from_token
@@ -9,25 +11,90 @@ from backend.db.event_queries import (
     create_event,
     get_events_for_profile,
     delete_event,
-    get_events_for_group_members,
+    delete_events,
+    get_group_calendar,
+    decode_calendar_cursor,
+    DEFAULT_GROUP_CALENDAR_PAGE,
+    MAX_GROUP_CALENDAR_PAGE,
+    get_member_busy_intervals,
+    get_events_with_participants,
 )
-from backend.db.pydanticmodels import EventCreate
+from backend.db.intervals import merge_intervals, free_slots, overlapping_pairs
+from backend.db.pydanticmodels import EventCreate, EventBulkDelete
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Longest window accepted by the free/busy and conflict endpoints
+MAX_WINDOW_DAYS = 366
+
+
+def _parse_utc(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, treating naive values as UTC"""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _format_utc(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _parse_window(start: str, end: str):
+    """Parse and validate a start/end query window, raising 400s"""
+    try:
+        start_dt = _parse_utc(start)
+        end_dt = _parse_utc(end)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="start and end must be ISO 8601 timestamps")
+
+    if end_dt <= start_dt:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if end_dt - start_dt > timedelta(days=MAX_WINDOW_DAYS):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Window cannot be longer than {MAX_WINDOW_DAYS} days",
+        )
+    return start_dt, end_dt
+
+
+def _group_member_ids(group_id: int, profile_id: int) -> List[int]:
+    """Member ids of a group, raising 403 unless profile_id is one of them"""
+    from backend.db.connection import get_connection
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            "SELECT profile_id FROM groupprofile WHERE group_id = %s",
+            (group_id,),
+        )
+        member_ids = sorted(row['profile_id'] for row in cursor.fetchall())
+    finally:
+        cursor.close()
+        conn.close()
+
+    if profile_id not in member_ids:
+        raise HTTPException(status_code=403, detail="Not a member of this group")
+    return member_ids
+
 
 @router.post("/events", status_code=201)
 async def create_event_endpoint(
     event: EventCreate,
+    check_conflicts: bool = False,
     user_id: str = Depends(get_current_user_from_token),
 ):
-    """Create a new event"""
-    print("=" * 80)
-    print("📝 CREATE EVENT REQUEST")
-    print(f"   User ID: {user_id}")
-    print(f"   Event Name: {event.event_name}")
-    print(f"   Group ID: {event.group_id}")
-    print("=" * 80)
+    """
+    Create a new event. With check_conflicts=true the response also lists
+    existing events that overlap it in the same group or for any participant.
+    """
+    logger.debug(
+        "Create event request: user=%s name=%r group=%s",
+        user_id, event.event_name, event.group_id,
+    )
 
     try:
         profile_ids: List[int] = [int(user_id)]
@@ -46,35 +113,38 @@ async def create_event_endpoint(
                     (event.group_id,),
                 )
                 group_members = cursor.fetchall()
-                
+
                 # Handle both tuple and dict results (RealDictRow)
                 if group_members and isinstance(group_members[0], dict):
                     all_profile_ids = [row['profile_id'] for row in group_members]
                 else:
                     all_profile_ids = [row[0] for row in group_members]
-                
+
                 profile_ids = list(set([int(user_id)] + all_profile_ids))
-                print(f"👥 Group members: {all_profile_ids}")
-                print(f"📋 All profile IDs for event: {profile_ids}")
+                logger.debug("Event participants for group %s: %s", event.group_id, profile_ids)
             finally:
                 cursor.close()
                 conn.close()
 
-        print(f"💾 Creating event with group_id: {event.group_id}")
-        event_id = create_event(event=event, profile_ids=profile_ids)
+        created = create_event(
+            event=event,
+            profile_ids=profile_ids,
+            check_conflicts=check_conflicts,
+        )
+        event_id = created["event_id"]
 
-        print(f"✅ Event created with ID: {event_id}")
+        logger.info("Created event %s for group %s", event_id, event.group_id)
 
-        return {
+        response = {
             "event_id": event_id,
             "group_id": event.group_id,
             "message": "Event created successfully",
         }
+        if check_conflicts:
+            response["conflicts"] = created["conflicts"]
+        return response
     except Exception as e:
-        print(f"❌ Error creating event: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("Error creating event: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -98,9 +168,11 @@ async def get_user_events(
         )
 
         events = get_events_for_profile(int(user_id), start_dt, end_dt)
-        return events
+        # Rows are already JSON-ready (times rendered as strings), so skip
+        # FastAPI's per-value encoding pass
+        return JSONResponse(events)
     except Exception as e:
-        print(f"Error getting user events: {e}")
+        logger.error("Error getting user events: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -110,107 +182,231 @@ async def get_group_events(
     start: str,
     end: str,
     profile_id: int,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_GROUP_CALENDAR_PAGE),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
 ):
-    """Get all events for a specific group (only that group's events)"""
-    print("=" * 80, flush=True)
-    print("🔍 GET GROUP EVENTS REQUEST:", flush=True)
-    print(f"   group_id: {group_id}", flush=True)
-    print(f"   profile_id: {profile_id}", flush=True)
-    print(f"   start: {start}", flush=True)
-    print(f"   end: {end}", flush=True)
-    print("=" * 80, flush=True)
-
-    try:
-        start_dt = datetime.fromisoformat(start.replace("Z", "+00:00"))
-        end_dt = datetime.fromisoformat(end.replace("Z", "+00:00"))
-
-        print("📅 Parsed dates:", flush=True)
-        print(f"   start_dt: {start_dt}", flush=True)
-        print(f"   end_dt: {end_dt}", flush=True)
-
-        # ✅ Verify the user is in this group
-        from backend.db.connection import get_connection
-
-        conn = get_connection()
-        cursor = conn.cursor()
+    """
+    Events of a group overlapping a window, each once with all of its
+    participants. Every event is returned unless a limit is given; then
+    the X-Next-Cursor response header holds the cursor for the next page
+    while more events follow.
+    """
+    logger.debug(
+        "Get group events request: group=%s profile=%s start=%s end=%s cursor=%s",
+        group_id, profile_id, start, end, cursor,
+    )
+    start_dt, end_dt = _parse_window(start, end)
+    after = None
+    if cursor:
         try:
-            cursor.execute(
-                """
-                SELECT profile_id FROM groupprofile
-                WHERE group_id = %s AND profile_id = %s
-                """,
-                (group_id, profile_id),
-            )
+            after = decode_calendar_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
 
-            if not cursor.fetchone():
-                print(
-                    f"❌ User {profile_id} not in group {group_id}",
-                    flush=True,
-                )
-                raise HTTPException(
-                    status_code=403, detail="Not a member of this group"
-                )
-
-            print(
-                f"✅ User {profile_id} is member of group {group_id}",
-                flush=True,
-            )
-        finally:
-            cursor.close()
-            conn.close()
-
-        # ✅ Get ALL events for this profile, then filter by group_id
-        print("🔍 Fetching events for profile (all groups)...", flush=True)
-        all_events = get_events_for_profile(profile_id, start_dt, end_dt)
-        print(f"📦 Got {len(all_events)} events for profile {profile_id}", flush=True)
-
-        # 🔒 Only keep events that belong to this group
-        group_events = [
-            ev
-            for ev in all_events
-            if ev.get("group_id") == group_id
-        ]
+    try:
+        _group_member_ids(group_id, profile_id)
 
-        print(f"📤 Returning {len(group_events)} events for group {group_id}", flush=True)
-        for ev in group_events:
-            print(f"   Event {ev['event_id']} → group_id={ev.get('group_id')}", flush=True)
+        if after is not None and limit is None:
+            limit = DEFAULT_GROUP_CALENDAR_PAGE
+        group_events, next_cursor = get_group_calendar(
+            group_id, start_dt, end_dt, profile_id=profile_id, limit=limit, after=after,
+        )
+        logger.debug("Returning %d events for group %s", len(group_events), group_id)
 
-        return group_events
+        headers = {}
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+        return JSONResponse(group_events, headers=headers)
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error getting group events: {e}", flush=True)
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("Error getting group events: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+
 @router.delete("/events/{event_id}", status_code=200)
 async def delete_event_endpoint(
     event_id: int,
     user_id: str = Depends(get_current_user_from_token),
 ):
     """Delete an event"""
-    print("=" * 80)
-    print(f"🔥 DELETE ENDPOINT HIT - event_id: {event_id}, user_id: {user_id}")
-    print("=" * 80)
+    logger.debug("Delete event request: event=%s user=%s", event_id, user_id)
 
     try:
         success = delete_event(event_id)
 
         if not success:
-            print(f"❌ Delete failed for event {event_id}")
             raise HTTPException(status_code=404, detail="Event not found")
 
-        print(f"✅ Successfully deleted event {event_id}")
+        logger.info("Deleted event %s", event_id)
         return {"message": "Event deleted successfully"}
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Exception while deleting event {event_id}: {e}")
-        import traceback
+        logger.exception("Exception while deleting event %s: %s", event_id, e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/events/bulk-delete")
+async def bulk_delete_events_endpoint(
+    request: EventBulkDelete,
+    user_id: str = Depends(get_current_user_from_token),
+):
+    """
+    Delete many events in one transaction: either the given event_ids, or
+    every event of group_id starting within [start, end). Events the user
+    cannot see are skipped.
+    """
+    profile_id = int(user_id)
+    logger.debug(
+        "Bulk delete request: ids=%s group=%s user=%s",
+        len(request.event_ids) if request.event_ids is not None else None,
+        request.group_id, user_id,
+    )
+
+    if (request.event_ids is None) == (request.group_id is None):
+        raise HTTPException(status_code=400, detail="Provide either event_ids or group_id")
+
+    try:
+        if request.event_ids is not None:
+            result = delete_events(profile_id, event_ids=request.event_ids)
+            result["not_deleted"] = sorted(set(request.event_ids) - set(result["event_ids"]))
+        else:
+            if request.start is None or request.end is None:
+                raise HTTPException(status_code=400, detail="start and end are required with group_id")
+            start_dt, end_dt = _parse_window(request.start.isoformat(), request.end.isoformat())
+            _group_member_ids(request.group_id, profile_id)
+            result = delete_events(
+                profile_id, group_id=request.group_id, start_date=start_dt, end_date=end_dt,
+            )
 
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        logger.info(
+            "Bulk deleted %d events for user %s", result["events_deleted"], user_id,
+        )
+        return result
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Exception while bulk deleting events: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/groups/{group_id}/freebusy")
+async def get_group_freebusy(
+    group_id: int,
+    start: str,
+    end: str,
+    profile_id: int,
+    min_duration: int = Query(30, ge=0, description="Shortest free slot to return, in minutes"),
+):
+    """
+    Busy blocks across all members of a group within a window, and the free
+    slots when every member is available
+    """
+    start_dt, end_dt = _parse_window(start, end)
+
+    try:
+        member_ids = _group_member_ids(group_id, profile_id)
+
+        busy = merge_intervals(get_member_busy_intervals(group_id, start_dt, end_dt))
+        free = free_slots(busy, start_dt, end_dt, timedelta(minutes=min_duration))
+
+        logger.debug(
+            "Free/busy for group %s: %d busy blocks, %d free slots",
+            group_id, len(busy), len(free),
+        )
+
+        return {
+            "group_id": group_id,
+            "start": _format_utc(start_dt),
+            "end": _format_utc(end_dt),
+            "member_ids": member_ids,
+            "busy": [
+                {
+                    "start": _format_utc(block.start),
+                    "end": _format_utc(block.end),
+                    "profile_ids": block.keys,
+                }
+                for block in busy
+            ],
+            "free": [
+                {"start": _format_utc(slot.start), "end": _format_utc(slot.end)}
+                for slot in free
+            ],
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error computing free/busy for group %s: %s", group_id, e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/groups/{group_id}/conflicts")
+async def get_group_conflicts(
+    group_id: int,
+    start: str,
+    end: str,
+    profile_id: int,
+):
+    """
+    Report every pair of overlapping events within a window that involves
+    this group: both in the group, or sharing a participant where at least
+    one of them is a group event
+    """
+    start_dt, end_dt = _parse_window(start, end)
+
+    try:
+        _group_member_ids(group_id, profile_id)
+
+        events = get_events_with_participants(group_id, start_dt, end_dt)
+        by_id = {ev["event_id"]: ev for ev in events}
+        pairs = overlapping_pairs([
+            (ev["event_datetime_start"], ev["event_datetime_end"], ev["event_id"])
+            for ev in events
+        ])
+
+        conflicts = []
+        for first_id, second_id in pairs:
+            first, second = by_id[first_id], by_id[second_id]
+            if first["group_id"] != group_id and second["group_id"] != group_id:
+                continue
+            same_group = first["group_id"] == second["group_id"]
+            shared = sorted(set(first["profile_ids"]) & set(second["profile_ids"]))
+            if not same_group and not shared:
+                continue
+            conflicts.append({
+                "events": [
+                    {
+                        "event_id": ev["event_id"],
+                        "event_name": ev["event_name"],
+                        "event_datetime_start": _format_utc(ev["event_datetime_start"]),
+                        "event_datetime_end": _format_utc(ev["event_datetime_end"]),
+                        "group_id": ev["group_id"],
+                    }
+                    for ev in (first, second)
+                ],
+                "same_group": same_group,
+                "shared_profile_ids": shared,
+            })
+
+        logger.debug(
+            "Conflict report for group %s: %d events, %d conflicts",
+            group_id, len(events), len(conflicts),
+        )
+
+        return {
+            "group_id": group_id,
+            "start": _format_utc(start_dt),
+            "end": _format_utc(end_dt),
+            "conflicts": conflicts,
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error building conflict report for group %s: %s", group_id, e)
+        raise HTTPException(status_code=500, detail=str(e))
@@ -2,6 +2,8 @@ from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 from backend.db.pydanticmodels import *
 from backend.db.expense_queries import *
+from backend.db.recurring_expense_calendar import get_calendar_outbox_status, retry_calendar_outbox
+from backend.app.background import wake_task
 
 router = APIRouter(prefix="/api/expenses", tags=["expenses"])
 
@@ -25,6 +27,32 @@ async def get_group_lists(group_id: int):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# =========================================================
+# CALENDAR SYNC
+# =========================================================
+
+@router.get("/calendar-sync")
+async def get_calendar_sync_status(limit: int = Query(50, ge=1, le=500)):
+    """
+    Debugging view of the expense-to-calendar outbox: queued and dead
+    rows, and the rows that failed most recently with their errors
+    """
+    try:
+        return get_calendar_outbox_status(limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/calendar-sync/retry")
+async def retry_calendar_sync(retry: Optional[CalendarSyncRetry] = None):
+    """Requeue dead calendar outbox rows so their calendar events are synced again"""
+    try:
+        requeued = retry_calendar_outbox(retry.outbox_ids if retry else None)
+        if requeued:
+            wake_task('calendar_outbox')
+        return {"message": f"Requeued {requeued} row(s)", "requeued": requeued}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 # =========================================================
 # EXPENSE ITEMS
 # =========================================================
@@ -35,7 +63,10 @@ async def create_expense(expense: ExpenseItemCreate):
     try:
         expense_data = expense.dict(exclude={'splits'})
         splits_data = [split.dict() for split in expense.splits]
-        return create_expense_item(expense_data, splits_data)
+        created = create_expense_item(expense_data, splits_data)
+        if created.get('is_recurring'):
+            wake_task('calendar_outbox')
+        return created
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -72,6 +103,7 @@ async def delete_expense_route(item_id: int):
         success = delete_expense(item_id)
         if not success:
             raise HTTPException(status_code=404, detail="Expense not found")
+        wake_task('calendar_outbox')
         return {"message": "Expense deleted successfully"}
     except HTTPException:
         raise
@@ -433,52 +433,3 @@ async def leave_group(id: int, profile_id: int):
     finally:
         cur.close()
         conn.close()
-
-@router.get("/groups/{group_id}/events")
-async def get_group_events(
-    group_id: int,
-    start: str,
-    end: str,
-    profile_id: int
-):
-    """Get all events for members of a specific group"""
-    conn = get_connection()
-    cur = conn.cursor(cursor_factory=RealDictCursor)
-    
-    try:
-        # First verify that the requesting user is a member of this group
-        cur.execute("""
-            SELECT profile_id FROM groupprofile
-            WHERE group_id = %s AND profile_id = %s
-        """, (group_id, profile_id))
-        
-        membership = cur.fetchone()
-        if not membership:
-            raise HTTPException(status_code=403, detail="Not a member of this group")
-        
-        # Get all events for group members within the date range
-        cur.execute("""
-            SELECT DISTINCT e.event_id,
-                   e.event_name,
-                   e.event_datetime_start,
-                   e.event_datetime_end,
-                   e.event_location,
-                   e.event_notes,
-                   pe.profile_id,
-                   e.group_id
-            FROM Event e
-            JOIN ProfileEvent pe ON e.event_id = pe.event_id
-            WHERE e.group_id = %s
-              AND e.event_datetime_start BETWEEN %s AND %s
-            ORDER BY e.event_datetime_start
-        """, (group_id, start, end))
-        
-        events = cur.fetchall()
-        return events
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        cur.close()
-        conn.close()
\ No newline at end of file
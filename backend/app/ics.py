@@ -0,0 +1,92 @@
+"""
+Minimal iCalendar (RFC 5545) rendering for calendar feeds.
+
+render_calendar() is a generator yielding one text chunk per component so
+feeds can be streamed as they are read from the database.
+"""
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
+
+PRODID = "-//HomeBase//Calendar Feed//EN"
+
+# Content lines longer than this many octets must be folded
+MAX_LINE_OCTETS = 75
+
+
+def escape_text(value: str) -> str:
+    """Escape a TEXT property value"""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """Fold a content line at 75 octets without splitting UTF-8 sequences"""
+    if len(line.encode("utf-8")) <= MAX_LINE_OCTETS:
+        return line + "\r\n"
+
+    parts, current, size = [], [], 0
+    for ch in line:
+        ch_size = len(ch.encode("utf-8"))
+        # Continuation lines start with a space, which counts toward the limit
+        limit = MAX_LINE_OCTETS if not parts else MAX_LINE_OCTETS - 1
+        if size + ch_size > limit:
+            parts.append("".join(current))
+            current, size = [], 0
+        current.append(ch)
+        size += ch_size
+    parts.append("".join(current))
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def format_datetime(value: datetime) -> str:
+    """UTC DATE-TIME value; naive datetimes are taken to be UTC"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def render_event(event: dict, stamp: str) -> str:
+    """
+    Render one VEVENT from a dict with uid, summary, start and optional
+    end, description, location, rrule and exdates
+    """
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{event['uid']}",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART:{format_datetime(event['start'])}",
+    ]
+    if event.get("end") and event["end"] > event["start"]:
+        lines.append(f"DTEND:{format_datetime(event['end'])}")
+    if event.get("rrule"):
+        lines.append(f"RRULE:{event['rrule']}")
+        if event.get("exdates"):
+            lines.append("EXDATE:" + ",".join(format_datetime(d) for d in event["exdates"]))
+    lines.append(f"SUMMARY:{escape_text(event['summary'])}")
+    if event.get("description"):
+        lines.append(f"DESCRIPTION:{escape_text(event['description'])}")
+    if event.get("location"):
+        lines.append(f"LOCATION:{escape_text(event['location'])}")
+    lines.append("END:VEVENT")
+    return "".join(fold_line(line) for line in lines)
+
+
+def render_calendar(name: str, events: Iterable[dict]) -> Iterator[str]:
+    """Yield a VCALENDAR header, one chunk per event, then the footer"""
+    stamp = format_datetime(datetime.now(timezone.utc))
+    yield "".join(fold_line(line) for line in (
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+    ))
+    for event in events:
+        yield render_event(event, stamp)
+    yield "END:VCALENDAR\r\n"
@@ -1,7 +1,10 @@
+import logging
 import bcrypt
 from jose import jwt
 from datetime import datetime, timedelta
 
+logger = logging.getLogger(__name__)
+
 # These should be moved to environment variables in production
 SECRET_KEY = "secret-key-change-this-later"
 ALGORITHM = "HS256"
@@ -28,7 +31,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return bcrypt.checkpw(plain_password, hashed_password)
     except Exception as e:
         # Log the error but don't expose it to user
-        print(f"Password verification error: {e}")
+        logger.warning("Password verification error: %s", e)
         # Return False to indicate password doesn't match (security best practice)
         return False
 
@@ -42,11 +45,37 @@ def decode_token(token: str):
     """Decode and verify a JWT token"""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        # Scoped tokens (e.g. calendar feeds) are not valid for the API
+        if payload.get("scope"):
+            return None
         user_id = payload.get("sub")
         return user_id
     except:
         return None
 
+def create_feed_token(profile_id: int, version: int) -> str:
+    """
+    Long-lived token for calendar feed URLs. Calendar apps can't send an
+    Authorization header, so the token goes in the subscription URL and
+    only grants read access to that profile's feeds. It is only accepted
+    while `version` matches the profile's feed_token_version, so rotating
+    that revokes the token.
+    """
+    data = {"sub": str(profile_id), "scope": "calendar_feed", "ver": version}
+    return jwt.encode(data, SECRET_KEY, algorithm=ALGORITHM)
+
+def decode_feed_token(token: str):
+    """
+    Return (profile id, feed token version) of a calendar feed token, or
+    None if invalid. Tokens issued before versioning count as version 1.
+    """
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        if payload.get("scope") != "calendar_feed":
+            return None
+        return int(payload.get("sub")), int(payload.get("ver", 1))
+    except Exception:
+        return None
 
 if __name__ == "__main__":
     print("=== Testing Password Hashing ===")
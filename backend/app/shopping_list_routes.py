@@ -1,9 +1,13 @@
 import logging
+from typing import List
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import JSONResponse
+from psycopg2.extensions import cursor as TupleCursor
 from psycopg2.extras import RealDictCursor
 from psycopg2 import Error as PsycopgError
+from psycopg2.errors import ForeignKeyViolation
 from backend.db.connection import get_connection
-from backend.db.pydanticmodels import ShoppingList, ListItem, CreateShoppingList, ShoppingListWithItems, AddItem, UpdateItem
+from backend.db.pydanticmodels import ShoppingList, ListItem, CreateShoppingList, ShoppingListWithItems, AddItem, AddItems, UpdateItem, MarkItemsBought
 from backend.app.auth_routes import get_current_user_from_token
 
 logger = logging.getLogger(__name__)
@@ -61,10 +65,10 @@ async def get_recent_lists(
             ]
             
     except PsycopgError as e:
-        logger.error(f"Database error fetching recent lists: {e}")
+        logger.error("Database error fetching recent lists: %s", e)
         raise HTTPException(status_code=500, detail="Database error occurred")
     except Exception as e:
-        logger.error(f"Unexpected error fetching recent lists: {e}")
+        logger.error("Unexpected error fetching recent lists: %s", e)
         raise HTTPException(status_code=500, detail="An unexpected error occurred")
 
 # POST /api/groups/:id/lists
@@ -93,18 +97,18 @@ async def create_shopping_list(
             
             conn.commit()
             row = cur.fetchone()
-            logger.info(f"Created shopping list {row['list_id']} for group {group_id}")
+            logger.info("Created shopping list %s for group %s", row['list_id'], group_id)
             return ShoppingList(**row)
             
     except HTTPException:
         raise
     except PsycopgError as e:
         conn.rollback()
-        logger.error(f"Database error creating shopping list: {e}")
+        logger.error("Database error creating shopping list: %s", e)
         raise HTTPException(status_code=500, detail="Database error occurred")
     except Exception as e:
         conn.rollback()
-        logger.error(f"Unexpected error creating shopping list: {e}")
+        logger.error("Unexpected error creating shopping list: %s", e)
         raise HTTPException(status_code=500, detail="An unexpected error occurred")
 
 # GET /api/groups/:id/lists
@@ -124,65 +128,74 @@ async def get_lists(group_id: int, conn = Depends(get_db)):
             return [ShoppingList(**row) for row in rows]
             
     except PsycopgError as e:
-        logger.error(f"Database error fetching lists: {e}")
+        logger.error("Database error fetching lists: %s", e)
         raise HTTPException(status_code=500, detail="Database error occurred")
     except Exception as e:
-        logger.error(f"Unexpected error fetching lists: {e}")
+        logger.error("Unexpected error fetching lists: %s", e)
         raise HTTPException(status_code=500, detail="An unexpected error occurred")
 
+# Columns of an item in the order fetch_list_with_items selects them
+ITEM_FIELDS = ("item_id", "item_name", "list_id", "item_quantity", "added_by", "date_added", "bought")
+
+def fetch_list_with_items(conn, list_id: int):
+    """
+    A list with all its items, as plain JSON-ready dicts, or None if there
+    is no such list. Rows come from a tuple cursor and each item dict is
+    built once, with no per-item model construction or validation.
+    """
+    with conn.cursor(cursor_factory=TupleCursor) as cur:
+        cur.execute("""
+            SELECT sl.list_name, sl.date_created, sl.date_completed as date_closed, sl.group_id,
+                si.item_id, si.item_name, sl.list_id, si.quantity as item_quantity, si.added_by_id as added_by, si.date_added, si.is_purchased as bought
+            FROM "shopping_list" sl
+            LEFT JOIN "shopping_item" si ON sl.list_id = si.list_id
+            WHERE sl.list_id = %s
+            ORDER BY si.item_name DESC
+        """, (list_id,))
+
+        rows = cur.fetchall()
+
+    if not rows:
+        return None
+
+    list_name, date_created, date_closed, group_id = rows[0][:4]
+    items = []
+    if rows[0][4] is not None:
+        for row in rows:
+            item = dict(zip(ITEM_FIELDS, row[4:]))
+            if item['date_added']:
+                item['date_added'] = item['date_added'].isoformat()
+            items.append(item)
+
+    return {
+        'list_id': list_id,
+        'list_name': list_name,
+        'date_created': date_created.isoformat() if date_created else None,
+        'date_closed': date_closed.isoformat() if date_closed else None,
+        'group_id': group_id,
+        'items': items
+    }
+
 # GET /api/lists/:id
 @router.get("/lists/{list_id}", response_model=ShoppingListWithItems)
 async def get_list_with_items(list_id: int, conn = Depends(get_db)):
     """Get a single list with all its items"""
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute("""
-                SELECT sl.list_id, sl.list_name, sl.date_created, sl.date_completed as date_closed, sl.group_id,
-                    si.item_id, si.item_name, si.quantity as item_quantity, si.added_by_id as added_by, si.date_added, si.is_purchased as bought
-                FROM "shopping_list" sl
-                LEFT JOIN "shopping_item" si ON sl.list_id = si.list_id
-                WHERE sl.list_id = %s
-                ORDER BY si.item_name DESC
-            """, (list_id,))
-            
-            rows = cur.fetchall()
-            
-            if not rows:
-                raise HTTPException(status_code=404, detail="List not found")
-            
-            # Get list info
-            first_row = rows[0]
-            shopping_list = {
-                'list_id': first_row['list_id'],
-                'list_name': first_row['list_name'],
-                'date_created': first_row['date_created'],
-                'date_closed': first_row['date_closed'],
-                'group_id': first_row['group_id'],
-                'items': []
-            }
-            
-            # Build items list (skip if item_id is None)
-            for row in rows:
-                if row['item_id']:
-                    shopping_list['items'].append(ListItem(
-                        item_id=row['item_id'],
-                        item_name=row['item_name'],
-                        list_id=row['list_id'],
-                        item_quantity=row['item_quantity'],
-                        added_by=row['added_by'],
-                        date_added=row['date_added'],
-                        bought=row['bought']
-                    ))
-            
-            return ShoppingListWithItems(**shopping_list)
+        shopping_list = fetch_list_with_items(conn, list_id)
+
+        if shopping_list is None:
+            raise HTTPException(status_code=404, detail="List not found")
+
+        # Already JSON-ready; skip re-validating every item against response_model
+        return JSONResponse(shopping_list)
             
     except HTTPException:
         raise
     except PsycopgError as e:
-        logger.error(f"Database error fetching list with items: {e}")
+        logger.error("Database error fetching list with items: %s", e)
         raise HTTPException(status_code=500, detail="Database error occurred")
     except Exception as e:
-        logger.error(f"Unexpected error fetching list with items: {e}")
+        logger.error("Unexpected error fetching list with items: %s", e)
         raise HTTPException(status_code=500, detail="An unexpected error occurred")
 
 # POST /api/lists/:id/items
@@ -211,18 +224,97 @@ async def add_item_to_list(
             
             conn.commit()
             row = cur.fetchone()
-            logger.info(f"Added item {row['item_id']} to list {list_id}")
+            logger.info("Added item %s to list %s", row['item_id'], list_id)
             return ListItem(**row)
             
     except HTTPException:
         raise
     except PsycopgError as e:
         conn.rollback()
-        logger.error(f"Database error adding item: {e}")
+        logger.error("Database error adding item: %s", e)
         raise HTTPException(status_code=500, detail="Database error occurred")
     except Exception as e:
         conn.rollback()
-        logger.error(f"Unexpected error adding item: {e}")
+        logger.error("Unexpected error adding item: %s", e)
+        raise HTTPException(status_code=500, detail="An unexpected error occurred")
+
+# Foreign key from shopping_item to its list, as named in 0001_baseline.sql
+SHOPPING_ITEM_LIST_FK = "shopping_item_list_id_fkey"
+
+def unknown_profiles(conn, profile_ids: List[int]) -> List[int]:
+    """
+    The ids among profile_ids with no profile, for reporting a failed
+    insert. Returns an empty list if the lookup itself fails.
+    """
+    profile_ids = sorted(set(profile_ids))
+    try:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("""
+                SELECT profile_id FROM "profile" WHERE profile_id = ANY(%s)
+            """, (profile_ids,))
+            existing = {row['profile_id'] for row in cur.fetchall()}
+        conn.rollback()
+    except PsycopgError as e:
+        logger.error("Database error looking up profiles: %s", e)
+        if not conn.closed:
+            conn.rollback()
+        return []
+    return [profile_id for profile_id in profile_ids if profile_id not in existing]
+
+# POST /api/lists/:id/items/batch
+@router.post("/lists/{list_id}/items/batch", response_model=List[ListItem], status_code=201)
+async def add_items_to_list(
+    list_id: int,
+    add_items: AddItems,
+    conn = Depends(get_db)
+):
+    """Add many items to a shopping list at once, e.g. from a pasted recipe"""
+    try:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            # One statement; joining the list inserts nothing if it doesn't exist
+            cur.execute("""
+                INSERT INTO "shopping_item" (item_name, list_id, quantity, added_by_id, date_added, is_purchased)
+                SELECT i.item_name, sl.list_id, i.quantity, i.added_by_id, NOW(), FALSE
+                FROM "shopping_list" sl
+                CROSS JOIN unnest(%s::varchar[], %s::int[], %s::int[]) WITH ORDINALITY
+                    AS i(item_name, quantity, added_by_id, position)
+                WHERE sl.list_id = %s
+                ORDER BY i.position
+                RETURNING item_id, item_name, list_id, quantity as item_quantity, added_by_id as added_by, date_added, is_purchased as bought
+            """, (
+                [item.item_name for item in add_items.items],
+                [item.item_quantity for item in add_items.items],
+                [item.added_by for item in add_items.items],
+                list_id
+            ))
+
+            rows = cur.fetchall()
+            if not rows:
+                conn.rollback()
+                raise HTTPException(status_code=404, detail="List not found")
+
+            conn.commit()
+            logger.info("Added %d items to list %s", len(rows), list_id)
+            return sorted(rows, key=lambda row: row['item_id'])
+            
+    except HTTPException:
+        raise
+    except ForeignKeyViolation as e:
+        conn.rollback()
+        # The list was deleted between the join and the insert
+        if e.diag.constraint_name == SHOPPING_ITEM_LIST_FK:
+            raise HTTPException(status_code=404, detail="List not found")
+        missing = unknown_profiles(conn, [item.added_by for item in add_items.items])
+        if not missing:
+            raise HTTPException(status_code=400, detail="Unknown profile in added_by")
+        raise HTTPException(status_code=400, detail=f"Profile not found: {', '.join(map(str, missing))}")
+    except PsycopgError as e:
+        conn.rollback()
+        logger.error("Database error adding items: %s", e)
+        raise HTTPException(status_code=500, detail="Database error occurred")
+    except Exception as e:
+        conn.rollback()
+        logger.error("Unexpected error adding items: %s", e)
         raise HTTPException(status_code=500, detail="An unexpected error occurred")
 
 # PUT /api/items/:id
@@ -277,18 +369,65 @@ async def update_item(
             conn.commit()
             
             row = cur.fetchone()
-            logger.info(f"Updated item {item_id}")
+            logger.info("Updated item %s", item_id)
             return ListItem(**row)
             
     except HTTPException:
         raise
     except PsycopgError as e:
         conn.rollback()
-        logger.error(f"Database error updating item: {e}")
+        logger.error("Database error updating item: %s", e)
+        raise HTTPException(status_code=500, detail="Database error occurred")
+    except Exception as e:
+        conn.rollback()
+        logger.error("Unexpected error updating item: %s", e)
+        raise HTTPException(status_code=500, detail="An unexpected error occurred")
+
+# PATCH /api/lists/:id/items/bought
+@router.patch("/lists/{list_id}/items/bought")
+async def mark_items_bought(
+    list_id: int,
+    items_to_mark: MarkItemsBought,
+    conn = Depends(get_db)
+):
+    """Check (or with bought=false, uncheck) many items of a list at once"""
+    try:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("""
+                UPDATE "shopping_item"
+                SET is_purchased = %s
+                WHERE list_id = %s AND item_id = ANY(%s)
+                RETURNING item_id, item_name, list_id, quantity as item_quantity, added_by_id as added_by, date_added, is_purchased as bought
+            """, (items_to_mark.bought, list_id, items_to_mark.item_ids))
+
+            rows = sorted(cur.fetchall(), key=lambda row: row['item_id'])
+            if not rows:
+                cur.execute("""
+                    SELECT list_id FROM "shopping_list" WHERE list_id = %s
+                """, (list_id,))
+                if not cur.fetchone():
+                    conn.rollback()
+                    raise HTTPException(status_code=404, detail="List not found")
+            conn.commit()
+
+            found = {row['item_id'] for row in rows}
+            logger.info("Marked %d items of list %s as %s", len(rows), list_id,
+                        "bought" if items_to_mark.bought else "not bought")
+            return {
+                "message": f"Updated {len(rows)} item(s)",
+                "updated": [ListItem(**row) for row in rows],
+                "not_found": [item_id for item_id in dict.fromkeys(items_to_mark.item_ids) if item_id not in found]
+            }
+            
+    except HTTPException:
+        raise
+    except PsycopgError as e:
+        conn.rollback()
+        logger.error("Database error marking items: %s", e)
         raise HTTPException(status_code=500, detail="Database error occurred")
     except Exception as e:
         conn.rollback()
-        logger.error(f"Unexpected error updating item: {e}")
+        logger.error("Unexpected error marking items: %s", e)
         raise HTTPException(status_code=500, detail="An unexpected error occurred")
 
 # DELETE /api/items/:id
@@ -313,18 +452,18 @@ async def delete_item(item_id: int, conn = Depends(get_db)):
             """, (item_id,))
 
             conn.commit()
-            logger.info(f"Deleted item {item_id}")
+            logger.info("Deleted item %s", item_id)
             return None
             
     except HTTPException:
         raise
     except PsycopgError as e:
         conn.rollback()
-        logger.error(f"Database error deleting item: {e}")
+        logger.error("Database error deleting item: %s", e)
         raise HTTPException(status_code=500, detail="Database error occurred")
     except Exception as e:
         conn.rollback()
-        logger.error(f"Unexpected error deleting item: {e}")
+        logger.error("Unexpected error deleting item: %s", e)
         raise HTTPException(status_code=500, detail="An unexpected error occurred")
 
 # DELETE /api/lists/:id
@@ -349,16 +488,16 @@ async def delete_list(list_id: int, conn = Depends(get_db)):
             """, (list_id,))
 
             conn.commit()
-            logger.info(f"Deleted shopping list {list_id}")
+            logger.info("Deleted shopping list %s", list_id)
             return None
             
     except HTTPException:
         raise
     except PsycopgError as e:
         conn.rollback()
-        logger.error(f"Database error deleting list: {e}")
+        logger.error("Database error deleting list: %s", e)
         raise HTTPException(status_code=500, detail="Database error occurred")
     except Exception as e:
         conn.rollback()
-        logger.error(f"Unexpected error deleting list: {e}")
+        logger.error("Unexpected error deleting list: %s", e)
         raise HTTPException(status_code=500, detail="An unexpected error occurred")
\ No newline at end of file
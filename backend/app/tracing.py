@@ -0,0 +1,71 @@
+import logging
+import os
+
+from fastapi import FastAPI, Request
+from opentelemetry import trace, propagate
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+logger = logging.getLogger(__name__)
+
+tracer = trace.get_tracer("homebase.api")
+
+
+def configure_tracing():
+    """
+    Install an OpenTelemetry tracer provider when an exporter is configured:
+      OTEL_EXPORTER_OTLP_ENDPOINT - send spans to an OTLP/HTTP collector
+      TRACE_FILE                  - append spans as JSON lines to a file
+    With neither set, tracing stays a no-op.
+    Returns True if a provider was installed.
+    """
+    otlp_endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+    trace_file = os.getenv("TRACE_FILE")
+    if not otlp_endpoint and not trace_file:
+        return False
+
+    provider = TracerProvider(
+        resource=Resource.create({
+            "service.name": os.getenv("OTEL_SERVICE_NAME", "homebase-api")
+        })
+    )
+
+    if otlp_endpoint:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        # The exporter reads the endpoint and headers from OTEL_* variables
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+        logger.info("Exporting traces to %s", otlp_endpoint)
+
+    if trace_file:
+        out = open(trace_file, "a", buffering=1)
+        provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter(
+            out=out,
+            formatter=lambda span: span.to_json(indent=None) + "\n",
+        )))
+        logger.info("Writing traces to %s", trace_file)
+
+    trace.set_tracer_provider(provider)
+    return True
+
+
+def instrument_app(app: FastAPI):
+    """Open a server span for every request, named after the matched route"""
+
+    @app.middleware("http")
+    async def trace_request(request: Request, call_next):
+        with tracer.start_as_current_span(
+            f"{request.method} {request.url.path}",
+            context=propagate.extract(request.headers),
+            kind=trace.SpanKind.SERVER,
+        ) as span:
+            response = await call_next(request)
+            if span.is_recording():
+                route = request.scope.get("route")
+                if route is not None:
+                    span.update_name(f"{request.method} {route.path}")
+                    span.set_attribute("http.route", route.path)
+                span.set_attribute("http.request.method", request.method)
+                span.set_attribute("http.response.status_code", response.status_code)
+            return response
@@ -0,0 +1,187 @@
+"""
+Benchmark the balance queries before and after the partial indexes in
+migration 0004.
+
+Seeds a throwaway schema with a large expense history (most splits settled,
+a few expenses soft-deleted, as in a long-running household), runs the
+"owed to me" / "I owe" sums from expense_queries.get_user_balance with
+EXPLAIN (ANALYZE, BUFFERS) at migration 0003 and again after 0004, and
+prints timings, buffer counts and the scan types used.
+
+Usage:
+    python -m backend.benchmarks.balance_indexes [--expenses 500000] [--keep]
+"""
+import argparse
+import json
+import statistics
+import time
+
+from backend.benchmarks.common import drop_schema, reset_schema, use_schema
+from backend.db.connection import get_connection
+from backend.db.migrate import run_migrations
+
+BENCH_SCHEMA = "bench_balances"
+
+QUERIES = {
+    "owed_to_me": """
+        SELECT COALESCE(SUM(s.amount_owed), 0) as total
+        FROM expense_split s
+        JOIN expense_item e ON s.item_id = e.item_id
+        JOIN expense_list el ON e.list_id = el.list_id
+        WHERE e.paid_by_id = %(profile_id)s
+          AND s.profile_id != %(profile_id)s
+          AND s.is_settled = FALSE
+          AND e.is_deleted = FALSE
+    """,
+    "i_owe": """
+        SELECT COALESCE(SUM(s.amount_owed), 0) as total
+        FROM expense_split s
+        JOIN expense_item e ON s.item_id = e.item_id
+        JOIN expense_list el ON e.list_id = el.list_id
+        WHERE s.profile_id = %(profile_id)s
+          AND e.paid_by_id != %(profile_id)s
+          AND s.is_settled = FALSE
+          AND e.is_deleted = FALSE
+    """,
+}
+
+
+def seed(cur, profiles: int, groups: int, expenses: int, settled_ratio: float):
+    """
+    Profiles are spread evenly over groups (profile p is in group
+    (p - 1) % groups + 1), each group has one expense list, and every
+    expense is split between its payer's next three group members.
+    """
+    members = profiles // groups
+    cur.execute("""
+        INSERT INTO profile (profile_name, email, password_hash)
+        SELECT 'Bench ' || i, 'bench' || i || '@example.com', 'x'
+        FROM generate_series(1, %s) i
+    """, (profiles,))
+    cur.execute("""
+        INSERT INTO "Group" (group_name, join_code)
+        SELECT 'Bench group ' || i, 'BENCH' || i FROM generate_series(1, %s) i
+    """, (groups,))
+    cur.execute("""
+        INSERT INTO groupprofile (group_id, profile_id, role)
+        SELECT (p - 1) %% %s + 1, p, 'member' FROM generate_series(1, %s) p
+    """, (groups, profiles))
+    cur.execute("""
+        INSERT INTO expense_list (group_id, list_name)
+        SELECT g, 'Bench expenses' FROM generate_series(1, %s) g
+    """, (groups,))
+    cur.execute("""
+        INSERT INTO expense_item (list_id, item_name, item_total_cost, paid_by_id,
+                                  date_created, is_deleted)
+        SELECT g, 'Expense ' || i, round((random() * 200 + 1)::numeric, 2),
+               g + %(groups)s * floor(random() * %(members)s)::int,
+               NOW() - random() * INTERVAL '3 years',
+               random() < 0.05
+        FROM generate_series(1, %(expenses)s) i,
+             LATERAL (SELECT (i - 1) %% %(groups)s + 1 AS g) grp
+    """, {"groups": groups, "members": members, "expenses": expenses})
+    cur.execute("""
+        INSERT INTO expense_split (item_id, profile_id, amount_owed, is_settled)
+        SELECT e.item_id,
+               el.group_id + %(groups)s * (((e.paid_by_id - el.group_id) / %(groups)s + k) %% %(members)s),
+               round(e.item_total_cost / 4, 2),
+               random() < %(settled)s
+        FROM expense_item e
+        JOIN expense_list el ON e.list_id = el.list_id,
+             generate_series(1, 3) k
+    """, {"groups": groups, "members": members, "settled": settled_ratio})
+
+
+def _scan_types(plan: dict, found: set) -> set:
+    node = plan["Node Type"]
+    if "Index Name" in plan:
+        node += f" using {plan['Index Name']}"
+    if "Scan" in plan["Node Type"]:
+        found.add(node)
+    for child in plan.get("Plans", []):
+        _scan_types(child, found)
+    return found
+
+
+def run_queries(cur, profile_ids, repeat: int) -> dict:
+    results = {}
+    for name, query in QUERIES.items():
+        timings, buffers, heap_fetches, scans = [], [], 0, set()
+        for _ in range(repeat):
+            for profile_id in profile_ids:
+                cur.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + query,
+                            {"profile_id": profile_id})
+                plan = cur.fetchone()["QUERY PLAN"]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                root = plan[0]
+                timings.append(root["Execution Time"])
+                buffers.append(root["Plan"]["Shared Hit Blocks"] + root["Plan"]["Shared Read Blocks"])
+                heap_fetches += _heap_fetches(root["Plan"])
+                _scan_types(root["Plan"], scans)
+        results[name] = {
+            "median_ms": statistics.median(timings),
+            "p95_ms": sorted(timings)[int(len(timings) * 0.95) - 1],
+            "buffers": statistics.median(buffers),
+            "heap_fetches": heap_fetches,
+            "scans": sorted(scans),
+        }
+    return results
+
+
+def _heap_fetches(plan: dict) -> int:
+    return plan.get("Heap Fetches", 0) + sum(_heap_fetches(child) for child in plan.get("Plans", []))
+
+
+def report(label: str, results: dict):
+    print(f"\n{label}")
+    for name, r in results.items():
+        print(f"  {name:11} median {r['median_ms']:8.3f} ms  p95 {r['p95_ms']:8.3f} ms  "
+              f"buffers {r['buffers']:7.0f}  heap fetches {r['heap_fetches']}")
+        for scan in r["scans"]:
+            print(f"  {'':11} {scan}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark balance query indexes")
+    parser.add_argument("--profiles", type=int, default=2000)
+    parser.add_argument("--groups", type=int, default=200)
+    parser.add_argument("--expenses", type=int, default=500_000)
+    parser.add_argument("--settled", type=float, default=0.9, help="fraction of splits already settled")
+    parser.add_argument("--samples", type=int, default=50, help="profiles to query")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--keep", action="store_true", help="keep the benchmark schema afterwards")
+    args = parser.parse_args(argv)
+
+    use_schema(BENCH_SCHEMA)
+    conn = get_connection()
+    conn.autocommit = True
+    cur = conn.cursor()
+    try:
+        reset_schema(cur, BENCH_SCHEMA)
+        run_migrations(target=3)
+
+        start = time.perf_counter()
+        seed(cur, args.profiles, args.groups, args.expenses, args.settled)
+        cur.execute("VACUUM ANALYZE expense_list, expense_item, expense_split")
+        print(f"Seeded {args.expenses} expenses in {time.perf_counter() - start:.1f}s")
+
+        step = max(args.profiles // args.samples, 1)
+        profile_ids = list(range(1, args.profiles + 1, step))[:args.samples]
+
+        report("Before (migration 0003)", run_queries(cur, profile_ids, args.repeat))
+
+        run_migrations(target=4)
+        # Index-only scans need an up-to-date visibility map
+        cur.execute("VACUUM ANALYZE expense_list, expense_item, expense_split")
+
+        report("After (migration 0004)", run_queries(cur, profile_ids, args.repeat))
+    finally:
+        if not args.keep:
+            drop_schema(cur, BENCH_SCHEMA)
+        cur.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""Helpers shared by the benchmark scripts"""
+import os
+
+
+def use_schema(schema: str) -> None:
+    """
+    Point every connection this process opens (including those made by
+    get_connection() inside query functions and migrations) at a
+    throwaway schema. Must be called before the first connection.
+    """
+    os.environ["PGOPTIONS"] = f"{os.getenv('PGOPTIONS', '')} -c search_path={schema}".strip()
+
+
+def reset_schema(cur, schema: str) -> None:
+    cur.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+    cur.execute(f"CREATE SCHEMA {schema}")
+
+
+def drop_schema(cur, schema: str) -> None:
+    cur.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
@@ -0,0 +1,135 @@
+"""
+Benchmark event list serialization on large windows.
+
+Seeds one profile with many events in a throwaway schema, then compares
+the old path (RealDictCursor rows copied into dicts with both datetimes
+strftime'd in Python, then encoded by FastAPI's jsonable_encoder) with
+get_events_for_profile, which renders times in SQL and builds each dict
+once from a tuple cursor, serialized directly with json.dumps as the
+endpoint's JSONResponse does. Reports total and per-row time for the
+query alone and for the full JSON body.
+
+Usage:
+    python -m backend.benchmarks.event_serialization [--events 50000] [--keep]
+"""
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timezone
+
+from fastapi.encoders import jsonable_encoder
+from psycopg2.extras import RealDictCursor
+
+from backend.benchmarks.common import drop_schema, reset_schema, use_schema
+from backend.db.connection import get_connection
+from backend.db.event_queries import get_events_for_profile
+from backend.db.migrate import run_migrations
+
+BENCH_SCHEMA = "bench_events"
+
+WINDOW = (datetime(2025, 1, 1, tzinfo=timezone.utc), datetime(2026, 1, 1, tzinfo=timezone.utc))
+
+
+def seed(cur, events: int) -> int:
+    """Create one profile with `events` one-to-three hour events in WINDOW"""
+    cur.execute("""
+        INSERT INTO profile (profile_name, email, password_hash)
+        VALUES ('Bench', 'bench@example.com', 'x')
+        RETURNING profile_id
+    """)
+    profile_id = cur.fetchone()["profile_id"]
+    cur.execute("""
+        WITH new_events AS (
+            INSERT INTO event (event_name, event_datetime_start, event_datetime_end,
+                               event_location, event_notes)
+            SELECT 'Event ' || i, s, s + (1 + i %% 3) * INTERVAL '1 hour',
+                   'Room ' || i %% 10, 'Notes for event ' || i
+            FROM generate_series(1, %s) i,
+                 LATERAL (SELECT %s::timestamptz + random() * INTERVAL '364 days' AS s) t
+            RETURNING event_id
+        )
+        INSERT INTO profileevent (profile_id, event_id)
+        SELECT %s, event_id FROM new_events
+    """, (events, WINDOW[0], profile_id))
+    cur.execute("VACUUM ANALYZE event, profileevent")
+    return profile_id
+
+
+def legacy_events_for_profile(profile_id: int, start_date, end_date):
+    """The previous implementation: RealDictRow -> dict copy -> strftime"""
+    conn = get_connection()
+    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    try:
+        cursor.execute("""
+            SELECT e.event_id, e.event_name, e.event_datetime_start,
+                   e.event_datetime_end, e.event_location, e.event_notes,
+                   e.group_id, pe.profile_id
+            FROM Event e
+            JOIN ProfileEvent pe ON e.event_id = pe.event_id
+            WHERE pe.profile_id = %s
+              AND e.event_period && tstzrange(%s, %s, '[]')
+            ORDER BY e.event_datetime_start
+        """, (profile_id, start_date, end_date))
+        result = []
+        for event in cursor.fetchall():
+            event_dict = dict(event)
+            if isinstance(event_dict.get("event_datetime_start"), datetime):
+                event_dict["event_datetime_start"] = event_dict[
+                    "event_datetime_start"].strftime("%Y-%m-%dT%H:%M:%SZ")
+            if isinstance(event_dict.get("event_datetime_end"), datetime):
+                event_dict["event_datetime_end"] = event_dict[
+                    "event_datetime_end"].strftime("%Y-%m-%dT%H:%M:%SZ")
+            result.append(event_dict)
+        return result
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def measure(func, encode, profile_id: int, repeat: int):
+    query_times, response_times, rows = [], [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        events = func(profile_id, *WINDOW)
+        query_times.append(time.perf_counter() - start)
+        encode(events)
+        response_times.append(time.perf_counter() - start)
+        rows = len(events)
+    return rows, statistics.median(query_times), statistics.median(response_times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark event list serialization")
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="keep the benchmark schema afterwards")
+    args = parser.parse_args(argv)
+
+    use_schema(BENCH_SCHEMA)
+    conn = get_connection()
+    conn.autocommit = True
+    cur = conn.cursor()
+    try:
+        reset_schema(cur, BENCH_SCHEMA)
+        run_migrations()
+        profile_id = seed(cur, args.events)
+
+        for label, func, encode in (
+            ("legacy (dict copy + strftime)", legacy_events_for_profile,
+             lambda events: json.dumps(jsonable_encoder(events))),
+            ("get_events_for_profile", get_events_for_profile, json.dumps),
+        ):
+            rows, query_s, response_s = measure(func, encode, profile_id, args.repeat)
+            print(f"{label:32} {rows} rows  "
+                  f"query {query_s * 1000:8.1f} ms ({query_s / rows * 1e6:5.2f} us/row)  "
+                  f"with JSON {response_s * 1000:8.1f} ms ({response_s / rows * 1e6:5.2f} us/row)")
+    finally:
+        if not args.keep:
+            drop_schema(cur, BENCH_SCHEMA)
+        cur.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
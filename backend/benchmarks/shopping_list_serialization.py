@@ -0,0 +1,151 @@
+"""
+Benchmark serializing a large shopping list with its items.
+
+Seeds one list with many items in a throwaway schema, then compares the
+old path of GET /api/lists/{list_id} (a ListItem model per row, wrapped
+in ShoppingListWithItems, then validated and serialized again against
+the route's response_model) with fetch_list_with_items, which builds
+each item dict once from a tuple cursor and is encoded with json.dumps
+as the endpoint's JSONResponse does. Reports total and per-item time
+for building the response and for the full JSON body.
+
+Usage:
+    python -m backend.benchmarks.shopping_list_serialization [--items 5000] [--keep]
+"""
+import argparse
+import json
+import statistics
+import time
+
+from pydantic import TypeAdapter
+
+from backend.app.shopping_list_routes import fetch_list_with_items
+from backend.benchmarks.common import drop_schema, reset_schema, use_schema
+from backend.db.connection import get_connection
+from backend.db.migrate import run_migrations
+from backend.db.pydanticmodels import ListItem, ShoppingListWithItems
+
+BENCH_SCHEMA = "bench_shopping"
+
+# What FastAPI does with a returned model when the route has a response_model
+response_adapter = TypeAdapter(ShoppingListWithItems)
+
+
+def seed(cur, items: int) -> int:
+    """Create a group with one list of `items` items"""
+    cur.execute("""
+        INSERT INTO profile (profile_name, email, password_hash)
+        VALUES ('Bench', 'bench@example.com', 'x')
+        RETURNING profile_id
+    """)
+    profile_id = cur.fetchone()["profile_id"]
+    cur.execute("""
+        INSERT INTO "Group" (group_name, join_code)
+        VALUES ('Bench', 'BENCH1')
+        RETURNING group_id
+    """)
+    group_id = cur.fetchone()["group_id"]
+    cur.execute("""
+        INSERT INTO shopping_list (list_name, group_id)
+        VALUES ('Bench', %s)
+        RETURNING list_id
+    """, (group_id,))
+    list_id = cur.fetchone()["list_id"]
+    cur.execute("""
+        INSERT INTO shopping_item (item_name, list_id, quantity, added_by_id, is_purchased)
+        SELECT 'Item ' || i, %s, 1 + i %% 5, %s, i %% 3 = 0
+        FROM generate_series(1, %s) i
+    """, (list_id, profile_id, items))
+    cur.execute("VACUUM ANALYZE shopping_item")
+    return list_id
+
+
+def legacy_list_with_items(conn, list_id: int):
+    """The previous implementation: a ListItem per row, then ShoppingListWithItems"""
+    cur = conn.cursor()
+    try:
+        cur.execute("""
+            SELECT sl.list_id, sl.list_name, sl.date_created, sl.date_completed as date_closed, sl.group_id,
+                si.item_id, si.item_name, si.quantity as item_quantity, si.added_by_id as added_by, si.date_added, si.is_purchased as bought
+            FROM "shopping_list" sl
+            LEFT JOIN "shopping_item" si ON sl.list_id = si.list_id
+            WHERE sl.list_id = %s
+            ORDER BY si.item_name DESC
+        """, (list_id,))
+        rows = cur.fetchall()
+    finally:
+        cur.close()
+
+    first_row = rows[0]
+    shopping_list = {
+        'list_id': first_row['list_id'],
+        'list_name': first_row['list_name'],
+        'date_created': first_row['date_created'],
+        'date_closed': first_row['date_closed'],
+        'group_id': first_row['group_id'],
+        'items': []
+    }
+    for row in rows:
+        if row['item_id']:
+            shopping_list['items'].append(ListItem(
+                item_id=row['item_id'],
+                item_name=row['item_name'],
+                list_id=row['list_id'],
+                item_quantity=row['item_quantity'],
+                added_by=row['added_by'],
+                date_added=row['date_added'],
+                bought=row['bought']
+            ))
+    return ShoppingListWithItems(**shopping_list)
+
+
+def legacy_encode(shopping_list) -> str:
+    validated = response_adapter.validate_python(shopping_list, from_attributes=True)
+    return json.dumps(response_adapter.dump_python(validated, mode="json"))
+
+
+def measure(func, encode, conn, list_id: int, repeat: int):
+    build_times, response_times, items = [], [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        shopping_list = func(conn, list_id)
+        build_times.append(time.perf_counter() - start)
+        body = encode(shopping_list)
+        response_times.append(time.perf_counter() - start)
+        items = len(json.loads(body)["items"])
+    return items, statistics.median(build_times), statistics.median(response_times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark shopping list serialization")
+    parser.add_argument("--items", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--keep", action="store_true", help="keep the benchmark schema afterwards")
+    args = parser.parse_args(argv)
+
+    use_schema(BENCH_SCHEMA)
+    conn = get_connection()
+    conn.autocommit = True
+    cur = conn.cursor()
+    try:
+        reset_schema(cur, BENCH_SCHEMA)
+        run_migrations()
+        list_id = seed(cur, args.items)
+
+        for label, func, encode in (
+            ("legacy (ListItem per row)", legacy_list_with_items, legacy_encode),
+            ("fetch_list_with_items", fetch_list_with_items, json.dumps),
+        ):
+            items, build_s, response_s = measure(func, encode, conn, list_id, args.repeat)
+            print(f"{label:28} {items} items  "
+                  f"build {build_s * 1000:8.1f} ms ({build_s / items * 1e6:5.2f} us/item)  "
+                  f"with JSON {response_s * 1000:8.1f} ms ({response_s / items * 1e6:5.2f} us/item)")
+    finally:
+        if not args.keep:
+            drop_schema(cur, BENCH_SCHEMA)
+        cur.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+In-process cache for values derived from versioned scopes.
+
+Entries are stored with the scope version they were built from (see the
+scope_version table) and only returned while that version is current, so
+there is nothing to invalidate: a write bumps the version and the next
+lookup simply misses.
+"""
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from backend.db.connection import pooled_connection
+from backend.db.tracing import traced
+
+
+class VersionedCache:
+    """Thread-safe LRU mapping key -> (version, value)"""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, version) -> Optional[object]:
+        """Return the value cached for key at exactly this version, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, version, value) -> None:
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@traced
+def get_scope_versions(scope_type: str, scope_ids) -> dict:
+    """
+    Current version of each scope id. Scopes that have never changed are
+    reported as version 0. Runs on a pooled connection, since it is on the
+    path of every cache hit.
+    """
+    scope_ids = list(scope_ids)
+    with pooled_connection() as conn:
+        cur = conn.cursor()
+        try:
+            cur.execute("""
+                SELECT scope_id, version
+                FROM scope_version
+                WHERE scope_type = %s AND scope_id = ANY(%s)
+            """, (scope_type, scope_ids))
+            versions = {scope_id: 0 for scope_id in scope_ids}
+            versions.update({row['scope_id']: row['version'] for row in cur.fetchall()})
+            return versions
+        finally:
+            cur.close()
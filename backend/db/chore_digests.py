@@ -0,0 +1,169 @@
+import logging
+from typing import Dict, Optional
+
+from backend.db.connection import get_connection
+from backend.db.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+
+# ==================== SCANNER ====================
+
+@traced
+def scan_overdue_chores(batch_size: int = 500) -> int:
+    """
+    Add the overdue chores of each assignee who has not completed them to
+    their open digest, in batches of assignments until none are left.
+    Every pending assignment is reported once, however its chore came to
+    be overdue.
+    Returns the number of overdue assignments found.
+    """
+    found = 0
+    while True:
+        batch_found = _scan_batch(batch_size)
+        found += batch_found
+        if batch_found < batch_size:
+            if found:
+                logger.info("Found %d overdue chore assignments", found)
+            return found
+
+
+def _scan_batch(batch_size: int) -> int:
+    """
+    Take the next batch_size pending assignments not yet digested whose
+    chore is past due, fold them into their assignees' digests and mark
+    them digested, in one transaction. The partial index on undigested
+    pending assignments keeps this from reading assignments already
+    reported or completed.
+    Returns the number of assignments digested.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # SKIP LOCKED keeps concurrent scanners from reporting the same
+        # assignments twice
+        cursor.execute("""
+            WITH batch AS (
+                SELECT ca.profile_id, c.chore_id, c.group_id, c.name, c.due_date
+                FROM ChoreAssignee ca
+                JOIN Chore c ON c.chore_id = ca.chore_id
+                WHERE ca.individual_status = 'pending'
+                  AND ca.digested_at IS NULL
+                  AND c.due_date < LOCALTIMESTAMP
+                ORDER BY c.due_date, c.chore_id, ca.profile_id
+                LIMIT %s
+                FOR UPDATE OF ca SKIP LOCKED
+            ), marked AS (
+                UPDATE ChoreAssignee ca
+                SET digested_at = LOCALTIMESTAMP
+                FROM batch b
+                WHERE ca.profile_id = b.profile_id AND ca.chore_id = b.chore_id
+            ), overdue AS (
+                SELECT
+                    profile_id,
+                    jsonb_agg(
+                        jsonb_build_object(
+                            'chore_id', chore_id,
+                            'group_id', group_id,
+                            'name', name,
+                            'due_date', due_date
+                        ) ORDER BY due_date, chore_id
+                    ) AS chores,
+                    count(*) AS overdue_count
+                FROM batch
+                GROUP BY profile_id
+            ), digests AS (
+                INSERT INTO chore_digest AS d (profile_id, chores, overdue_count)
+                SELECT profile_id, chores, overdue_count
+                FROM overdue
+                ORDER BY profile_id  -- consistent lock order between concurrent scans
+                ON CONFLICT (profile_id) WHERE seen_at IS NULL DO UPDATE SET
+                    chores = d.chores || EXCLUDED.chores,
+                    overdue_count = d.overdue_count + EXCLUDED.overdue_count,
+                    updated_at = CURRENT_TIMESTAMP
+                RETURNING profile_id
+            )
+            SELECT
+                (SELECT count(*) FROM batch) AS found,
+                (SELECT count(*) FROM digests) AS digests
+        """, (batch_size,))
+        row = cursor.fetchone()
+
+        conn.commit()
+        if row["found"]:
+            logger.debug("Digested %d overdue assignments into %d digests", row["found"], row["digests"])
+        return row["found"]
+
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+
+# ==================== DIGESTS ====================
+
+@traced
+def get_chore_digest(profile_id: int) -> Optional[Dict]:
+    """
+    Get a profile's open overdue digest, leaving out chores that were
+    completed or unassigned since they were added
+    Returns None if there is no open digest
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("""
+            SELECT
+                d.digest_id,
+                d.profile_id,
+                d.created_at,
+                d.updated_at,
+                COALESCE(
+                    jsonb_agg(e.chore ORDER BY e.ord) FILTER (WHERE ca.chore_id IS NOT NULL),
+                    '[]'
+                ) AS chores
+            FROM chore_digest d
+            LEFT JOIN LATERAL jsonb_array_elements(d.chores) WITH ORDINALITY AS e(chore, ord) ON TRUE
+            LEFT JOIN ChoreAssignee ca
+                   ON ca.chore_id = (e.chore ->> 'chore_id')::int
+                  AND ca.profile_id = d.profile_id
+                  AND ca.individual_status = 'pending'
+            WHERE d.profile_id = %s AND d.seen_at IS NULL
+            GROUP BY d.digest_id
+        """, (profile_id,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+    finally:
+        cursor.close()
+        conn.close()
+
+
+@traced
+def mark_chore_digest_seen(profile_id: int) -> bool:
+    """
+    Close a profile's open digest; chores falling due later start a new one
+    Returns True if there was an open digest
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("""
+            UPDATE chore_digest
+            SET seen_at = CURRENT_TIMESTAMP
+            WHERE profile_id = %s AND seen_at IS NULL
+        """, (profile_id,))
+        conn.commit()
+        return cursor.rowcount > 0
+
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
@@ -0,0 +1,132 @@
+import logging
+from typing import Dict, List
+
+from backend.db.connection import get_connection
+from backend.db.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+WEEKLY_ROLLUP_TASK = "chore_stats_weekly"
+
+
+@traced
+def get_leaderboard(group_id: int, weeks: int = 4) -> List[Dict]:
+    """
+    Completion stats of every member of a group from the chore_stats
+    counters, with totals for each of the last `weeks` closed weeks,
+    most completions first
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("""
+            SELECT
+                gp.profile_id,
+                p.profile_name,
+                COALESCE(s.completed_count, 0) AS completed_count,
+                COALESCE(s.on_time_count, 0) AS on_time_count,
+                COALESCE(s.overdue_count, 0) AS overdue_count,
+                COALESCE(s.current_streak, 0) AS current_streak,
+                COALESCE(s.best_streak, 0) AS best_streak,
+                s.last_completed_at,
+                COALESCE(w.weeks, '[]') AS weeks
+            FROM GroupProfile gp
+            JOIN Profile p ON p.profile_id = gp.profile_id
+            LEFT JOIN chore_stats s
+                   ON s.group_id = gp.group_id AND s.profile_id = gp.profile_id
+            LEFT JOIN LATERAL (
+                SELECT json_agg(
+                           json_build_object(
+                               'week_start', sw.week_start,
+                               'completed_count', sw.completed_count,
+                               'on_time_count', sw.on_time_count,
+                               'overdue_count', sw.overdue_count
+                           ) ORDER BY sw.week_start DESC
+                       ) AS weeks
+                FROM chore_stats_weekly sw
+                WHERE sw.group_id = gp.group_id
+                  AND sw.profile_id = gp.profile_id
+                  AND sw.week_start >= (date_trunc('week', LOCALTIMESTAMP)
+                                        - %(weeks)s * INTERVAL '1 week')::date
+            ) w ON TRUE
+            WHERE gp.group_id = %(group_id)s
+            ORDER BY completed_count DESC, on_time_count DESC, current_streak DESC, gp.profile_id
+        """, {"group_id": group_id, "weeks": weeks})
+        return [dict(row) for row in cursor.fetchall()]
+
+    finally:
+        cursor.close()
+        conn.close()
+
+
+@traced
+def rollup_chore_weeks() -> int:
+    """
+    Roll completions of every week that closed since the last run into
+    chore_stats_weekly. The start of the first week not rolled up yet is
+    kept in task_watermark, so each run only reads new completions.
+    Returns the number of weekly rows written.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # Lock the watermark so concurrent runs don't roll a week up twice
+        cursor.execute("""
+            INSERT INTO task_watermark (task_name, watermark)
+            SELECT %s, COALESCE(date_trunc('week', min(completed_at)),
+                                date_trunc('week', LOCALTIMESTAMP))
+            FROM ChoreAssignee
+            WHERE completed_at IS NOT NULL
+            ON CONFLICT (task_name) DO NOTHING
+        """, (WEEKLY_ROLLUP_TASK,))
+        cursor.execute("""
+            SELECT watermark, date_trunc('week', LOCALTIMESTAMP) AS current_week
+            FROM task_watermark
+            WHERE task_name = %s
+            FOR UPDATE
+        """, (WEEKLY_ROLLUP_TASK,))
+        row = cursor.fetchone()
+        if row["watermark"] >= row["current_week"]:
+            conn.rollback()
+            return 0
+
+        cursor.execute("""
+            INSERT INTO chore_stats_weekly (group_id, week_start, profile_id,
+                                            completed_count, on_time_count, overdue_count)
+            SELECT
+                c.group_id,
+                date_trunc('week', ca.completed_at)::date,
+                ca.profile_id,
+                count(*),
+                count(*) FILTER (WHERE c.due_date IS NULL OR ca.completed_at <= c.due_date),
+                count(*) FILTER (WHERE ca.completed_at > c.due_date)
+            FROM ChoreAssignee ca
+            JOIN Chore c ON c.chore_id = ca.chore_id
+            WHERE ca.completed_at >= %(since)s
+              AND ca.completed_at < %(until)s
+            GROUP BY 1, 2, 3
+            ON CONFLICT (group_id, week_start, profile_id) DO UPDATE SET
+                completed_count = EXCLUDED.completed_count,
+                on_time_count = EXCLUDED.on_time_count,
+                overdue_count = EXCLUDED.overdue_count
+        """, {"since": row["watermark"], "until": row["current_week"]})
+        written = cursor.rowcount
+
+        cursor.execute("""
+            UPDATE task_watermark
+            SET watermark = %s, updated_at = CURRENT_TIMESTAMP
+            WHERE task_name = %s
+        """, (row["current_week"], WEEKLY_ROLLUP_TASK))
+
+        conn.commit()
+        logger.info("Rolled up %d weekly chore stats rows through %s", written, row["current_week"])
+        return written
+
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
@@ -0,0 +1,331 @@
+import logging
+import os
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from backend.db.chores_queries import get_group_workloads
+from backend.db.connection import get_connection
+from backend.db.recurrence import iter_occurrences
+from backend.db.rotation import WorkloadBalancer, random_fair, round_robin
+from backend.db.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+# Occurrences are materialized this many days ahead
+CHORE_HORIZON_DAYS = int(os.getenv("CHORE_HORIZON_DAYS", "28"))
+
+# Safety cap on occurrences materialized per template and run
+MAX_OCCURRENCES_PER_RUN = 500
+
+TEMPLATE_COLUMNS = """
+    template_id, group_id, name, notes, frequency, repeat_interval,
+    starts_on, ends_on, rotation, assignees_per_occurrence, member_ids,
+    effort, materialized_until, is_active, created_at
+"""
+
+# ==================== TEMPLATE CRUD ====================
+
+@traced
+def create_chore_template(group_id: int, name: str, frequency: str, starts_on,
+                          repeat_interval: int = 1, ends_on=None, notes: Optional[str] = None,
+                          rotation: str = "round_robin", assignees_per_occurrence: int = 1,
+                          member_ids: Optional[List[int]] = None, effort: int = 1) -> Dict:
+    """
+    Create a recurring chore template
+    member_ids must belong to the group; empty rotates through everyone
+    Returns the created template
+    """
+    member_ids = list(dict.fromkeys(member_ids or []))
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        if member_ids:
+            cursor.execute("""
+                SELECT array_agg(m) AS outsiders
+                FROM unnest(%s::int[]) AS m
+                WHERE m NOT IN (SELECT profile_id FROM GroupProfile WHERE group_id = %s)
+            """, (member_ids, group_id))
+            outsiders = cursor.fetchone()["outsiders"]
+            if outsiders:
+                raise ValueError(f"Profiles {outsiders} are not members of group {group_id}")
+
+        cursor.execute(f"""
+            INSERT INTO chore_template (group_id, name, notes, frequency, repeat_interval,
+                                        starts_on, ends_on, rotation,
+                                        assignees_per_occurrence, member_ids, effort)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            RETURNING {TEMPLATE_COLUMNS}
+        """, (group_id, name, notes, frequency, repeat_interval, starts_on, ends_on,
+              rotation, assignees_per_occurrence, member_ids, effort))
+
+        template = dict(cursor.fetchone())
+        conn.commit()
+        return template
+
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+
+@traced
+def get_chore_templates(group_id: int) -> List[Dict]:
+    """Get the active chore templates of a group"""
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute(f"""
+            SELECT {TEMPLATE_COLUMNS}
+            FROM chore_template
+            WHERE group_id = %s AND is_active
+            ORDER BY name, template_id
+        """, (group_id,))
+        return [dict(row) for row in cursor.fetchall()]
+
+    finally:
+        cursor.close()
+        conn.close()
+
+
+@traced
+def delete_chore_template(template_id: int) -> Optional[int]:
+    """
+    Delete a template and its upcoming occurrences nobody has completed;
+    past chores are kept, detached from the template.
+    Returns how many upcoming chores were removed, or None if there was
+    no such template
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("""
+            WITH removed AS (
+                DELETE FROM Chore c
+                WHERE c.template_id = %(template_id)s
+                  AND c.due_date >= LOCALTIMESTAMP
+                  AND NOT EXISTS (
+                      SELECT 1 FROM ChoreAssignee ca
+                      WHERE ca.chore_id = c.chore_id AND ca.individual_status = 'completed'
+                  )
+                RETURNING c.chore_id
+            ), deleted AS (
+                DELETE FROM chore_template
+                WHERE template_id = %(template_id)s
+                RETURNING template_id
+            )
+            SELECT
+                (SELECT count(*) FROM deleted) AS templates,
+                (SELECT count(*) FROM removed) AS chores
+        """, {"template_id": template_id})
+
+        row = cursor.fetchone()
+        if not row["templates"]:
+            conn.rollback()
+            return None
+
+        conn.commit()
+        return row["chores"]
+
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+
+# ==================== SCHEDULER ====================
+
+@traced
+def materialize_chore_templates(horizon_days: int = CHORE_HORIZON_DAYS,
+                                batch_size: int = 200) -> int:
+    """
+    Top up every active template's chores to `horizon_days` ahead, in
+    batches of templates until none is left behind.
+    Returns the number of chores created.
+    """
+    created = 0
+    while True:
+        claimed, batch_created = _materialize_batch(timedelta(days=horizon_days), batch_size)
+        created += batch_created
+        if claimed < batch_size:
+            if created:
+                logger.info("Materialized %d recurring chores", created)
+            return created
+
+
+def _materialize_batch(horizon: timedelta, batch_size: int):
+    """
+    Claim up to batch_size templates whose materialized horizon has fallen
+    below half of `horizon`, assign their occurrences up to the full
+    horizon and insert them with one statement, in one transaction.
+    Returns (templates claimed, chores created).
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        # Refilling only once half of the horizon is used up means each
+        # template is touched every horizon/2 rather than on every run
+        cursor.execute("""
+            SELECT t.template_id, t.group_id, t.name, t.notes, t.frequency,
+                   t.repeat_interval, t.starts_on, t.ends_on, t.rotation,
+                   t.assignees_per_occurrence, t.member_ids, t.rotation_index, t.effort,
+                   t.materialized_until, LOCALTIMESTAMP AS now
+            FROM chore_template t
+            WHERE t.is_active
+              AND (t.materialized_until IS NULL
+                   OR t.materialized_until < LOCALTIMESTAMP + %(half)s)
+              AND (t.ends_on IS NULL OR t.materialized_until IS NULL
+                   OR t.materialized_until < t.ends_on)
+            ORDER BY t.materialized_until NULLS FIRST
+            LIMIT %(limit)s
+            FOR UPDATE SKIP LOCKED
+        """, {"half": horizon / 2, "limit": batch_size})
+        templates = cursor.fetchall()
+        if not templates:
+            conn.rollback()
+            return 0, 0
+
+        group_ids = sorted({t["group_id"] for t in templates})
+        members = _group_members(cursor, group_ids)
+        balancers = {
+            group_id: WorkloadBalancer(workloads)
+            for group_id, workloads in get_group_workloads(cursor, group_ids).items()
+        }
+        history = _template_assignment_counts(
+            cursor, [t["template_id"] for t in templates if t["rotation"] == "random_fair"]
+        )
+
+        chores, assignments, progress = [], [], []
+        for template in templates:
+            now = template["now"]
+            until = now + horizon
+            if template["ends_on"] is not None:
+                until = min(until, template["ends_on"])
+            # A new template whose start has passed begins from now rather
+            # than with a backlog of overdue chores
+            after = template["materialized_until"]
+            if after is None and template["starts_on"] < now:
+                after = now
+
+            group_members = members.get(template["group_id"], [])
+            member_set = set(group_members)
+            pool = [m for m in template["member_ids"] if m in member_set] or group_members
+            index = template["rotation_index"]
+            count = template["assignees_per_occurrence"]
+            # Members outside a restricted pool are passed over by the balancer
+            outside_pool = member_set.difference(pool)
+
+            occurrences = iter_occurrences(
+                template["starts_on"], template["frequency"], template["repeat_interval"],
+                after=after, until=until,
+            )
+            for n, due_date in enumerate(occurrences):
+                if n == MAX_OCCURRENCES_PER_RUN:
+                    until = due_date - timedelta(microseconds=1)
+                    break
+                if template["rotation"] == "least_loaded":
+                    picked = balancers[template["group_id"]].assign(
+                        template["effort"], count, exclude=outside_pool
+                    )
+                elif template["rotation"] == "random_fair":
+                    picked = random_fair(pool, history[template["template_id"]], count)
+                else:
+                    picked, index = round_robin(pool, index, count)
+
+                chores.append((template["template_id"], template["group_id"], template["name"],
+                               due_date, template["notes"], template["effort"]))
+                assignments.extend((template["template_id"], due_date, p) for p in picked)
+
+            progress.append((template["template_id"], until, index))
+
+        created = _insert_occurrences(cursor, chores, assignments) if chores else 0
+
+        cursor.execute("""
+            UPDATE chore_template t
+            SET materialized_until = p.until, rotation_index = p.rotation_index
+            FROM unnest(%s::int[], %s::timestamp[], %s::int[])
+                 AS p(template_id, until, rotation_index)
+            WHERE t.template_id = p.template_id
+        """, (
+            [p[0] for p in progress],
+            [p[1] for p in progress],
+            [p[2] for p in progress],
+        ))
+
+        conn.commit()
+        return len(templates), created
+
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def _group_members(cursor, group_ids: List[int]) -> Dict[int, List[int]]:
+    cursor.execute("""
+        SELECT group_id, array_agg(profile_id ORDER BY profile_id) AS member_ids
+        FROM GroupProfile
+        WHERE group_id = ANY(%s)
+        GROUP BY group_id
+    """, (group_ids,))
+    return {row["group_id"]: row["member_ids"] for row in cursor.fetchall()}
+
+
+def _template_assignment_counts(cursor, template_ids: List[int]) -> Dict[int, Dict[int, int]]:
+    """template_id -> {profile_id: occurrences of it assigned so far}"""
+    counts = defaultdict(dict)
+    if not template_ids:
+        return counts
+    cursor.execute("""
+        SELECT c.template_id, ca.profile_id, count(*) AS taken
+        FROM Chore c
+        JOIN ChoreAssignee ca ON ca.chore_id = c.chore_id
+        WHERE c.template_id = ANY(%s)
+        GROUP BY c.template_id, ca.profile_id
+    """, (template_ids,))
+    for row in cursor.fetchall():
+        counts[row["template_id"]][row["profile_id"]] = row["taken"]
+    return counts
+
+
+def _insert_occurrences(cursor, chores: List[tuple], assignments: List[tuple]) -> int:
+    """
+    Insert occurrences and their assignees in one statement. (template_id,
+    due_date) is unique, so occurrences that already exist are skipped
+    along with their assignees.
+    """
+    cursor.execute("""
+        WITH inserted AS (
+            INSERT INTO Chore (template_id, group_id, name, due_date, notes, effort)
+            SELECT *
+            FROM unnest(%s::int[], %s::int[], %s::varchar[], %s::timestamp[], %s::text[],
+                        %s::int[])
+            ON CONFLICT (template_id, due_date) DO NOTHING
+            RETURNING chore_id, template_id, due_date
+        ), assigned AS (
+            INSERT INTO ChoreAssignee (chore_id, profile_id, individual_status)
+            SELECT i.chore_id, a.profile_id, 'pending'
+            FROM unnest(%s::int[], %s::timestamp[], %s::int[]) AS a(template_id, due_date, profile_id)
+            JOIN inserted i ON i.template_id = a.template_id AND i.due_date = a.due_date
+            RETURNING chore_id
+        )
+        SELECT (SELECT count(*) FROM inserted) AS chores,
+               (SELECT count(*) FROM assigned) AS assignees
+    """, (
+        [c[0] for c in chores], [c[1] for c in chores], [c[2] for c in chores],
+        [c[3] for c in chores], [c[4] for c in chores], [c[5] for c in chores],
+        [a[0] for a in assignments], [a[1] for a in assignments], [a[2] for a in assignments],
+    ))
+    row = cursor.fetchone()
+    logger.debug("Inserted %d recurring chores with %d assignees", row["chores"], row["assignees"])
+    return row["chores"]
@@ -1,44 +1,134 @@
-from backend.db.connection import get_connection
+from psycopg2.extras import execute_values
+from backend.db.connection import get_connection, pooled_connection
+from backend.db.rotation import WorkloadBalancer
+from backend.db.tracing import traced
 from datetime import datetime
 from typing import Optional, List, Dict
 
+# Largest number of status changes applied in one batch
+MAX_STATUS_BATCH = 1000
+
+# Page size of a profile's chores when paging without an explicit limit,
+# and the largest page
+DEFAULT_PROFILE_CHORE_PAGE = 100
+MAX_PROFILE_CHORE_PAGE = 500
+
+# Columns of a chore as returned by the API
+CHORE_COLUMNS = "chore_id, group_id, name, assigned_date, due_date, notes, template_id, effort"
+
 # ==================== CHORE CRUD ====================
 
+@traced
 def create_chore(group_id: int, name: str, due_date: Optional[datetime] = None, 
-                 notes: Optional[str] = None) -> int:
+                 notes: Optional[str] = None, effort: int = 1) -> Dict:
     """
     Create a new chore
-    Returns the chore_id
+    Returns the created chore
     """
-    conn = None
-    cursor = None
+    with pooled_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"""
+                INSERT INTO Chore (group_id, name, due_date, notes, effort)
+                VALUES (%s, %s, %s, %s, %s)
+                RETURNING {CHORE_COLUMNS}
+            """, (group_id, name, due_date, notes, effort))
+            
+            chore = dict(cursor.fetchone())
+            conn.commit()
+            return chore
+            
+        except Exception as e:
+            conn.rollback()
+            raise Exception(f"Error creating chore: {e}")
+            
+        finally:
+            cursor.close()
+
+
+@traced
+def create_chores_bulk(chores: List[Dict]) -> List[Dict]:
+    """
+    Create many chores and their assignees in one transaction
+    Each chore is a dict with group_id, name, due_date, notes, effort and
+    assignee_ids; assignees must be members of the chore's group.
+    Returns the created chores, in order, with their assignee_ids
+    """
+    assignments = [
+        (index, profile_id)
+        for index, chore in enumerate(chores, start=1)
+        for profile_id in dict.fromkeys(chore.get("assignee_ids") or [])
+    ]
     
-    try:
-        conn = get_connection()
+    with pooled_connection() as conn:
         cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO Chore (group_id, name, due_date, notes)
-            VALUES (%s, %s, %s, %s)
-            RETURNING chore_id
-        """, (group_id, name, due_date, notes))
-        
-        chore_id = cursor.fetchone()['chore_id']
-        conn.commit()
-        return chore_id
-        
-    except Exception as e:
-        if conn:
+        try:
+            # RETURNING order and serial assignment are not tied to the
+            # input order, so each position draws its chore_id from the
+            # sequence first and assignees are matched by position
+            cursor.execute(f"""
+                WITH input AS MATERIALIZED (
+                    SELECT t.*, nextval(pg_get_serial_sequence('chore', 'chore_id'))::int AS chore_id
+                    FROM unnest(%(group_ids)s::int[], %(names)s::varchar[],
+                                %(due_dates)s::timestamp[], %(notes)s::text[],
+                                %(efforts)s::int[])
+                         WITH ORDINALITY AS t(group_id, name, due_date, notes, effort, position)
+                ), inserted AS (
+                    INSERT INTO Chore (chore_id, group_id, name, due_date, notes, effort)
+                    SELECT chore_id, group_id, name, due_date, notes, effort
+                    FROM input
+                    RETURNING {CHORE_COLUMNS}
+                ), assigned AS (
+                    INSERT INTO ChoreAssignee (chore_id, profile_id, individual_status)
+                    SELECT i.chore_id, a.profile_id, 'pending'
+                    FROM unnest(%(positions)s::int[], %(profile_ids)s::int[]) AS a(position, profile_id)
+                    JOIN input i ON i.position = a.position
+                    JOIN GroupProfile gp ON gp.group_id = i.group_id AND gp.profile_id = a.profile_id
+                    RETURNING chore_id, profile_id
+                )
+                SELECT
+                    n.chore_id, n.group_id, n.name, n.assigned_date, n.due_date, n.notes,
+                    n.template_id, n.effort,
+                    COALESCE(
+                        (SELECT array_agg(a.profile_id ORDER BY a.profile_id)
+                         FROM assigned a WHERE a.chore_id = n.chore_id),
+                        '{{}}'
+                    ) AS assignee_ids
+                FROM input i
+                JOIN inserted n ON n.chore_id = i.chore_id
+                ORDER BY i.position
+            """, {
+                "group_ids": [chore["group_id"] for chore in chores],
+                "names": [chore["name"] for chore in chores],
+                "due_dates": [chore.get("due_date") for chore in chores],
+                "notes": [chore.get("notes") for chore in chores],
+                "efforts": [chore.get("effort", 1) for chore in chores],
+                "positions": [index for index, _ in assignments],
+                "profile_ids": [profile_id for _, profile_id in assignments],
+            })
+            
+            created = [dict(row) for row in cursor.fetchall()]
+            assigned = sum(len(chore["assignee_ids"]) for chore in created)
+            if assigned != len(assignments):
+                conn.rollback()
+                raise ValueError(
+                    f"{len(assignments) - assigned} assignee(s) are not members of the chore's group"
+                )
+            
+            conn.commit()
+            return created
+            
+        except ValueError:
+            raise
+        except Exception as e:
             conn.rollback()
-        raise Exception(f"Error creating chore: {e}")
-        
-    finally:
-        if cursor:
+            raise Exception(f"Error creating chores: {e}")
+            
+        finally:
             cursor.close()
-        if conn:
-            conn.close()
 
 
+@traced
 def get_chore_by_id(chore_id: int) -> Optional[Dict]:
     """Get a single chore by ID"""
     conn = None
@@ -48,8 +138,8 @@ def get_chore_by_id(chore_id: int) -> Optional[Dict]:
         conn = get_connection()
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT chore_id, group_id, name, assigned_date, due_date, notes
+        cursor.execute(f"""
+            SELECT {CHORE_COLUMNS}
             FROM Chore
             WHERE chore_id = %s
         """, (chore_id,))
@@ -64,6 +154,7 @@ def get_chore_by_id(chore_id: int) -> Optional[Dict]:
             conn.close()
 
 
+@traced
 def get_chores_for_group(group_id: int) -> List[Dict]:
     """Get all chores for a specific group"""
     conn = None
@@ -73,8 +164,8 @@ def get_chores_for_group(group_id: int) -> List[Dict]:
         conn = get_connection()
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT chore_id, group_id, name, assigned_date, due_date, notes
+        cursor.execute(f"""
+            SELECT {CHORE_COLUMNS}
             FROM Chore
             WHERE group_id = %s
             ORDER BY due_date ASC NULLS LAST, assigned_date DESC
@@ -90,6 +181,37 @@ def get_chores_for_group(group_id: int) -> List[Dict]:
             conn.close()
 
 
+# A group's chores with their assignees, soonest due first
+CHORES_WITH_ASSIGNEES_QUERY = """
+    SELECT 
+        c.chore_id,
+        c.group_id,
+        c.name,
+        c.assigned_date,
+        c.due_date,
+        c.notes,
+        c.template_id,
+        c.effort,
+        COALESCE(
+            json_agg(
+                json_build_object(
+                    'profile_id', ca.profile_id,
+                    'profile_name', p.profile_name,
+                    'status', ca.individual_status
+                )
+            ) FILTER (WHERE ca.profile_id IS NOT NULL),
+            '[]'
+        ) as assignees
+    FROM Chore c
+    LEFT JOIN ChoreAssignee ca ON c.chore_id = ca.chore_id
+    LEFT JOIN Profile p ON ca.profile_id = p.profile_id
+    WHERE c.group_id = %(group_id)s
+    GROUP BY c.chore_id
+    ORDER BY c.due_date ASC NULLS LAST, c.assigned_date DESC
+"""
+
+
+@traced
 def get_chores_with_assignees(group_id: int) -> List[Dict]:
     """
     Get all chores for a group with their assignees
@@ -101,31 +223,7 @@ def get_chores_with_assignees(group_id: int) -> List[Dict]:
         conn = get_connection()
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT 
-                c.chore_id,
-                c.group_id,
-                c.name,
-                c.assigned_date,
-                c.due_date,
-                c.notes,
-                COALESCE(
-                    json_agg(
-                        json_build_object(
-                            'profile_id', ca.profile_id,
-                            'profile_name', p.profile_name,
-                            'status', ca.individual_status
-                        )
-                    ) FILTER (WHERE ca.profile_id IS NOT NULL),
-                    '[]'
-                ) as assignees
-            FROM Chore c
-            LEFT JOIN ChoreAssignee ca ON c.chore_id = ca.chore_id
-            LEFT JOIN Profile p ON ca.profile_id = p.profile_id
-            WHERE c.group_id = %s
-            GROUP BY c.chore_id, c.group_id, c.name, c.assigned_date, c.due_date, c.notes
-            ORDER BY c.due_date ASC NULLS LAST, c.assigned_date DESC
-        """, (group_id,))
+        cursor.execute(CHORES_WITH_ASSIGNEES_QUERY, {"group_id": group_id})
         
         results = cursor.fetchall()
         return [dict(row) for row in results]
@@ -137,6 +235,33 @@ def get_chores_with_assignees(group_id: int) -> List[Dict]:
             conn.close()
 
 
+@traced
+def render_chores_with_assignees(group_id: int) -> tuple:
+    """
+    The JSON array of get_chores_with_assignees, serialized by Postgres and
+    passed through as bytes, along with the 'chores' scope version it was
+    read at (both come from the same snapshot)
+    Returns (version, body)
+    """
+    with pooled_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"""
+                SELECT
+                    (SELECT COALESCE(MAX(version), 0) FROM scope_version
+                     WHERE scope_type = 'chores' AND scope_id = %(group_id)s) AS version,
+                    (SELECT COALESCE(json_agg(chores ORDER BY chores.due_date ASC NULLS LAST,
+                                                      chores.assigned_date DESC), '[]')::text
+                     FROM ({CHORES_WITH_ASSIGNEES_QUERY}) chores) AS body
+            """, {"group_id": group_id})
+            row = cursor.fetchone()
+            return row["version"], row["body"].encode("utf-8")
+
+        finally:
+            cursor.close()
+
+
+@traced
 def assign_chore_to_profile(chore_id: int, profile_id: int) -> bool:
     """
     Assign a chore to a profile
@@ -168,6 +293,7 @@ def assign_chore_to_profile(chore_id: int, profile_id: int) -> bool:
         if conn:
             conn.close()
 
+@traced
 def unassign_chore_from_profile(chore_id: int, profile_id: int) -> bool:
     """
     Remove a profile from a chore assignment
@@ -199,44 +325,89 @@ def unassign_chore_from_profile(chore_id: int, profile_id: int) -> bool:
             conn.close()
 
 
-def get_chores_for_profile(profile_id: int) -> List[Dict]:
+@traced
+def get_chores_for_profile(profile_id: int, status: Optional[str] = None,
+                           group_id: Optional[int] = None,
+                           due_after: Optional[datetime] = None,
+                           due_before: Optional[datetime] = None,
+                           limit: Optional[int] = None,
+                           after: Optional[tuple] = None) -> tuple:
     """
-    Get all chores assigned to a specific profile
+    Get the chores assigned to a specific profile, optionally only those
+    with an individual status, in a group, or due in a range
+    Chores are ordered by due date (undated chores last) then chore_id;
+    without a limit all of them are returned, otherwise one page, and
+    `after` is the (due_date, chore_id) of the last chore already returned
+    Returns (chores, has_more)
     """
-    conn = None
-    cursor = None
-    
-    try:
-        conn = get_connection()
+    filters = ["ca.profile_id = %(profile_id)s"]
+    if status is not None:
+        filters.append("ca.individual_status = %(status)s")
+    if group_id is not None:
+        filters.append("c.group_id = %(group_id)s")
+    if due_after is not None:
+        filters.append("c.due_date >= %(due_after)s")
+    if due_before is not None:
+        filters.append("c.due_date < %(due_before)s")
+    if after is not None:
+        filters.append("(COALESCE(c.due_date, 'infinity'), c.chore_id) > (%(after_due)s::timestamp, %(after_id)s)")
+
+    with pooled_connection() as conn:
         cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT 
-                c.chore_id,
-                c.group_id,
-                c.name,
-                c.assigned_date,
-                c.due_date,
-                c.notes,
-                ca.individual_status,
-                g.group_name
-            FROM Chore c
-            JOIN ChoreAssignee ca ON c.chore_id = ca.chore_id
-            JOIN "Group" g ON c.group_id = g.group_id
-            WHERE ca.profile_id = %s
-            ORDER BY c.due_date ASC NULLS LAST, c.assigned_date DESC
-        """, (profile_id,))
-        
-        results = cursor.fetchall()
-        return [dict(row) for row in results]
-        
-    finally:
-        if cursor:
+        try:
+            cursor.execute(f"""
+                SELECT 
+                    c.chore_id,
+                    c.group_id,
+                    c.name,
+                    c.assigned_date,
+                    c.due_date,
+                    c.notes,
+                    c.effort,
+                    ca.individual_status,
+                    g.group_name
+                FROM ChoreAssignee ca
+                JOIN Chore c ON c.chore_id = ca.chore_id
+                JOIN "Group" g ON c.group_id = g.group_id
+                WHERE {" AND ".join(filters)}
+                ORDER BY COALESCE(c.due_date, 'infinity'), c.chore_id
+                LIMIT %(limit)s
+            """, {
+                "profile_id": profile_id,
+                "status": status,
+                "group_id": group_id,
+                "due_after": due_after,
+                "due_before": due_before,
+                "after_due": after[0] if after else None,
+                "after_id": after[1] if after else None,
+                # One extra row tells whether another page follows;
+                # LIMIT NULL returns everything
+                "limit": limit + 1 if limit is not None else None,
+            })
+            chores = [dict(row) for row in cursor.fetchall()]
+            if limit is None or len(chores) <= limit:
+                return chores, False
+            return chores[:limit], True
+
+        finally:
             cursor.close()
-        if conn:
-            conn.close()
 
 
+def encode_chore_cursor(chore: dict) -> str:
+    """Page cursor pointing just past a chore of get_chores_for_profile"""
+    due_date = chore["due_date"]
+    return f"{due_date.isoformat() if due_date else 'infinity'},{chore['chore_id']}"
+
+
+def decode_chore_cursor(value: str) -> tuple:
+    """(due_date, chore_id) of a cursor from encode_chore_cursor"""
+    due_date, chore_id = value.split(",")
+    if due_date != "infinity":
+        due_date = datetime.fromisoformat(due_date).isoformat()
+    return due_date, int(chore_id)
+
+
+@traced
 def update_chore_status(chore_id: int, profile_id: int, status: str) -> bool:
     """
     Update the status of a chore for a specific profile
@@ -273,6 +444,7 @@ def update_chore_status(chore_id: int, profile_id: int, status: str) -> bool:
             conn.close()
 
 
+@traced
 def toggle_chore_status(chore_id: int, profile_id: int) -> str:
     """
     Toggle chore status between pending and completed
@@ -312,9 +484,91 @@ def toggle_chore_status(chore_id: int, profile_id: int) -> str:
             conn.close()
 
 
-def get_chores_for_profile(profile_id: int) -> List[Dict]:
+@traced
+def update_chore_statuses(changes: List[Dict]) -> List[Dict]:
+    """
+    Apply many status changes with a single UPDATE
+    Each change is a dict with chore_id, profile_id and status, which is
+    'pending', 'completed' or 'toggle'; a pair listed twice uses its last
+    change. Returns the assignments that exist with their new status
+    """
+    for change in changes:
+        if change['status'] not in ['pending', 'completed', 'toggle']:
+            raise ValueError("Status must be 'pending', 'completed' or 'toggle'")
+    
+    # The same row can only be updated once per statement
+    latest = {(c['chore_id'], c['profile_id']): c['status'] for c in changes}
+    
+    with pooled_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            updated = execute_values(cursor, """
+                UPDATE ChoreAssignee ca
+                SET individual_status = CASE
+                    WHEN v.status <> 'toggle' THEN v.status
+                    WHEN ca.individual_status = 'pending' THEN 'completed'
+                    ELSE 'pending'
+                END
+                FROM (VALUES %s) AS v(chore_id, profile_id, status)
+                WHERE ca.chore_id = v.chore_id AND ca.profile_id = v.profile_id
+                RETURNING ca.chore_id, ca.profile_id, ca.individual_status AS status
+            """, [(chore_id, profile_id, status) for (chore_id, profile_id), status in latest.items()],
+                page_size=MAX_STATUS_BATCH, fetch=True)
+            
+            conn.commit()
+            return [dict(row) for row in updated]
+            
+        except Exception as e:
+            conn.rollback()
+            raise Exception(f"Error updating chore statuses: {e}")
+            
+        finally:
+            cursor.close()
+
+
+@traced
+def update_chore(chore_id: int, **kwargs) -> Optional[Dict]:
     """
-    Get all chores assigned to a specific profile
+    Update chore details
+    Accepts: name, due_date, notes, effort
+    Returns the updated chore, or None if it does not exist
+    """
+    # Build dynamic UPDATE query
+    fields = []
+    values = []
+    
+    for key, value in kwargs.items():
+        if key in ['name', 'due_date', 'notes', 'effort']:
+            fields.append(f"{key} = %s")
+            values.append(value)
+    
+    if not fields:
+        return None
+    
+    values.append(chore_id)
+    query = f"UPDATE Chore SET {', '.join(fields)} WHERE chore_id = %s RETURNING {CHORE_COLUMNS}"
+    
+    with pooled_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query, values)
+            result = cursor.fetchone()
+            conn.commit()
+            
+            return dict(result) if result else None
+            
+        except Exception as e:
+            conn.rollback()
+            raise Exception(f"Error updating chore: {e}")
+            
+        finally:
+            cursor.close()
+
+
+@traced
+def delete_chore(chore_id: int) -> bool:
+    """
+    Delete a chore (will cascade delete assignments)
     """
     conn = None
     cursor = None
@@ -323,25 +577,15 @@ def get_chores_for_profile(profile_id: int) -> List[Dict]:
         conn = get_connection()
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT 
-                c.chore_id,
-                c.group_id,
-                c.name,
-                c.assigned_date,
-                c.due_date,
-                c.notes,
-                ca.individual_status,
-                g.group_name
-            FROM Chore c
-            JOIN ChoreAssignee ca ON c.chore_id = ca.chore_id
-            JOIN "Group" g ON c.group_id = g.group_id
-            WHERE ca.profile_id = %s
-            ORDER BY c.due_date ASC NULLS LAST, c.assigned_date DESC
-        """, (profile_id,))
+        cursor.execute("DELETE FROM Chore WHERE chore_id = %s", (chore_id,))
+        conn.commit()
         
-        results = cursor.fetchall()
-        return [dict(row) for row in results]
+        return cursor.rowcount > 0
+        
+    except Exception as e:
+        if conn:
+            conn.rollback()
+        raise Exception(f"Error deleting chore: {e}")
         
     finally:
         if cursor:
@@ -350,10 +594,32 @@ def get_chores_for_profile(profile_id: int) -> List[Dict]:
             conn.close()
 
 
-def update_chore(chore_id: int, **kwargs) -> bool:
+# ==================== AUTO-ASSIGNMENT ====================
+
+def get_group_workloads(cursor, group_ids: List[int]) -> Dict[int, Dict[int, int]]:
     """
-    Update chore details
-    Accepts: name, due_date, notes
+    group_id -> {profile_id: workload} for every member of the groups,
+    read from the chore_workload counters (members without any are 0)
+    """
+    cursor.execute("""
+        SELECT gp.group_id, gp.profile_id,
+               COALESCE(w.open_effort + w.completed_effort, 0) AS workload
+        FROM GroupProfile gp
+        LEFT JOIN chore_workload w
+               ON w.group_id = gp.group_id AND w.profile_id = gp.profile_id
+        WHERE gp.group_id = ANY(%s)
+    """, (group_ids,))
+    workloads = {group_id: {} for group_id in group_ids}
+    for row in cursor.fetchall():
+        workloads[row['group_id']][row['profile_id']] = row['workload']
+    return workloads
+
+
+@traced
+def get_chore_workloads(group_id: int) -> List[Dict]:
+    """
+    Get each group member's chore workload: effort of open and completed
+    chores assigned to them, least loaded first
     """
     conn = None
     cursor = None
@@ -362,30 +628,22 @@ def update_chore(chore_id: int, **kwargs) -> bool:
         conn = get_connection()
         cursor = conn.cursor()
         
-        # Build dynamic UPDATE query
-        fields = []
-        values = []
-        
-        for key, value in kwargs.items():
-            if key in ['name', 'due_date', 'notes']:
-                fields.append(f"{key} = %s")
-                values.append(value)
-        
-        if not fields:
-            return False
-        
-        values.append(chore_id)
-        query = f"UPDATE Chore SET {', '.join(fields)} WHERE chore_id = %s"
-        
-        cursor.execute(query, values)
-        conn.commit()
-        
-        return cursor.rowcount > 0
+        cursor.execute("""
+            SELECT
+                gp.profile_id,
+                p.profile_name,
+                COALESCE(w.open_effort, 0) AS open_effort,
+                COALESCE(w.completed_effort, 0) AS completed_effort,
+                COALESCE(w.open_effort + w.completed_effort, 0) AS workload
+            FROM GroupProfile gp
+            JOIN Profile p ON p.profile_id = gp.profile_id
+            LEFT JOIN chore_workload w
+                   ON w.group_id = gp.group_id AND w.profile_id = gp.profile_id
+            WHERE gp.group_id = %s
+            ORDER BY workload, gp.profile_id
+        """, (group_id,))
         
-    except Exception as e:
-        if conn:
-            conn.rollback()
-        raise Exception(f"Error updating chore: {e}")
+        return [dict(row) for row in cursor.fetchall()]
         
     finally:
         if cursor:
@@ -394,9 +652,16 @@ def update_chore(chore_id: int, **kwargs) -> bool:
             conn.close()
 
 
-def delete_chore(chore_id: int) -> bool:
+@traced
+def auto_assign_chores(group_id: int, chore_ids: Optional[List[int]] = None,
+                       assignees_per_chore: int = 1,
+                       candidate_ids: Optional[List[int]] = None) -> List[Dict]:
     """
-    Delete a chore (will cascade delete assignments)
+    Assign chores of a group to the members with the least workload, in
+    due date order, topping each up to assignees_per_chore assignees.
+    Without chore_ids every chore of the group that is short of assignees
+    is assigned. candidate_ids restricts who may be picked.
+    Returns the chores that got assignees, with the profile ids added
     """
     conn = None
     cursor = None
@@ -405,18 +670,64 @@ def delete_chore(chore_id: int) -> bool:
         conn = get_connection()
         cursor = conn.cursor()
         
-        cursor.execute("DELETE FROM Chore WHERE chore_id = %s", (chore_id,))
-        conn.commit()
+        cursor.execute("""
+            SELECT c.chore_id, c.effort, a.assignee_ids
+            FROM Chore c
+            CROSS JOIN LATERAL (
+                SELECT COALESCE(array_agg(ca.profile_id), '{}') AS assignee_ids
+                FROM ChoreAssignee ca
+                WHERE ca.chore_id = c.chore_id
+            ) a
+            WHERE c.group_id = %(group_id)s
+              AND (%(chore_ids)s::int[] IS NULL OR c.chore_id = ANY(%(chore_ids)s))
+              AND cardinality(a.assignee_ids) < %(per_chore)s
+            ORDER BY c.due_date ASC NULLS LAST, c.chore_id
+            FOR UPDATE OF c
+        """, {"group_id": group_id, "chore_ids": chore_ids, "per_chore": assignees_per_chore})
+        chores = cursor.fetchall()
+        if not chores:
+            conn.rollback()
+            return []
+        
+        workloads = get_group_workloads(cursor, [group_id])[group_id]
+        if candidate_ids is not None:
+            candidates = set(candidate_ids)
+            workloads = {
+                profile_id: load for profile_id, load in workloads.items()
+                if profile_id in candidates
+            }
+        balancer = WorkloadBalancer(workloads)
+        
+        assigned = []
+        for chore in chores:
+            picked = balancer.assign(
+                chore['effort'],
+                assignees_per_chore - len(chore['assignee_ids']),
+                exclude=set(chore['assignee_ids']),
+            )
+            if picked:
+                assigned.append({"chore_id": chore['chore_id'], "profile_ids": picked})
         
-        return cursor.rowcount > 0
+        cursor.execute("""
+            INSERT INTO ChoreAssignee (chore_id, profile_id, individual_status)
+            SELECT chore_id, profile_id, 'pending'
+            FROM unnest(%s::int[], %s::int[]) AS a(chore_id, profile_id)
+            ON CONFLICT (profile_id, chore_id) DO NOTHING
+        """, (
+            [a['chore_id'] for a in assigned for _ in a['profile_ids']],
+            [profile_id for a in assigned for profile_id in a['profile_ids']],
+        ))
+        
+        conn.commit()
+        return assigned
         
     except Exception as e:
         if conn:
             conn.rollback()
-        raise Exception(f"Error deleting chore: {e}")
+        raise Exception(f"Error auto-assigning chores: {e}")
         
     finally:
         if cursor:
             cursor.close()
         if conn:
-            conn.close()
\ No newline at end of file
+            conn.close()
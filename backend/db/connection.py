@@ -1,16 +1,88 @@
+import os
+import threading
+from contextlib import contextmanager
+
 import psycopg2
 from psycopg2.extras import RealDictCursor 
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+
+try:
+    from .tracing import TracedConnection
+except ImportError:
+    # Schema scripts run from inside backend/db
+    from tracing import TracedConnection
+
+CONNECTION_SETTINGS = dict(
+    dbname="homebase_dev",
+    user="homebase_dev",
+    password="homebase_devforge25",
+    host="5.161.238.246",
+    port="5432",
+    connection_factory=TracedConnection,
+    cursor_factory=RealDictCursor
+)
+
+# Bounds of the shared pool behind pooled_connection()
+POOL_MIN_CONNECTIONS = int(os.getenv("DB_POOL_MIN", "1"))
+POOL_MAX_CONNECTIONS = int(os.getenv("DB_POOL_MAX", "10"))
+
+# Seconds pooled_connection() waits for a free connection before giving up
+POOL_WAIT_TIMEOUT = float(os.getenv("DB_POOL_WAIT_TIMEOUT", "5.0"))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+# ThreadedConnectionPool.getconn() raises instead of waiting when every
+# connection is out, so callers queue here first
+_pool_slots = threading.BoundedSemaphore(POOL_MAX_CONNECTIONS)
+
+
+class PoolTimeout(PoolError):
+    """No pooled connection became free within POOL_WAIT_TIMEOUT"""
+
 
 def get_connection():
     """
     Returns a connection to the PostgreSQL database.
     Other files should import and use this function.
     """
-    return psycopg2.connect(
-        dbname="homebase_dev",
-        user="homebase_dev",
-        password="homebase_devforge25",
-        host="5.161.238.246",
-        port="5432",
-        cursor_factory=RealDictCursor
-    )
\ No newline at end of file
+    return psycopg2.connect(**CONNECTION_SETTINGS)
+
+
+def _get_pool() -> ThreadedConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadedConnectionPool(
+                    POOL_MIN_CONNECTIONS, POOL_MAX_CONNECTIONS, **CONNECTION_SETTINGS
+                )
+    return _pool
+
+
+@contextmanager
+def pooled_connection():
+    """
+    Borrow a connection from the shared pool for the duration of a with
+    block, saving the connect round trips of get_connection() on hot
+    paths. Work left uncommitted is rolled back before the connection is
+    returned. Waits up to POOL_WAIT_TIMEOUT for a free connection, then
+    raises PoolTimeout.
+    """
+    if not _pool_slots.acquire(timeout=POOL_WAIT_TIMEOUT):
+        raise PoolTimeout(f"No database connection free after {POOL_WAIT_TIMEOUT:g}s")
+    try:
+        pool = _get_pool()
+        conn = pool.getconn()
+        try:
+            yield conn
+        finally:
+            broken = conn.closed != 0
+            if not broken:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    broken = True
+            pool.putconn(conn, close=broken)
+    finally:
+        _pool_slots.release()
@@ -1,34 +1,202 @@
 # backend/db/event_queries.py
 
+import logging
 from backend.db.connection import get_connection
-from datetime import datetime
+from backend.db.tracing import traced
+from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Optional, List
+from psycopg2.extensions import cursor as TupleCursor
 from psycopg2.extras import RealDictCursor
 from backend.db.pydanticmodels import EventCreate
-
-
+from backend.db.recurrence import expand_occurrences, expand_rows, recurrence_end
+
+logger = logging.getLogger(__name__)
+
+
+# Overlap test for two events: strict, so back-to-back events never
+# conflict. Events without an end time (or ending at their start) are
+# instants in event_period and are excluded explicitly, since an instant
+# inside the window would otherwise pass the overlap test. Generated
+# expense reminders are calendar markers rather than bookings and are left
+# out, as are recurring series, whose event_period spans the whole series.
+CONFLICT_FILTER = """
+    e.event_period && tstzrange(%(start)s, %(end)s)
+    AND e.event_datetime_start < %(end)s
+    AND upper(e.event_period) > %(start)s
+    AND upper(e.event_period) > lower(e.event_period)
+    AND e.source_type IS NULL
+    AND e.recurrence_freq IS NULL
+"""
+
+# Columns of a recurrence rule, expanded by backend.db.recurrence
+RECURRENCE_COLUMNS = """
+    e.recurrence_freq,
+    e.recurrence_interval,
+    e.recurrence_count,
+    e.recurrence_until,
+    e.recurrence_exdates
+"""
+
+
+# Event times are returned to clients as UTC strings in this format, rendered
+# by Postgres for plain rows and by format_event_time for expanded ones
+EVENT_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _utc_text(column: str) -> str:
+    """SQL expression rendering a TIMESTAMPTZ column in EVENT_TIME_FORMAT"""
+    return f"""to_char({column} AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS"Z"')"""
+
+
+# Columns of an event in list responses, with times already serialized
+EVENT_COLUMNS = f"""
+    e.event_id,
+    e.event_name,
+    {_utc_text('e.event_datetime_start')} AS event_datetime_start,
+    {_utc_text('e.event_datetime_end')} AS event_datetime_end,
+    e.event_location,
+    e.event_notes,
+    e.group_id,
+    {RECURRENCE_COLUMNS}
+"""
+
+# One row per (event, participant), as the profile event list returns
+EVENT_LIST_COLUMNS = f"""
+    {EVENT_COLUMNS},
+    pe.profile_id
+"""
+
+# Page size of the group calendar when paging without an explicit limit,
+# and the largest page it returns
+DEFAULT_GROUP_CALENDAR_PAGE = 500
+MAX_GROUP_CALENDAR_PAGE = 2000
+
+
+def format_event_time(value: datetime) -> str:
+    """Python counterpart of _utc_text for values computed in Python"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime(EVENT_TIME_FORMAT)
+
+
+def _parse_event_time(value: str) -> datetime:
+    return datetime.strptime(value, EVENT_TIME_FORMAT).replace(tzinfo=timezone.utc)
+
+
+def _fetch_event_list(cursor, window_start=None, window_end=None) -> List[dict]:
+    """
+    Build the event list from a tuple cursor that selected EVENT_COLUMNS
+    (plus any extra columns): one dict per row, no further per-row work except
+    for recurring events, which are expanded into their occurrences. An
+    exact start selected as start_key is set to each occurrence's start.
+    """
+    columns = [column[0] for column in cursor.description]
+    events = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    if not any(event["recurrence_freq"] for event in events):
+        return events
+
+    result = []
+    for event in events:
+        if not event["recurrence_freq"]:
+            result.append(event)
+            continue
+
+        series = dict(event)
+        series["event_datetime_start"] = _parse_event_time(event["event_datetime_start"])
+        if event["event_datetime_end"]:
+            series["event_datetime_end"] = _parse_event_time(event["event_datetime_end"])
+        if event["recurrence_until"]:
+            event["recurrence_until"] = format_event_time(event["recurrence_until"])
+        event["recurrence_exdates"] = [format_event_time(d) for d in event["recurrence_exdates"]]
+
+        for occurrence_start, occurrence_end in expand_occurrences(series, window_start, window_end):
+            occurrence = dict(event)
+            occurrence["event_datetime_start"] = format_event_time(occurrence_start)
+            if "start_key" in occurrence:
+                occurrence["start_key"] = occurrence_start
+            if event["event_datetime_end"]:
+                occurrence["event_datetime_end"] = format_event_time(occurrence_end)
+            result.append(occurrence)
+
+    # UTC strings in EVENT_TIME_FORMAT sort chronologically
+    result.sort(key=itemgetter("event_datetime_start"))
+    return result
+
+
+def _naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Strip tzinfo to insert into TIMESTAMPTZ cleanly"""
+    if value is not None and value.tzinfo is not None:
+        return value.replace(tzinfo=None)
+    return value
+
+
+def _find_conflicts(cursor, start, end, group_id, profile_ids) -> List[dict]:
+    """Events overlapping [start, end) in the same group or shared with any of profile_ids"""
+    cursor.execute(
+        f"""
+        SELECT
+            e.event_id,
+            e.event_name,
+            {_utc_text('e.event_datetime_start')} AS event_datetime_start,
+            {_utc_text('e.event_datetime_end')} AS event_datetime_end,
+            e.group_id
+        FROM Event e
+        WHERE {CONFLICT_FILTER}
+          AND (
+              e.group_id = %(group_id)s
+              OR EXISTS (
+                  SELECT 1 FROM ProfileEvent pe
+                  WHERE pe.event_id = e.event_id
+                    AND pe.profile_id = ANY(%(profile_ids)s)
+              )
+          )
+        ORDER BY e.event_datetime_start
+        """,
+        {"start": start, "end": end, "group_id": group_id, "profile_ids": list(profile_ids)},
+    )
+    return [dict(row) for row in cursor.fetchall()]
+
+
+@traced
 def create_event(
     event: EventCreate,
-    profile_ids: List[int]
-) -> int:
-    """Create a new event and associate it with profiles"""
+    profile_ids: List[int],
+    check_conflicts: bool = False,
+) -> dict:
+    """
+    Create a new event and associate it with profiles.
+    Returns {"event_id", "conflicts"}; with check_conflicts, conflicts lists
+    existing events overlapping it in the same group or with any of the
+    same participants (the event is created either way).
+    """
     conn = get_connection()
     cursor = conn.cursor()
 
-    print(f"🔧 create_event called:")
-    print(f"   event_name: {event.event_name}")
-    print(f"   group_id: {event.group_id}")
-    print(f"   profile_ids: {profile_ids}")
-
     try:
         # Normalize datetimes (strip tzinfo to insert into TIMESTAMPTZ cleanly)
-        event_datetime_start = event.event_datetime_start
-        event_datetime_end = event.event_datetime_end
+        event_datetime_start = _naive(event.event_datetime_start)
+        event_datetime_end = _naive(event.event_datetime_end)
+        recurrence_until = _naive(event.recurrence_until)
+        recurrence_exdates = [_naive(exdate) for exdate in event.recurrence_exdates]
+
+        series_end = None
+        if event.recurrence_freq:
+            series_end = recurrence_end(
+                event_datetime_start,
+                event_datetime_end,
+                event.recurrence_freq,
+                event.recurrence_interval,
+                event.recurrence_count,
+                recurrence_until,
+            )
 
-        if event_datetime_start.tzinfo is not None:
-            event_datetime_start = event_datetime_start.replace(tzinfo=None)
-        if event_datetime_end and event_datetime_end.tzinfo is not None:
-            event_datetime_end = event_datetime_end.replace(tzinfo=None)
+        conflicts = []
+        if check_conflicts and event_datetime_end and not event.recurrence_freq:
+            conflicts = _find_conflicts(
+                cursor, event_datetime_start, event_datetime_end,
+                event.group_id, profile_ids,
+            )
 
         # Insert event with group_id
         cursor.execute(
@@ -39,9 +207,15 @@ def create_event(
                 event_datetime_end,
                 event_location,
                 event_notes,
-                group_id
+                group_id,
+                recurrence_freq,
+                recurrence_interval,
+                recurrence_count,
+                recurrence_until,
+                recurrence_exdates,
+                recurrence_end
             )
-            VALUES (%s, %s, %s, %s, %s, %s)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s::timestamptz[], %s)
             RETURNING event_id
             """,
             (
@@ -51,6 +225,12 @@ def create_event(
                 event.event_location,
                 event.event_notes,
                 event.group_id,
+                event.recurrence_freq,
+                event.recurrence_interval,
+                event.recurrence_count,
+                recurrence_until,
+                recurrence_exdates,
+                series_end,
             ),
         )
 
@@ -61,8 +241,6 @@ def create_event(
             event_id = result['event_id']
         else:
             event_id = result[0]
-            
-        print(f"✅ Event inserted with event_id: {event_id}, group_id: {event.group_id}")
 
         # Associate event with each profile
         for profile_id in profile_ids:
@@ -73,33 +251,25 @@ def create_event(
                 """,
                 (profile_id, event_id),
             )
-            print(f"   ✅ Associated profile {profile_id} with event {event_id}")
 
         conn.commit()
-
-        # Verify
-        cursor.execute(
-            "SELECT event_id, event_name, group_id FROM Event WHERE event_id = %s",
-            (event_id,),
+        logger.debug(
+            "Inserted event %s (group %s) for profiles %s, %d conflicts",
+            event_id, event.group_id, profile_ids, len(conflicts),
         )
-        result = cursor.fetchone()
-        
-        if isinstance(result, dict):
-            print(f"🔍 Verification - Event {result['event_id']}: name='{result['event_name']}', group_id={result['group_id']}")
-        else:
-            print(f"🔍 Verification - Event {result[0]}: name='{result[1]}', group_id={result[2]}")
 
-        return event_id
+        return {"event_id": event_id, "conflicts": conflicts}
 
     except Exception as e:
         conn.rollback()
-        print(f"❌ Error in create_event: {e}")
+        logger.error("Error in create_event: %s", e)
         raise e
     finally:
         cursor.close()
         conn.close()
 
 
+@traced
 def get_events_for_profile(
     profile_id: int,
     start_date: Optional[datetime] = None,
@@ -107,182 +277,454 @@ def get_events_for_profile(
 ) -> List[dict]:
     """Get all events for a profile (across all groups)"""
     conn = get_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    cursor = conn.cursor(cursor_factory=TupleCursor)
 
     try:
-        query = """
-            SELECT
-                e.event_id,
-                e.event_name,
-                e.event_datetime_start,
-                e.event_datetime_end,
-                e.event_location,
-                e.event_notes,
-                e.group_id,
-                pe.profile_id
+        query = f"""
+            SELECT {EVENT_LIST_COLUMNS}
             FROM Event e
             JOIN ProfileEvent pe ON e.event_id = pe.event_id
             WHERE pe.profile_id = %s
         """
         params = [profile_id]
 
-        if start_date:
-            query += " AND e.event_datetime_start >= %s"
-            params.append(start_date)
-
-        if end_date:
-            query += " AND e.event_datetime_start <= %s"
-            params.append(end_date)
+        if start_date or end_date:
+            # Overlap rather than start-in-window so events that began
+            # before the window are included (a missing bound is unbounded)
+            query += " AND e.event_period && tstzrange(%s, %s, '[]')"
+            params.extend([start_date, end_date])
 
         query += " ORDER BY e.event_datetime_start"
 
         cursor.execute(query, params)
-        events = cursor.fetchall()
+        return _fetch_event_list(cursor, start_date, end_date)
+
+    finally:
+        cursor.close()
+        conn.close()
+
+
+# Calendar cursors hold the exact start, microseconds included, since the
+# page order compares starts at full precision
+CALENDAR_CURSOR_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def encode_calendar_cursor(start: datetime, event_id: int) -> str:
+    """Page cursor pointing just past the group calendar event (start, event_id)"""
+    return f"{start.astimezone(timezone.utc).strftime(CALENDAR_CURSOR_FORMAT)},{event_id}"
+
+
+def decode_calendar_cursor(value: str) -> tuple:
+    """(start, event_id) of a cursor from encode_calendar_cursor"""
+    start, event_id = value.split(",")
+    start = datetime.strptime(start, CALENDAR_CURSOR_FORMAT).replace(tzinfo=timezone.utc)
+    return start, int(event_id)
+
+
+@traced
+def get_group_calendar(
+    group_id: int,
+    start_date: datetime,
+    end_date: datetime,
+    profile_id: Optional[int] = None,
+    limit: Optional[int] = None,
+    after: Optional[tuple] = None,
+) -> tuple:
+    """
+    Get a group's events overlapping a window, each event once with the
+    ids of all its participants in profile_ids. profile_id is kept for
+    older clients: the requesting profile if it takes part, otherwise the
+    first participant.
+
+    Without a limit every event is returned. With one, pages are ordered
+    by (start, event_id) and `after` is the cursor position from the
+    previous page. Returns (events, next_cursor), where next_cursor is
+    None on the last page. Occurrences of recurring series are paged like
+    plain events.
+    """
+    conn = get_connection()
+    cursor = conn.cursor(cursor_factory=TupleCursor)
+    after_start, after_id = after or (None, None)
 
-        result: List[dict] = []
+    try:
+        # Plain events are keyset-paged in SQL. Recurring series are few
+        # and their occurrences can fall on any page, so all of them in
+        # the window are expanded and merged in
+        cursor.execute(
+            f"""
+            WITH page AS (
+                (
+                    SELECT e.event_id
+                    FROM Event e
+                    WHERE e.group_id = %(group_id)s
+                      AND e.recurrence_freq IS NULL
+                      AND e.event_period && tstzrange(%(start)s, %(end)s, '[]')
+                      AND (
+                          %(after_start)s::timestamptz IS NULL
+                          OR (e.event_datetime_start, e.event_id)
+                             > (%(after_start)s::timestamptz, %(after_id)s)
+                      )
+                    ORDER BY e.event_datetime_start, e.event_id
+                    LIMIT %(limit)s
+                )
+                UNION ALL
+                SELECT e.event_id
+                FROM Event e
+                WHERE e.group_id = %(group_id)s
+                  AND e.recurrence_freq IS NOT NULL
+                  AND e.event_period && tstzrange(%(start)s, %(end)s, '[]')
+            ), participants AS (
+                SELECT pe.event_id,
+                       array_agg(pe.profile_id ORDER BY pe.profile_id) AS profile_ids
+                FROM page
+                JOIN ProfileEvent pe ON pe.event_id = page.event_id
+                GROUP BY pe.event_id
+            )
+            SELECT
+                {EVENT_COLUMNS},
+                CASE WHEN %(profile_id)s = ANY(p.profile_ids) THEN %(profile_id)s
+                     ELSE p.profile_ids[1]
+                END AS profile_id,
+                COALESCE(p.profile_ids, '{{}}') AS profile_ids,
+                e.event_datetime_start AS start_key
+            FROM page
+            JOIN Event e ON e.event_id = page.event_id
+            LEFT JOIN participants p ON p.event_id = e.event_id
+            ORDER BY e.event_datetime_start, e.event_id
+            """,
+            {
+                "group_id": group_id,
+                "start": start_date,
+                "end": end_date,
+                "profile_id": profile_id,
+                "after_start": after_start,
+                "after_id": after_id,
+                # One extra row tells whether another page follows;
+                # LIMIT NULL returns everything
+                "limit": limit + 1 if limit is not None else None,
+            },
+        )
+        events = _fetch_event_list(cursor, start_date, end_date)
+        if after is not None:
+            events = [
+                event for event in events
+                if (event["start_key"], event["event_id"]) > after
+            ]
+        events.sort(key=itemgetter("start_key", "event_id"))
+
+        next_cursor = None
+        if limit is not None and len(events) > limit:
+            events = events[:limit]
+            next_cursor = encode_calendar_cursor(events[-1]["start_key"], events[-1]["event_id"])
         for event in events:
-            event_dict = dict(event)
-            if (
-                event_dict.get("event_datetime_start")
-                and isinstance(event_dict["event_datetime_start"], datetime)
-            ):
-                event_dict["event_datetime_start"] = event_dict[
-                    "event_datetime_start"
-                ].strftime("%Y-%m-%dT%H:%M:%SZ")
-            if (
-                event_dict.get("event_datetime_end")
-                and isinstance(event_dict["event_datetime_end"], datetime)
-            ):
-                event_dict["event_datetime_end"] = event_dict[
-                    "event_datetime_end"
-                ].strftime("%Y-%m-%dT%H:%M:%SZ")
-            result.append(event_dict)
-
-        return result
+            del event["start_key"]
+
+        return events, next_cursor
 
     finally:
         cursor.close()
         conn.close()
 
 
-def get_events_for_group_members(
+@traced
+def get_member_busy_intervals(
     group_id: int,
-    start_date: Optional[datetime] = None,
-    end_date: Optional[datetime] = None,
-) -> List[dict]:
-    """Get all events for members of a specific group (only that group's events)"""
+    start_date: datetime,
+    end_date: datetime,
+) -> List[tuple]:
+    """
+    Get (start, end, profile_id) for every event of every member of a group
+    that overlaps the window, clipped to the window. Includes members'
+    events from other groups since those make them busy too.
+    """
     conn = get_connection()
     cursor = conn.cursor(cursor_factory=RealDictCursor)
 
-    print(f"🔍 get_events_for_group_members called for group_id: {group_id}", flush=True)
+    try:
+        cursor.execute(
+            f"""
+            SELECT
+                e.event_datetime_start,
+                GREATEST(COALESCE(e.event_datetime_end, e.event_datetime_start),
+                         e.event_datetime_start) AS event_datetime_end,
+                pe.profile_id,
+                {RECURRENCE_COLUMNS}
+            FROM GroupProfile gp
+            JOIN ProfileEvent pe ON pe.profile_id = gp.profile_id
+            JOIN Event e ON e.event_id = pe.event_id
+            WHERE gp.group_id = %(group_id)s
+              AND e.event_period && tstzrange(%(start)s, %(end)s)
+            ORDER BY e.event_datetime_start
+            """,
+            {"group_id": group_id, "start": start_date, "end": end_date},
+        )
+        return [
+            (
+                max(row["event_datetime_start"], start_date),
+                min(row["event_datetime_end"], end_date),
+                row["profile_id"],
+            )
+            for row in expand_rows(cursor.fetchall(), start_date, end_date)
+        ]
+
+    finally:
+        cursor.close()
+        conn.close()
+
+
+@traced
+def get_events_with_participants(
+    group_id: int,
+    start_date: datetime,
+    end_date: datetime,
+) -> List[dict]:
+    """
+    Get the bookable events overlapping a window that belong to a group or
+    include any of its members, each with its participant profile ids
+    """
+    conn = get_connection()
+    cursor = conn.cursor(cursor_factory=RealDictCursor)
 
     try:
-        query = """
-            SELECT DISTINCT
+        cursor.execute(
+            f"""
+            SELECT
                 e.event_id,
                 e.event_name,
                 e.event_datetime_start,
-                e.event_datetime_end,
-                e.event_location,
-                e.event_notes,
+                upper(e.event_period) AS event_datetime_end,
                 e.group_id,
-                pe.profile_id
+                array_agg(pe.profile_id ORDER BY pe.profile_id) AS profile_ids
             FROM Event e
-            JOIN ProfileEvent pe ON e.event_id = pe.event_id
-            WHERE e.group_id = %s
-        """
-        params = [group_id]
-
-        if start_date:
-            query += " AND e.event_datetime_start >= %s"
-            params.append(start_date)
+            JOIN ProfileEvent pe ON pe.event_id = e.event_id
+            WHERE {CONFLICT_FILTER}
+              AND (
+                  e.group_id = %(group_id)s
+                  OR EXISTS (
+                      SELECT 1
+                      FROM ProfileEvent m
+                      JOIN GroupProfile gp ON gp.profile_id = m.profile_id
+                      WHERE m.event_id = e.event_id AND gp.group_id = %(group_id)s
+                  )
+              )
+            GROUP BY e.event_id
+            ORDER BY e.event_datetime_start
+            """,
+            {"group_id": group_id, "start": start_date, "end": end_date},
+        )
+        return [dict(row) for row in cursor.fetchall()]
 
-        if end_date:
-            query += " AND e.event_datetime_start <= %s"
-            params.append(end_date)
+    finally:
+        cursor.close()
+        conn.close()
 
-        query += " ORDER BY e.event_datetime_start"
 
-        print(f"📊 Executing query: {query}", flush=True)
-        print(f"📊 With params: {params}", flush=True)
-        cursor.execute(query, params)
-        events = cursor.fetchall()
+@traced
+def get_calendar_version(profile_id: int = None, group_id: int = None) -> tuple:
+    """
+    Version of a profile's or group's calendar from scope_version. A
+    profile's calendar also shows its groups' recurring expenses, so its
+    version includes the version of every group it belongs to.
+    """
+    conn = get_connection()
+    cursor = conn.cursor(cursor_factory=RealDictCursor)
 
-        print(f"📥 Found {len(events)} raw events", flush=True)
+    try:
+        if group_id is not None:
+            cursor.execute(
+                """
+                SELECT COALESCE(MAX(version), 0) AS version
+                FROM scope_version
+                WHERE scope_type = 'group' AND scope_id = %s
+                """,
+                (group_id,),
+            )
+            return ("group", group_id, cursor.fetchone()["version"])
 
-        result: List[dict] = []
-        for event in events:
-            event_dict = dict(event)
-            print(f"   Raw event from DB: {event_dict}", flush=True)
+        cursor.execute(
+            """
+            SELECT
+                (SELECT COALESCE(MAX(version), 0) FROM scope_version
+                 WHERE scope_type = 'profile' AND scope_id = %(profile_id)s) AS version,
+                COALESCE(array_agg(gp.group_id ORDER BY gp.group_id)
+                         FILTER (WHERE gp.group_id IS NOT NULL), '{}') AS group_ids,
+                COALESCE(array_agg(COALESCE(sv.version, 0) ORDER BY gp.group_id)
+                         FILTER (WHERE gp.group_id IS NOT NULL), '{}') AS group_versions
+            FROM GroupProfile gp
+            LEFT JOIN scope_version sv
+              ON sv.scope_type = 'group' AND sv.scope_id = gp.group_id
+            WHERE gp.profile_id = %(profile_id)s
+            """,
+            {"profile_id": profile_id},
+        )
+        row = cursor.fetchone()
+        return (
+            "profile", profile_id, row["version"],
+            tuple(zip(row["group_ids"], row["group_versions"])),
+        )
 
-            # 🔒 HARD-SET group_id into the dict (even if DB / driver does something odd)
-            event_dict["group_id"] = event_dict.get("group_id") or group_id
+    finally:
+        cursor.close()
+        conn.close()
 
-            if event_dict.get("event_datetime_start") and isinstance(
-                event_dict["event_datetime_start"], datetime
-            ):
-                event_dict["event_datetime_start"] = event_dict[
-                    "event_datetime_start"
-                ].strftime("%Y-%m-%dT%H:%M:%SZ")
 
-            if event_dict.get("event_datetime_end") and isinstance(
-                event_dict["event_datetime_end"], datetime
-            ):
-                event_dict["event_datetime_end"] = event_dict[
-                    "event_datetime_end"
-                ].strftime("%Y-%m-%dT%H:%M:%SZ")
+def iter_calendar_events(
+    profile_id: int = None,
+    group_id: int = None,
+    since: Optional[datetime] = None,
+):
+    """
+    Stream the events of a profile's or group's calendar that end after
+    `since`, ordered by start, through a server-side cursor. Generated
+    expense events are skipped; feeds render recurring expenses themselves.
+    """
+    conn = get_connection()
+    # Named cursor: rows are fetched from the server in batches as the
+    # caller iterates instead of all at once
+    cursor = conn.cursor(name="calendar_events", cursor_factory=RealDictCursor)
+    cursor.itersize = 500
 
-            print(f"   Processed event to return: {event_dict}", flush=True)
-            result.append(event_dict)
+    try:
+        if group_id is not None:
+            scope_filter = "e.group_id = %(scope_id)s"
+        else:
+            scope_filter = """EXISTS (
+                SELECT 1 FROM ProfileEvent pe
+                WHERE pe.event_id = e.event_id AND pe.profile_id = %(scope_id)s
+            )"""
 
-        print(f"📤 Returning {len(result)} events", flush=True)
-        return result
+        cursor.execute(
+            f"""
+            SELECT
+                e.event_id,
+                e.event_name,
+                e.event_datetime_start,
+                e.event_datetime_end,
+                e.event_location,
+                e.event_notes,
+                e.group_id,
+                {RECURRENCE_COLUMNS}
+            FROM Event e
+            WHERE {scope_filter}
+              AND e.source_type IS NULL
+              AND e.event_period && tstzrange(%(since)s, NULL)
+            ORDER BY e.event_datetime_start
+            """,
+            {"scope_id": group_id if group_id is not None else profile_id, "since": since},
+        )
+        for row in cursor:
+            yield row
 
     finally:
         cursor.close()
         conn.close()
 
 
+@traced
 def delete_event(event_id: int) -> bool:
-    """Delete an event and its profile associations"""
+    """Delete an event; its profile associations go with it (ON DELETE CASCADE)"""
     conn = get_connection()
     cursor = conn.cursor()
 
     try:
-        cursor.execute(
-            "SELECT event_id FROM Event WHERE event_id = %s",
-            (event_id,),
-        )
-        event = cursor.fetchone()
+        cursor.execute("DELETE FROM Event WHERE event_id = %s", (event_id,))
+        deleted = cursor.rowcount > 0
+        conn.commit()
 
-        if not event:
-            print(f"❌ Event {event_id} not found in database")
-            conn.rollback()
-            return False
+        if not deleted:
+            logger.debug("Event %s not found", event_id)
+        return deleted
 
-        print(f"✅ Found event {event_id}, proceeding to delete")
+    except Exception as e:
+        logger.error("Error deleting event %s: %s", event_id, e)
+        conn.rollback()
+        raise e
+    finally:
+        cursor.close()
+        conn.close()
 
-        cursor.execute(
-            "DELETE FROM ProfileEvent WHERE event_id = %s",
-            (event_id,),
-        )
-        pe_deleted = cursor.rowcount
-        print(f"🗑️ Deleted {pe_deleted} ProfileEvent entries")
 
+@traced
+def delete_events(
+    profile_id: int,
+    event_ids: Optional[List[int]] = None,
+    group_id: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> dict:
+    """
+    Delete many events in one statement, either by id or every event of a
+    group starting within [start_date, end_date). Only events profile_id
+    takes part in or whose group it belongs to are deleted. Events
+    generated from expenses are kept out of range deletes, since the
+    expense calendar owns them.
+
+    Returns the ids deleted and how many events and profile links went.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    if event_ids is not None:
+        target = "e.event_id = ANY(%(event_ids)s)"
+    else:
+        target = """
+            e.group_id = %(group_id)s
+            AND e.event_period && tstzrange(%(start)s, %(end)s)
+            AND e.event_datetime_start >= %(start)s
+            AND e.event_datetime_start < %(end)s
+            AND e.source_type IS NULL
+        """
+
+    try:
+        # Every part of the statement sees the same snapshot, so the links
+        # counted are exactly those the cascade removes
         cursor.execute(
-            "DELETE FROM Event WHERE event_id = %s",
-            (event_id,),
+            f"""
+            WITH deleted AS (
+                DELETE FROM Event e
+                WHERE {target}
+                  AND (
+                      e.group_id IN (
+                          SELECT group_id FROM GroupProfile WHERE profile_id = %(profile_id)s
+                      )
+                      OR EXISTS (
+                          SELECT 1 FROM ProfileEvent pe
+                          WHERE pe.event_id = e.event_id AND pe.profile_id = %(profile_id)s
+                      )
+                  )
+                RETURNING e.event_id
+            )
+            SELECT
+                COALESCE(array_agg(event_id ORDER BY event_id), '{{}}') AS event_ids,
+                (SELECT count(*) FROM ProfileEvent pe
+                 WHERE pe.event_id IN (SELECT event_id FROM deleted)) AS links_deleted
+            FROM deleted
+            """,
+            {
+                "profile_id": profile_id,
+                "event_ids": event_ids,
+                "group_id": group_id,
+                "start": start_date,
+                "end": end_date,
+            },
         )
-        event_deleted = cursor.rowcount
-        print(f"🗑️ Deleted {event_deleted} Event entries")
-
+        row = cursor.fetchone()
         conn.commit()
-        return event_deleted > 0
+
+        logger.debug(
+            "Bulk deleted %d events (%d profile links) for profile %s",
+            len(row["event_ids"]), row["links_deleted"], profile_id,
+        )
+        return {
+            "event_ids": row["event_ids"],
+            "events_deleted": len(row["event_ids"]),
+            "profile_links_deleted": row["links_deleted"],
+        }
 
     except Exception as e:
-        print(f"❌ Error deleting event {event_id}: {e}")
+        logger.error("Error bulk deleting events: %s", e)
         conn.rollback()
         raise e
     finally:
         cursor.close()
-        conn.close()
\ No newline at end of file
+        conn.close()
@@ -1,24 +1,19 @@
+import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
 from backend.db.connection import get_connection
+from backend.db.tracing import traced
+from backend.db.recurring_expense_calendar import queue_calendar_sync
 from psycopg2.extras import RealDictCursor
 from typing import List, Dict
 
-# Import calendar integration
-try:
-    from backend.db.recurring_expense_calendar import (
-        create_calendar_events_for_recurring_expense,
-        delete_calendar_events_for_expense
-    )
-    CALENDAR_INTEGRATION_AVAILABLE = True
-except ImportError:
-    CALENDAR_INTEGRATION_AVAILABLE = False
-    print("Warning: Calendar integration not available")
+logger = logging.getLogger(__name__)
 
 # ============================================================
 # EXPENSE LIST OPERATIONS
 # ============================================================
 
+@traced
 def create_expense_list(group_id: int, list_name: str) -> dict:
     """Create a new expense list"""
     conn = get_connection()
@@ -36,6 +31,7 @@ def create_expense_list(group_id: int, list_name: str) -> dict:
         cur.close()
         conn.close()
 
+@traced
 def get_group_expense_lists(group_id: int) -> List[dict]:
     """Get all expense lists for a group"""
     conn = get_connection()
@@ -55,6 +51,7 @@ def get_group_expense_lists(group_id: int) -> List[dict]:
 # EXPENSE ITEM OPERATIONS
 # ============================================================
 
+@traced
 def create_expense_item(expense_data: dict, splits: List[dict]) -> dict:
     """Create expense and its splits in a transaction"""
     conn = get_connection()
@@ -90,14 +87,12 @@ def create_expense_item(expense_data: dict, splits: List[dict]) -> dict:
                 VALUES (%s, %s, %s)
             """, (item_id, split['profile_id'], split['amount_owed']))
         
-        conn.commit()
+        # Calendar events for recurring expenses are created from the outbox;
+        # writing it in this transaction means the sync can't be lost
+        if expense_data.get('is_recurring'):
+            queue_calendar_sync(cur, 'expense_created', item_id)
         
-        # Create calendar events for recurring expenses
-        if CALENDAR_INTEGRATION_AVAILABLE and expense_data.get('is_recurring'):
-            try:
-                create_calendar_events_for_recurring_expense(item_id, expense_data)
-            except Exception as e:
-                print(f"Failed to create calendar events: {e}")
+        conn.commit()
         
         return expense
     except Exception as e:
@@ -107,6 +102,7 @@ def create_expense_item(expense_data: dict, splits: List[dict]) -> dict:
         cur.close()
         conn.close()
 
+@traced
 def get_expense_with_splits(item_id: int) -> dict:
     """Get expense with all its splits"""
     conn = get_connection()
@@ -144,6 +140,7 @@ def get_expense_with_splits(item_id: int) -> dict:
         cur.close()
         conn.close()
 
+@traced
 def get_group_expenses(group_id: int, include_deleted: bool = False) -> List[dict]:
     """Get all expenses for a group"""
     conn = get_connection()
@@ -163,6 +160,7 @@ def get_group_expenses(group_id: int, include_deleted: bool = False) -> List[dic
         cur.close()
         conn.close()
 
+@traced
 def delete_expense(item_id: int) -> bool:
     """Soft delete an expense"""
     conn = get_connection()
@@ -173,16 +171,17 @@ def delete_expense(item_id: int) -> bool:
             SET is_deleted = TRUE 
             WHERE item_id = %s
         """, (item_id,))
-        conn.commit()
+        deleted = cur.rowcount > 0
         
-        # Delete associated calendar events
-        if CALENDAR_INTEGRATION_AVAILABLE:
-            try:
-                delete_calendar_events_for_expense(item_id)
-            except Exception as e:
-                print(f"Failed to delete calendar events: {e}")
+        # Associated calendar events are removed via the outbox
+        if deleted:
+            queue_calendar_sync(cur, 'expense_deleted', item_id)
         
-        return cur.rowcount > 0
+        conn.commit()
+        return deleted
+    except Exception:
+        conn.rollback()
+        raise
     finally:
         cur.close()
         conn.close()
@@ -191,6 +190,7 @@ def delete_expense(item_id: int) -> bool:
 # EXPENSE SPLIT OPERATIONS
 # ============================================================
 
+@traced
 def settle_split(split_id: int) -> dict:
     """Mark a split as settled"""
     conn = get_connection()
@@ -209,6 +209,7 @@ def settle_split(split_id: int) -> dict:
         cur.close()
         conn.close()
 
+@traced
 def get_user_splits(profile_id: int, group_id: int = None, settled: bool = None) -> List[dict]:
     """Get all splits involving a user, optionally filtered by group and settlement status"""
     conn = get_connection()
@@ -248,6 +249,7 @@ def get_user_splits(profile_id: int, group_id: int = None, settled: bool = None)
 # BALANCE CALCULATIONS
 # ============================================================
 
+@traced
 def get_user_balance(profile_id: int, group_id: int = None) -> dict:
     """Calculate user's balance (what they owe and are owed)"""
     conn = get_connection()
@@ -315,6 +317,7 @@ def get_user_balance(profile_id: int, group_id: int = None) -> dict:
         cur.close()
         conn.close()
 
+@traced
 def get_user_balances_by_person(profile_id: int, group_id: int = None) -> List[dict]:
     """Get breakdown of balances with each person"""
     conn = get_connection()
@@ -401,6 +404,7 @@ def get_user_balances_by_person(profile_id: int, group_id: int = None) -> List[d
 # STATISTICS
 # ============================================================
 
+@traced
 def get_expense_stats(profile_id: int, group_id: int = None, weeks: int = 4) -> dict:
     """Get expense statistics for charts"""
     conn = get_connection()
@@ -0,0 +1,141 @@
+"""
+Interval helpers for calendar computations (free/busy).
+
+Intervals are half-open (start, end) pairs of comparable values, normally
+datetimes. All functions are pure so they can be used on query results
+without touching the database.
+"""
+from collections import namedtuple
+from datetime import timedelta
+from operator import itemgetter
+from typing import Hashable, Iterable, List, Tuple
+
+BusyBlock = namedtuple("BusyBlock", "start end keys")
+FreeSlot = namedtuple("FreeSlot", "start end")
+
+
+def merge_intervals(intervals: Iterable[Tuple[object, object, Hashable]]) -> List[BusyBlock]:
+    """
+    Merge (start, end, key) intervals into disjoint busy blocks with a
+    sweep line. Each block lists the keys (e.g.
+    profile ids) that were busy at some point within it. Touching
+    intervals are merged; empty or inverted intervals are ignored.
+    """
+    # Sweep over intervals in start order, extending the current block while
+    # the next interval starts before (or exactly when) it ends. Input that
+    # is already ordered by start, e.g. from SQL, sorts in linear time.
+    ordered = sorted((iv for iv in intervals if iv[1] > iv[0]), key=itemgetter(0))
+
+    blocks = []
+    block_start = block_end = None
+    block_keys = set()
+    for start, end, key in ordered:
+        if block_end is not None and start <= block_end:
+            if end > block_end:
+                block_end = end
+        else:
+            if block_end is not None:
+                blocks.append(BusyBlock(block_start, block_end, sorted(block_keys)))
+            block_start, block_end, block_keys = start, end, set()
+        block_keys.add(key)
+    if block_end is not None:
+        blocks.append(BusyBlock(block_start, block_end, sorted(block_keys)))
+    return blocks
+
+
+def free_slots(
+    busy: List[BusyBlock],
+    window_start,
+    window_end,
+    min_duration: timedelta = timedelta(0),
+) -> List[FreeSlot]:
+    """
+    Gaps between sorted, disjoint busy blocks inside the window that are
+    at least min_duration long
+    """
+    slots = []
+    cursor = window_start
+    for block in busy:
+        if block.start >= window_end:
+            break
+        if block.start - cursor >= min_duration and block.start > cursor:
+            slots.append(FreeSlot(cursor, block.start))
+        cursor = max(cursor, block.end)
+    if window_end - cursor >= min_duration and window_end > cursor:
+        slots.append(FreeSlot(cursor, window_end))
+    return slots
+
+
+class IntervalTree:
+    """
+    Static centered interval tree over (start, end, value) intervals for
+    overlap queries in O(log n + matches)
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[object, object, object]]):
+        self._root = self._build([iv for iv in intervals if iv[1] > iv[0]])
+
+    @classmethod
+    def _build(cls, intervals):
+        if not intervals:
+            return None
+        starts = sorted(iv[0] for iv in intervals)
+        center = starts[len(starts) // 2]
+
+        left, right, here = [], [], []
+        for iv in intervals:
+            if iv[1] <= center:
+                left.append(iv)
+            elif iv[0] > center:
+                right.append(iv)
+            else:
+                here.append(iv)
+
+        # Intervals containing the center, by start ascending and end descending
+        by_start = sorted(here, key=itemgetter(0))
+        by_end = sorted(here, key=itemgetter(1), reverse=True)
+        return (center, by_start, by_end, cls._build(left), cls._build(right))
+
+    def overlapping(self, start, end) -> List[tuple]:
+        """Intervals that overlap [start, end)"""
+        found = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            center, by_start, by_end, left, right = node
+            if end <= center:
+                for iv in by_start:
+                    if iv[0] >= end:
+                        break
+                    found.append(iv)
+                stack.append(left)
+            elif start > center:
+                for iv in by_end:
+                    if iv[1] <= start:
+                        break
+                    found.append(iv)
+                stack.append(right)
+            else:
+                found.extend(by_start)
+                stack.append(left)
+                stack.append(right)
+        return found
+
+
+def overlapping_pairs(intervals: List[Tuple[object, object, Hashable]]) -> List[Tuple[Hashable, Hashable]]:
+    """
+    Every pair of values whose intervals overlap, found with one tree query
+    per interval. Each pair is returned once, in input order.
+    """
+    intervals = [iv for iv in intervals if iv[1] > iv[0]]
+    position = {iv[2]: i for i, iv in enumerate(intervals)}
+    tree = IntervalTree(intervals)
+
+    pairs = []
+    for i, (start, end, value) in enumerate(intervals):
+        for other in tree.overlapping(start, end):
+            if position[other[2]] > i:
+                pairs.append((value, other[2]))
+    return pairs
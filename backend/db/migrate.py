@@ -0,0 +1,331 @@
+"""
+Versioned schema migrations.
+
+Migrations are the numbered .sql files in backend/db/migrations, applied in
+order and recorded in schema_migrations. Each one runs in its own
+transaction unless its first line is "-- migrate: no-transaction" (needed
+for CREATE INDEX CONCURRENTLY), in which case its statements are run one by
+one in autocommit mode and must be idempotent.
+
+Usage:
+    python -m backend.db.migrate            apply pending migrations
+    python -m backend.db.migrate --status   list applied/pending migrations
+    python -m backend.db.migrate --verify   check indexes are valid and used
+"""
+import argparse
+import hashlib
+import json
+import re
+import sys
+from collections import namedtuple
+from pathlib import Path
+from typing import List
+
+from backend.db.connection import get_connection
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+NO_TRANSACTION_MARKER = "-- migrate: no-transaction"
+
+# Arbitrary key so only one process migrates at a time
+MIGRATION_LOCK_ID = 4_242_001
+
+Migration = namedtuple("Migration", "version name sql checksum transactional")
+
+VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INTEGER PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    checksum VARCHAR(64) NOT NULL,
+    applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+)
+"""
+
+# (description, query, index the plan must use). Checked with sequential
+# scans disabled, so small development databases still prove the index is
+# usable for the query shape.
+PLAN_CHECKS = [
+    (
+        "groups for a profile",
+        "SELECT group_id FROM groupprofile WHERE profile_id = 1",
+        "idx_groupprofile_profile",
+    ),
+    (
+        "items on a shopping list",
+        "SELECT item_id FROM shopping_item WHERE list_id = 1",
+        "idx_shopping_item_list",
+    ),
+    (
+        "group chores by due date",
+        "SELECT chore_id FROM chore WHERE group_id = 1 ORDER BY due_date",
+        "idx_chore_group_due",
+    ),
+    (
+        "settled splits for a profile",
+        "SELECT amount_owed FROM expense_split WHERE profile_id = 1 AND is_settled = TRUE",
+        "idx_expense_split_profile_settled",
+    ),
+    (
+        "open splits owed by a profile",
+        "SELECT SUM(amount_owed) FROM expense_split WHERE profile_id = 1 AND is_settled = FALSE",
+        "idx_expense_split_open_profile",
+    ),
+    (
+        "live expenses paid by a profile",
+        "SELECT item_id FROM expense_item WHERE paid_by_id = 1 AND is_deleted = FALSE",
+        "idx_expense_item_live_payer",
+    ),
+    (
+        "live expenses of a list",
+        "SELECT item_id FROM expense_item WHERE list_id = 1 AND is_deleted = FALSE ORDER BY date_created DESC",
+        "idx_expense_item_live_list",
+    ),
+    (
+        "events in a calendar window",
+        "SELECT event_id FROM event WHERE event_period && tstzrange('2025-01-01', '2025-02-01')",
+        "idx_event_period",
+    ),
+    (
+        "events generated by an expense",
+        "SELECT event_id FROM event WHERE source_type = 'expense' AND source_id = 1",
+        "idx_event_source",
+    ),
+    (
+        "participants of an event",
+        "SELECT profile_id FROM profileevent WHERE event_id = 1",
+        "idx_profileevent_event",
+    ),
+    (
+        "pending assignments not yet in an overdue digest",
+        "SELECT chore_id FROM choreassignee WHERE individual_status = 'pending' AND digested_at IS NULL",
+        "idx_chore_assignee_undigested",
+    ),
+    (
+        "pending chores of a profile",
+        "SELECT chore_id FROM choreassignee WHERE profile_id = 1 AND individual_status = 'pending'",
+        "idx_chore_assignee_profile_status",
+    ),
+]
+
+
+def discover_migrations() -> List[Migration]:
+    """Load migrations from MIGRATIONS_DIR, ordered by version"""
+    migrations = []
+    for path in sorted(MIGRATIONS_DIR.glob("*.sql")):
+        match = re.match(r"^(\d+)_(.+)\.sql$", path.name)
+        if not match:
+            continue
+        sql = path.read_text()
+        migrations.append(Migration(
+            version=int(match.group(1)),
+            name=match.group(2),
+            sql=sql,
+            checksum=hashlib.sha256(sql.encode()).hexdigest(),
+            transactional=not sql.lstrip().startswith(NO_TRANSACTION_MARKER),
+        ))
+
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError("Duplicate migration version numbers")
+    return migrations
+
+
+def split_statements(sql: str) -> List[str]:
+    """
+    Split a script into statements on semicolons, ignoring those inside
+    quotes, dollar-quoted bodies and comments
+    """
+    statements, current = [], []
+    i, quote = 0, None
+    while i < len(sql):
+        ch = sql[i]
+        if quote:
+            if sql.startswith(quote, i):
+                current.append(quote)
+                i += len(quote)
+                quote = None
+                continue
+        elif sql.startswith("--", i):
+            end = sql.find("\n", i)
+            i = len(sql) if end == -1 else end
+            continue
+        elif ch == "'":
+            quote = "'"
+        elif ch == "$":
+            tag = re.match(r"\$[A-Za-z_]*\$", sql[i:])
+            if tag:
+                quote = tag.group(0)
+                current.append(quote)
+                i += len(quote)
+                continue
+        elif ch == ";":
+            statement = "".join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+            i += 1
+            continue
+        current.append(ch)
+        i += 1
+
+    statement = "".join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+
+def _applied_migrations(cur) -> dict:
+    cur.execute("SELECT version, checksum FROM schema_migrations")
+    return {row['version']: row['checksum'] for row in cur.fetchall()}
+
+
+def run_migrations(target: int = None) -> List[int]:
+    """
+    Apply pending migrations up to `target` (default: all).
+    Returns the versions that were applied.
+    """
+    conn = get_connection()
+    conn.autocommit = True
+    cur = conn.cursor()
+    applied_now = []
+
+    try:
+        cur.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_ID,))
+        cur.execute(VERSION_TABLE)
+        applied = _applied_migrations(cur)
+
+        for migration in discover_migrations():
+            if target is not None and migration.version > target:
+                break
+
+            if migration.version in applied:
+                if applied[migration.version] != migration.checksum:
+                    print(f"Warning: migration {migration.version}_{migration.name} "
+                          f"changed after it was applied")
+                continue
+
+            print(f"Applying {migration.version:04d}_{migration.name}...")
+            if migration.transactional:
+                conn.autocommit = False
+                try:
+                    cur.execute(migration.sql)
+                    _record(cur, migration)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    conn.autocommit = True
+            else:
+                for statement in split_statements(migration.sql):
+                    cur.execute(statement)
+                _record(cur, migration)
+
+            applied_now.append(migration.version)
+
+        print(f"Applied {len(applied_now)} migration(s)")
+        return applied_now
+
+    finally:
+        cur.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_ID,))
+        cur.close()
+        conn.close()
+
+
+def _record(cur, migration: Migration):
+    cur.execute("""
+        INSERT INTO schema_migrations (version, name, checksum)
+        VALUES (%s, %s, %s)
+    """, (migration.version, migration.name, migration.checksum))
+
+
+def migration_status() -> List[dict]:
+    """List every known migration and whether it has been applied"""
+    conn = get_connection()
+    cur = conn.cursor()
+    try:
+        cur.execute(VERSION_TABLE)
+        conn.commit()
+        applied = _applied_migrations(cur)
+        return [
+            {
+                "version": m.version,
+                "name": m.name,
+                "applied": m.version in applied,
+                "modified": m.version in applied and applied[m.version] != m.checksum,
+            }
+            for m in discover_migrations()
+        ]
+    finally:
+        cur.close()
+        conn.close()
+
+
+def _plan_uses_index(plan: dict, index_name: str) -> bool:
+    if plan.get("Index Name") == index_name:
+        return True
+    return any(_plan_uses_index(child, index_name) for child in plan.get("Plans", []))
+
+
+def verify_schema() -> bool:
+    """
+    Check that no index was left invalid by a failed concurrent build and
+    that each PLAN_CHECKS query can use its index. Prints a report and
+    returns True if everything passed.
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+    ok = True
+    try:
+        cur.execute("""
+            SELECT c.relname AS index_name
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE NOT i.indisvalid AND n.nspname = current_schema()
+        """)
+        for row in cur.fetchall():
+            ok = False
+            print(f"INVALID  index {row['index_name']} (drop it and re-run migrations)")
+
+        cur.execute("SET LOCAL enable_seqscan = off")
+        for description, query, index_name in PLAN_CHECKS:
+            cur.execute(f"EXPLAIN (FORMAT JSON) {query}")
+            plan = cur.fetchone()['QUERY PLAN']
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            used = _plan_uses_index(plan[0]["Plan"], index_name)
+            ok = ok and used
+            print(f"{'OK' if used else 'MISSING':8} {description}: {index_name}")
+
+        return ok
+    finally:
+        conn.rollback()
+        cur.close()
+        conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply database migrations")
+    parser.add_argument("--target", type=int, help="migrate up to this version")
+    parser.add_argument("--status", action="store_true", help="show migration status and exit")
+    parser.add_argument("--verify", action="store_true", help="verify indexes after migrating")
+    args = parser.parse_args(argv)
+
+    if args.status:
+        for m in migration_status():
+            state = "applied" if m["applied"] else "pending"
+            if m["modified"]:
+                state += " (modified)"
+            print(f"{m['version']:04d}_{m['name']}: {state}")
+        return 0
+
+    run_migrations(args.target)
+
+    if args.verify and not verify_schema():
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+-- Baseline schema, consolidated from the old per-feature setup scripts.
+-- Everything is IF NOT EXISTS so it can be applied to databases that were
+-- created by those scripts.
+
+-- ==================== PROFILES & GROUPS ====================
+
+CREATE TABLE IF NOT EXISTS Profile (
+    profile_id SERIAL PRIMARY KEY,
+    profile_name VARCHAR(100) NOT NULL,
+    date_created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    email VARCHAR(255) UNIQUE NOT NULL,
+    password_hash VARCHAR(255) NOT NULL,
+    picture VARCHAR(255),
+    birthday DATE,
+    phone VARCHAR(20)
+);
+
+CREATE TABLE IF NOT EXISTS "Group" (
+    group_id SERIAL PRIMARY KEY,
+    group_name VARCHAR(100) NOT NULL,
+    date_created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    group_photo VARCHAR(255),
+    join_code VARCHAR(20) UNIQUE NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS GroupProfile (
+    group_id INTEGER NOT NULL,
+    profile_id INTEGER NOT NULL,
+    role VARCHAR(20) DEFAULT 'member' CHECK (role IN ('creator', 'member')),
+    joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (group_id, profile_id),
+    FOREIGN KEY (group_id) REFERENCES "Group"(group_id) ON DELETE CASCADE,
+    FOREIGN KEY (profile_id) REFERENCES Profile(profile_id) ON DELETE CASCADE
+);
+
+-- ==================== EVENTS ====================
+
+CREATE TABLE IF NOT EXISTS Event (
+    event_id SERIAL PRIMARY KEY,
+    event_name VARCHAR(100) NOT NULL,
+    event_datetime_start TIMESTAMPTZ NOT NULL,
+    event_datetime_end TIMESTAMPTZ,
+    event_location VARCHAR(255),
+    event_notes TEXT,
+    group_id INTEGER,
+    FOREIGN KEY (group_id) REFERENCES "Group"(group_id) ON DELETE SET NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_event_group_id ON Event(group_id);
+
+CREATE TABLE IF NOT EXISTS ProfileEvent (
+    profile_id INTEGER NOT NULL,
+    event_id INTEGER NOT NULL,
+    PRIMARY KEY (profile_id, event_id),
+    FOREIGN KEY (profile_id) REFERENCES Profile(profile_id) ON DELETE CASCADE,
+    FOREIGN KEY (event_id) REFERENCES Event(event_id) ON DELETE CASCADE
+);
+
+-- ==================== CHORES ====================
+
+CREATE TABLE IF NOT EXISTS Chore (
+    chore_id SERIAL PRIMARY KEY,
+    group_id INTEGER NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    assigned_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    due_date TIMESTAMP,
+    notes TEXT,
+    FOREIGN KEY (group_id) REFERENCES "Group"(group_id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS ChoreAssignee (
+    profile_id INTEGER NOT NULL,
+    chore_id INTEGER NOT NULL,
+    individual_status VARCHAR(20) DEFAULT 'pending' CHECK (individual_status IN ('pending', 'completed')),
+    PRIMARY KEY (profile_id, chore_id),
+    FOREIGN KEY (profile_id) REFERENCES Profile(profile_id) ON DELETE CASCADE,
+    FOREIGN KEY (chore_id) REFERENCES Chore(chore_id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_chore_group_id ON Chore(group_id);
+CREATE INDEX IF NOT EXISTS idx_chore_due_date ON Chore(due_date);
+CREATE INDEX IF NOT EXISTS idx_chore_assignee_profile ON ChoreAssignee(profile_id);
+CREATE INDEX IF NOT EXISTS idx_chore_assignee_chore ON ChoreAssignee(chore_id);
+
+-- ==================== SHOPPING LISTS ====================
+
+CREATE TABLE IF NOT EXISTS shopping_list (
+    list_id SERIAL PRIMARY KEY,
+    list_name VARCHAR(100) NOT NULL,
+    date_created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    date_completed TIMESTAMP,
+    group_id INTEGER NOT NULL,
+    FOREIGN KEY (group_id) REFERENCES "Group"(group_id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS shopping_item (
+    item_id SERIAL PRIMARY KEY,
+    item_name VARCHAR(100) NOT NULL,
+    list_id INTEGER NOT NULL,
+    quantity INTEGER DEFAULT 1,
+    added_by_id INTEGER NOT NULL,
+    date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_purchased BOOLEAN DEFAULT FALSE,
+    FOREIGN KEY (list_id) REFERENCES shopping_list(list_id) ON DELETE CASCADE,
+    FOREIGN KEY (added_by_id) REFERENCES Profile(profile_id) ON DELETE RESTRICT
+);
+
+-- ==================== EXPENSES ====================
+
+CREATE TABLE IF NOT EXISTS expense_list (
+    list_id SERIAL PRIMARY KEY,
+    list_name VARCHAR(100) NOT NULL,
+    group_id INTEGER NOT NULL,
+    date_created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    date_closed TIMESTAMP DEFAULT NULL,
+    FOREIGN KEY (group_id) REFERENCES "Group"(group_id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS expense_item (
+    item_id SERIAL PRIMARY KEY,
+    item_name VARCHAR(100) NOT NULL,
+    list_id INTEGER NOT NULL,
+    item_total_cost DECIMAL(10, 2) NOT NULL,
+    notes TEXT,
+    paid_by_id INTEGER NOT NULL,
+    date_created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_recurring BOOLEAN DEFAULT FALSE,
+    recurring_frequency VARCHAR(20) CHECK (recurring_frequency IN ('daily', 'weekly', 'monthly', 'yearly')),
+    recurring_end_date DATE,
+    is_deleted BOOLEAN DEFAULT FALSE,
+    FOREIGN KEY (list_id) REFERENCES expense_list(list_id) ON DELETE CASCADE,
+    FOREIGN KEY (paid_by_id) REFERENCES Profile(profile_id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS expense_split (
+    split_id SERIAL PRIMARY KEY,
+    item_id INTEGER NOT NULL,
+    profile_id INTEGER NOT NULL,
+    amount_owed DECIMAL(10, 2) NOT NULL,
+    is_settled BOOLEAN DEFAULT FALSE,
+    date_created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    date_settled TIMESTAMP,
+    FOREIGN KEY (item_id) REFERENCES expense_item(item_id) ON DELETE CASCADE,
+    FOREIGN KEY (profile_id) REFERENCES Profile(profile_id) ON DELETE CASCADE,
+    CONSTRAINT unique_item_profile UNIQUE(item_id, profile_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_expense_list_group ON expense_list(group_id);
+CREATE INDEX IF NOT EXISTS idx_expense_item_list ON expense_item(list_id);
+CREATE INDEX IF NOT EXISTS idx_expense_item_paid_by ON expense_item(paid_by_id);
+CREATE INDEX IF NOT EXISTS idx_expense_item_deleted ON expense_item(is_deleted);
+CREATE INDEX IF NOT EXISTS idx_expense_split_item ON expense_split(item_id);
+CREATE INDEX IF NOT EXISTS idx_expense_split_profile ON expense_split(profile_id);
+CREATE INDEX IF NOT EXISTS idx_expense_split_settled ON expense_split(is_settled);
+
+-- ==================== BACKGROUND WORK ====================
+
+CREATE TABLE IF NOT EXISTS calendar_outbox (
+    outbox_id BIGSERIAL PRIMARY KEY,
+    event_type VARCHAR(30) NOT NULL
+        CHECK (event_type IN ('expense_created', 'expense_deleted')),
+    item_id INTEGER NOT NULL,
+    -- 'dead' once MAX_OUTBOX_ATTEMPTS runs have failed; kept until retried
+    status VARCHAR(20) NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'dead')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    date_created TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_calendar_outbox_item ON calendar_outbox(item_id);
+CREATE INDEX IF NOT EXISTS idx_calendar_outbox_pending
+    ON calendar_outbox(outbox_id) WHERE status = 'pending';
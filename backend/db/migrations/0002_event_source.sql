@@ -0,0 +1,13 @@
+-- Reference generated events by (source_type, source_id) instead of
+-- matching event_location = 'EXPENSE:<id>'
+
+ALTER TABLE Event ADD COLUMN IF NOT EXISTS source_type VARCHAR(20);
+ALTER TABLE Event ADD COLUMN IF NOT EXISTS source_id INTEGER;
+
+CREATE INDEX IF NOT EXISTS idx_event_source ON Event(source_type, source_id);
+
+UPDATE Event
+SET source_type = 'expense',
+    source_id = substring(event_location FROM 9)::INTEGER
+WHERE source_type IS NULL
+  AND event_location ~ '^EXPENSE:[0-9]+$';
@@ -0,0 +1,25 @@
+-- migrate: no-transaction
+-- Indexes for lookups that previously had none. Built CONCURRENTLY so
+-- writes aren't blocked; this cannot run inside a transaction.
+
+-- "Which groups am I in?" (the primary key leads with group_id)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_groupprofile_profile
+    ON groupprofile(profile_id);
+
+-- Shopping lists per group and items per list
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_shopping_list_group
+    ON shopping_list(group_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_shopping_item_list
+    ON shopping_item(list_id);
+
+-- Group chore lists are ordered by due date
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chore_group_due
+    ON chore(group_id, due_date);
+
+-- A member's open splits
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_expense_split_profile_settled
+    ON expense_split(profile_id, is_settled);
+
+-- Superseded by the composite indexes above (same leading column)
+DROP INDEX CONCURRENTLY IF EXISTS idx_chore_group_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_expense_split_profile;
@@ -0,0 +1,32 @@
+-- migrate: no-transaction
+-- Partial, covering indexes for the balance and split queries in
+-- expense_queries, which only ever look at unsettled splits of live
+-- expenses. With the INCLUDE columns the balance sums can be answered by
+-- index-only scans.
+
+-- "What do I owe?": open splits by debtor
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_expense_split_open_profile
+    ON expense_split(profile_id) INCLUDE (item_id, amount_owed)
+    WHERE is_settled = FALSE;
+
+-- "What am I owed?": open splits of the expenses I paid
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_expense_split_open_item
+    ON expense_split(item_id) INCLUDE (profile_id, amount_owed)
+    WHERE is_settled = FALSE;
+
+-- Live expenses by payer, and by id when joining from a split
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_expense_item_live_payer
+    ON expense_item(paid_by_id) INCLUDE (item_id, list_id)
+    WHERE is_deleted = FALSE;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_expense_item_live_item
+    ON expense_item(item_id) INCLUDE (paid_by_id, list_id)
+    WHERE is_deleted = FALSE;
+
+-- Live expenses of a list, newest first
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_expense_item_live_list
+    ON expense_item(list_id, date_created DESC)
+    WHERE is_deleted = FALSE;
+
+-- Single-column boolean indexes are too unselective to be used
+DROP INDEX CONCURRENTLY IF EXISTS idx_expense_item_deleted;
+DROP INDEX CONCURRENTLY IF EXISTS idx_expense_split_settled;
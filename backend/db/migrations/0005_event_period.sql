@@ -0,0 +1,20 @@
+-- Store each event's time span as a range so calendar windows can be
+-- queried with overlap (&&) instead of only matching on the start time,
+-- which missed multi-day events starting before the window.
+--
+-- Events without an end are treated as instants; an end before the start
+-- is clamped rather than rejected. Adding a stored generated column
+-- rewrites the table, so run this outside peak hours on large databases.
+
+ALTER TABLE Event ADD COLUMN IF NOT EXISTS event_period TSTZRANGE
+    GENERATED ALWAYS AS (
+        tstzrange(
+            event_datetime_start,
+            GREATEST(COALESCE(event_datetime_end, event_datetime_start), event_datetime_start),
+            '[]'
+        )
+    ) STORED;
+
+-- Window lookups. Group calendars combine this with idx_event_group_id
+-- (bitmap AND), which avoids depending on the btree_gist extension.
+CREATE INDEX IF NOT EXISTS idx_event_period ON Event USING GIST (event_period);
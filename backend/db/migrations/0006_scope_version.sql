@@ -0,0 +1,149 @@
+-- Version counters for cached, per-scope views (calendar feeds). Triggers
+-- bump a scope's version whenever rows it depends on change, so a cached
+-- rendering is valid exactly as long as its version is current.
+--
+-- Triggers are statement-level with transition tables, so bulk inserts
+-- (e.g. generated expense events) bump each scope once per statement.
+
+CREATE TABLE IF NOT EXISTS scope_version (
+    scope_type VARCHAR(20) NOT NULL,
+    scope_id INTEGER NOT NULL,
+    version BIGINT NOT NULL DEFAULT 1,
+    PRIMARY KEY (scope_type, scope_id)
+);
+
+CREATE OR REPLACE FUNCTION bump_scope_version(p_scope_type TEXT, p_scope_ids INTEGER[])
+RETURNS VOID AS $$
+    INSERT INTO scope_version (scope_type, scope_id)
+    SELECT p_scope_type, id
+    FROM (SELECT DISTINCT unnest(p_scope_ids) AS id) ids
+    WHERE id IS NOT NULL
+    ORDER BY id  -- consistent lock order between concurrent bumps
+    ON CONFLICT (scope_type, scope_id)
+    DO UPDATE SET version = scope_version.version + 1;
+$$ LANGUAGE sql;
+
+-- ==================== EVENTS ====================
+-- A group's calendar changes with its events; a profile's calendar with
+-- the events linked to it (linking/unlinking is covered by ProfileEvent).
+
+CREATE OR REPLACE FUNCTION event_bump_versions() RETURNS TRIGGER AS $$
+DECLARE
+    changed_ids INTEGER[];
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM bump_scope_version('group', ARRAY(SELECT group_id FROM new_rows));
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM bump_scope_version('group', ARRAY(SELECT group_id FROM old_rows));
+    END IF;
+    IF TG_OP = 'UPDATE' THEN
+        changed_ids := ARRAY(SELECT event_id FROM new_rows);
+        PERFORM bump_scope_version('profile', ARRAY(
+            SELECT profile_id FROM ProfileEvent WHERE event_id = ANY(changed_ids)
+        ));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS event_versions_insert ON Event;
+CREATE TRIGGER event_versions_insert AFTER INSERT ON Event
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION event_bump_versions();
+
+DROP TRIGGER IF EXISTS event_versions_update ON Event;
+CREATE TRIGGER event_versions_update AFTER UPDATE ON Event
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION event_bump_versions();
+
+DROP TRIGGER IF EXISTS event_versions_delete ON Event;
+CREATE TRIGGER event_versions_delete AFTER DELETE ON Event
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION event_bump_versions();
+
+CREATE OR REPLACE FUNCTION profileevent_bump_versions() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM bump_scope_version('profile', ARRAY(SELECT profile_id FROM new_rows));
+    ELSE
+        PERFORM bump_scope_version('profile', ARRAY(SELECT profile_id FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS profileevent_versions_insert ON ProfileEvent;
+CREATE TRIGGER profileevent_versions_insert AFTER INSERT ON ProfileEvent
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION profileevent_bump_versions();
+
+DROP TRIGGER IF EXISTS profileevent_versions_delete ON ProfileEvent;
+CREATE TRIGGER profileevent_versions_delete AFTER DELETE ON ProfileEvent
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION profileevent_bump_versions();
+
+-- ==================== EXPENSES ====================
+-- Recurring expenses are rendered into the feeds of the expense's group.
+-- Profile feeds combine their own version with their groups' versions, so
+-- expense changes only need to bump the group.
+
+CREATE OR REPLACE FUNCTION expense_item_bump_versions() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM bump_scope_version('group', ARRAY(
+            SELECT el.group_id FROM new_rows n
+            JOIN expense_list el ON el.list_id = n.list_id
+            WHERE n.is_recurring
+        ));
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM bump_scope_version('group', ARRAY(
+            SELECT el.group_id FROM old_rows o
+            JOIN expense_list el ON el.list_id = o.list_id
+            WHERE o.is_recurring
+        ));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS expense_item_versions_insert ON expense_item;
+CREATE TRIGGER expense_item_versions_insert AFTER INSERT ON expense_item
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION expense_item_bump_versions();
+
+DROP TRIGGER IF EXISTS expense_item_versions_update ON expense_item;
+CREATE TRIGGER expense_item_versions_update AFTER UPDATE ON expense_item
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION expense_item_bump_versions();
+
+DROP TRIGGER IF EXISTS expense_item_versions_delete ON expense_item;
+CREATE TRIGGER expense_item_versions_delete AFTER DELETE ON expense_item
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION expense_item_bump_versions();
+
+-- ==================== MEMBERSHIP ====================
+-- Joining or leaving a group changes which recurring expenses appear in
+-- the member's profile feed.
+
+CREATE OR REPLACE FUNCTION groupprofile_bump_versions() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM bump_scope_version('profile', ARRAY(SELECT profile_id FROM new_rows));
+    ELSE
+        PERFORM bump_scope_version('profile', ARRAY(SELECT profile_id FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS groupprofile_versions_insert ON GroupProfile;
+CREATE TRIGGER groupprofile_versions_insert AFTER INSERT ON GroupProfile
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION groupprofile_bump_versions();
+
+DROP TRIGGER IF EXISTS groupprofile_versions_delete ON GroupProfile;
+CREATE TRIGGER groupprofile_versions_delete AFTER DELETE ON GroupProfile
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION groupprofile_bump_versions();
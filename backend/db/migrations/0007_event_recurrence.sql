@@ -0,0 +1,36 @@
+-- Recurrence rules for user events. A recurring event is stored once, with
+-- its first occurrence in event_datetime_start/end, and expanded per query
+-- window by backend/db/recurrence.py.
+--
+-- recurrence_end is the end of the last occurrence (NULL while the series
+-- is unbounded), computed by the application because it cannot be derived
+-- with immutable expressions. event_period is redefined to span the whole
+-- series so window queries find every series with an occurrence in range.
+
+ALTER TABLE Event ADD COLUMN IF NOT EXISTS recurrence_freq VARCHAR(10)
+    CHECK (recurrence_freq IN ('daily', 'weekly', 'monthly'));
+ALTER TABLE Event ADD COLUMN IF NOT EXISTS recurrence_interval INTEGER NOT NULL DEFAULT 1
+    CHECK (recurrence_interval >= 1);
+ALTER TABLE Event ADD COLUMN IF NOT EXISTS recurrence_count INTEGER
+    CHECK (recurrence_count >= 1);
+ALTER TABLE Event ADD COLUMN IF NOT EXISTS recurrence_until TIMESTAMPTZ;
+ALTER TABLE Event ADD COLUMN IF NOT EXISTS recurrence_exdates TIMESTAMPTZ[] NOT NULL DEFAULT '{}';
+ALTER TABLE Event ADD COLUMN IF NOT EXISTS recurrence_end TIMESTAMPTZ;
+
+-- Dropping the generated column also drops idx_event_period
+ALTER TABLE Event DROP COLUMN IF EXISTS event_period;
+
+ALTER TABLE Event ADD COLUMN event_period TSTZRANGE
+    GENERATED ALWAYS AS (
+        CASE WHEN recurrence_freq IS NULL THEN
+            tstzrange(
+                event_datetime_start,
+                GREATEST(COALESCE(event_datetime_end, event_datetime_start), event_datetime_start),
+                '[]'
+            )
+        ELSE
+            tstzrange(event_datetime_start, recurrence_end, '[]')
+        END
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_event_period ON Event USING GIST (event_period);
@@ -0,0 +1,7 @@
+-- migrate: no-transaction
+-- ProfileEvent's key leads with profile_id, so nothing indexed its
+-- event_id: every deleted Event made the ON DELETE CASCADE scan the whole
+-- table, which made deleting many events at once quadratic. The event's
+-- participant lookups use it too.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_profileevent_event
+    ON ProfileEvent(event_id);
@@ -0,0 +1,44 @@
+-- migrate: no-transaction
+-- Recurring chores. A template holds the schedule and rotation policy; the
+-- chore scheduler (backend/db/chore_templates.py) materializes its
+-- occurrences as ordinary Chore rows, but only for a rolling horizon, so
+-- Chore holds the upcoming weeks rather than every future occurrence.
+
+CREATE TABLE IF NOT EXISTS chore_template (
+    template_id SERIAL PRIMARY KEY,
+    group_id INTEGER NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    notes TEXT,
+    frequency VARCHAR(10) NOT NULL CHECK (frequency IN ('daily', 'weekly', 'monthly')),
+    repeat_interval INTEGER NOT NULL DEFAULT 1 CHECK (repeat_interval >= 1),
+    -- Due date of the first occurrence; later ones keep its time of day
+    starts_on TIMESTAMP NOT NULL,
+    ends_on TIMESTAMP,
+    rotation VARCHAR(20) NOT NULL DEFAULT 'round_robin'
+        CHECK (rotation IN ('round_robin', 'least_loaded', 'random_fair')),
+    assignees_per_occurrence INTEGER NOT NULL DEFAULT 1 CHECK (assignees_per_occurrence >= 1),
+    -- Rotation pool in order; empty means every member of the group
+    member_ids INTEGER[] NOT NULL DEFAULT '{}',
+    -- Next position in the pool for round_robin
+    rotation_index INTEGER NOT NULL DEFAULT 0,
+    -- Occurrences due up to here have been materialized
+    materialized_until TIMESTAMP,
+    is_active BOOLEAN NOT NULL DEFAULT TRUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (group_id) REFERENCES "Group"(group_id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_chore_template_group ON chore_template(group_id);
+
+-- Templates the scheduler still has to top up
+CREATE INDEX IF NOT EXISTS idx_chore_template_pending
+    ON chore_template(materialized_until NULLS FIRST)
+    WHERE is_active;
+
+ALTER TABLE Chore ADD COLUMN IF NOT EXISTS template_id INTEGER
+    REFERENCES chore_template(template_id) ON DELETE SET NULL;
+
+-- One chore per template and due date, which makes materializing
+-- idempotent (INSERT ... ON CONFLICT DO NOTHING)
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_chore_template_due
+    ON Chore(template_id, due_date);
@@ -0,0 +1,144 @@
+-- Effort-weighted workload per group member, kept up to date by triggers
+-- so chores can be auto-assigned to whoever has done the least without
+-- re-aggregating ChoreAssignee history on every assignment.
+--
+-- A member's workload is the effort of every chore assigned to them in
+-- the group, split into what is still open and what they completed.
+
+ALTER TABLE Chore ADD COLUMN IF NOT EXISTS effort INTEGER NOT NULL DEFAULT 1
+    CHECK (effort BETWEEN 1 AND 10);
+ALTER TABLE chore_template ADD COLUMN IF NOT EXISTS effort INTEGER NOT NULL DEFAULT 1
+    CHECK (effort BETWEEN 1 AND 10);
+
+CREATE TABLE IF NOT EXISTS chore_workload (
+    group_id INTEGER NOT NULL,
+    profile_id INTEGER NOT NULL,
+    open_effort INTEGER NOT NULL DEFAULT 0,
+    completed_effort INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (group_id, profile_id),
+    FOREIGN KEY (group_id) REFERENCES "Group"(group_id) ON DELETE CASCADE,
+    FOREIGN KEY (profile_id) REFERENCES Profile(profile_id) ON DELETE CASCADE
+);
+
+-- Backfill from existing assignments
+INSERT INTO chore_workload (group_id, profile_id, open_effort, completed_effort)
+SELECT c.group_id, ca.profile_id,
+       COALESCE(SUM(c.effort) FILTER (WHERE ca.individual_status = 'pending'), 0),
+       COALESCE(SUM(c.effort) FILTER (WHERE ca.individual_status = 'completed'), 0)
+FROM ChoreAssignee ca
+JOIN Chore c ON c.chore_id = ca.chore_id
+GROUP BY c.group_id, ca.profile_id
+ON CONFLICT (group_id, profile_id) DO UPDATE
+SET open_effort = EXCLUDED.open_effort, completed_effort = EXCLUDED.completed_effort;
+
+DO $$
+BEGIN
+    CREATE TYPE chore_workload_change AS (
+        group_id INTEGER,
+        profile_id INTEGER,
+        effort INTEGER,
+        status VARCHAR(20)
+    );
+EXCEPTION WHEN duplicate_object THEN NULL;
+END;
+$$;
+
+-- Add (p_sign = 1) or remove (p_sign = -1) assignments from the counters
+CREATE OR REPLACE FUNCTION apply_chore_workload(p_changes chore_workload_change[], p_sign INTEGER)
+RETURNS VOID AS $$
+    INSERT INTO chore_workload AS w (group_id, profile_id, open_effort, completed_effort)
+    SELECT group_id, profile_id,
+           p_sign * COALESCE(SUM(effort) FILTER (WHERE status = 'pending'), 0),
+           p_sign * COALESCE(SUM(effort) FILTER (WHERE status = 'completed'), 0)
+    FROM unnest(p_changes) AS c
+    -- Skip counters of a group or profile being deleted in this statement
+    WHERE EXISTS (SELECT 1 FROM "Group" g WHERE g.group_id = c.group_id)
+      AND EXISTS (SELECT 1 FROM Profile p WHERE p.profile_id = c.profile_id)
+    GROUP BY group_id, profile_id
+    ORDER BY group_id, profile_id  -- consistent lock order between concurrent updates
+    ON CONFLICT (group_id, profile_id) DO UPDATE
+    SET open_effort = w.open_effort + EXCLUDED.open_effort,
+        completed_effort = w.completed_effort + EXCLUDED.completed_effort;
+$$ LANGUAGE sql;
+
+-- ==================== ASSIGNMENTS ====================
+-- When a chore is deleted its assignees are removed by the cascade after
+-- the chore row is gone, so those rows are skipped here (they do not join
+-- Chore) and accounted for by chore_workload_delete below instead.
+
+CREATE OR REPLACE FUNCTION choreassignee_workload() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM apply_chore_workload(ARRAY(
+            SELECT ROW(c.group_id, o.profile_id, c.effort, o.individual_status)::chore_workload_change
+            FROM old_rows o JOIN Chore c ON c.chore_id = o.chore_id
+        ), -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM apply_chore_workload(ARRAY(
+            SELECT ROW(c.group_id, n.profile_id, c.effort, n.individual_status)::chore_workload_change
+            FROM new_rows n JOIN Chore c ON c.chore_id = n.chore_id
+        ), 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS choreassignee_workload_insert ON ChoreAssignee;
+CREATE TRIGGER choreassignee_workload_insert AFTER INSERT ON ChoreAssignee
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION choreassignee_workload();
+
+DROP TRIGGER IF EXISTS choreassignee_workload_update ON ChoreAssignee;
+CREATE TRIGGER choreassignee_workload_update AFTER UPDATE ON ChoreAssignee
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION choreassignee_workload();
+
+DROP TRIGGER IF EXISTS choreassignee_workload_delete ON ChoreAssignee;
+CREATE TRIGGER choreassignee_workload_delete AFTER DELETE ON ChoreAssignee
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION choreassignee_workload();
+
+-- ==================== CHORES ====================
+-- Changing a chore's effort or group moves its assignees' workload
+
+CREATE OR REPLACE FUNCTION chore_workload_update() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM apply_chore_workload(ARRAY(
+        SELECT ROW(o.group_id, ca.profile_id, o.effort, ca.individual_status)::chore_workload_change
+        FROM old_rows o
+        JOIN new_rows n ON n.chore_id = o.chore_id
+        JOIN ChoreAssignee ca ON ca.chore_id = o.chore_id
+        WHERE (n.effort, n.group_id) IS DISTINCT FROM (o.effort, o.group_id)
+    ), -1);
+    PERFORM apply_chore_workload(ARRAY(
+        SELECT ROW(n.group_id, ca.profile_id, n.effort, ca.individual_status)::chore_workload_change
+        FROM old_rows o
+        JOIN new_rows n ON n.chore_id = o.chore_id
+        JOIN ChoreAssignee ca ON ca.chore_id = n.chore_id
+        WHERE (n.effort, n.group_id) IS DISTINCT FROM (o.effort, o.group_id)
+    ), 1);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS chore_workload_update ON Chore;
+CREATE TRIGGER chore_workload_update AFTER UPDATE ON Chore
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION chore_workload_update();
+
+-- Row-level and BEFORE, while the chore's assignees still exist
+CREATE OR REPLACE FUNCTION chore_workload_delete() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM apply_chore_workload(ARRAY(
+        SELECT ROW(OLD.group_id, ca.profile_id, OLD.effort, ca.individual_status)::chore_workload_change
+        FROM ChoreAssignee ca
+        WHERE ca.chore_id = OLD.chore_id
+    ), -1);
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS chore_workload_delete ON Chore;
+CREATE TRIGGER chore_workload_delete BEFORE DELETE ON Chore
+    FOR EACH ROW EXECUTE FUNCTION chore_workload_delete();
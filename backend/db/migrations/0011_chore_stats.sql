@@ -0,0 +1,117 @@
+-- Chore completion stats per group member for the leaderboard, kept as
+-- counters by triggers so the leaderboard never scans assignment history.
+--
+-- chore_stats holds running totals: completions, how many were on time or
+-- after the due date, and the current and best run of on-time
+-- completions. chore_stats_weekly holds per-week totals for closed weeks,
+-- rolled up periodically from completed_at (backend/db/chore_stats.py).
+
+ALTER TABLE ChoreAssignee ADD COLUMN IF NOT EXISTS completed_at TIMESTAMP;
+
+CREATE INDEX IF NOT EXISTS idx_chore_assignee_completed_at
+    ON ChoreAssignee(completed_at)
+    WHERE completed_at IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS chore_stats (
+    group_id INTEGER NOT NULL,
+    profile_id INTEGER NOT NULL,
+    completed_count INTEGER NOT NULL DEFAULT 0,
+    on_time_count INTEGER NOT NULL DEFAULT 0,
+    overdue_count INTEGER NOT NULL DEFAULT 0,
+    current_streak INTEGER NOT NULL DEFAULT 0,
+    best_streak INTEGER NOT NULL DEFAULT 0,
+    last_completed_at TIMESTAMP,
+    PRIMARY KEY (group_id, profile_id),
+    FOREIGN KEY (group_id) REFERENCES "Group"(group_id) ON DELETE CASCADE,
+    FOREIGN KEY (profile_id) REFERENCES Profile(profile_id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS chore_stats_weekly (
+    group_id INTEGER NOT NULL,
+    week_start DATE NOT NULL,
+    profile_id INTEGER NOT NULL,
+    completed_count INTEGER NOT NULL DEFAULT 0,
+    on_time_count INTEGER NOT NULL DEFAULT 0,
+    overdue_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (group_id, week_start, profile_id),
+    FOREIGN KEY (group_id) REFERENCES "Group"(group_id) ON DELETE CASCADE,
+    FOREIGN KEY (profile_id) REFERENCES Profile(profile_id) ON DELETE CASCADE
+);
+
+-- Progress of incremental periodic tasks, e.g. the last week rolled up
+CREATE TABLE IF NOT EXISTS task_watermark (
+    task_name VARCHAR(50) PRIMARY KEY,
+    watermark TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Completions from before completed_at existed count as on time
+INSERT INTO chore_stats (group_id, profile_id, completed_count, on_time_count)
+SELECT c.group_id, ca.profile_id, count(*), count(*)
+FROM ChoreAssignee ca
+JOIN Chore c ON c.chore_id = ca.chore_id
+WHERE ca.individual_status = 'completed'
+GROUP BY c.group_id, ca.profile_id
+ON CONFLICT (group_id, profile_id) DO NOTHING;
+
+-- Stamp completions as they happen
+CREATE OR REPLACE FUNCTION choreassignee_completed_at() RETURNS TRIGGER AS $$
+BEGIN
+    NEW.completed_at := CASE WHEN NEW.individual_status = 'completed' THEN LOCALTIMESTAMP END;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS choreassignee_completed_at ON ChoreAssignee;
+CREATE TRIGGER choreassignee_completed_at BEFORE UPDATE OF individual_status ON ChoreAssignee
+    FOR EACH ROW
+    WHEN (OLD.individual_status IS DISTINCT FROM NEW.individual_status)
+    EXECUTE FUNCTION choreassignee_completed_at();
+
+-- Row-level since a streak depends on the order of completions. Undoing a
+-- completion takes it back out of the totals and, if it was on time, off
+-- the current streak.
+CREATE OR REPLACE FUNCTION choreassignee_stats() RETURNS TRIGGER AS $$
+DECLARE
+    v_group_id INTEGER;
+    v_due_date TIMESTAMP;
+    v_on_time BOOLEAN;
+BEGIN
+    SELECT group_id, due_date INTO v_group_id, v_due_date
+    FROM Chore WHERE chore_id = NEW.chore_id;
+
+    IF NEW.individual_status = 'completed' THEN
+        v_on_time := v_due_date IS NULL OR NEW.completed_at <= v_due_date;
+        INSERT INTO chore_stats AS s (group_id, profile_id, completed_count, on_time_count,
+                                      overdue_count, current_streak, best_streak,
+                                      last_completed_at)
+        VALUES (v_group_id, NEW.profile_id, 1, v_on_time::int, (NOT v_on_time)::int,
+                v_on_time::int, v_on_time::int, NEW.completed_at)
+        ON CONFLICT (group_id, profile_id) DO UPDATE SET
+            completed_count = s.completed_count + 1,
+            on_time_count = s.on_time_count + EXCLUDED.on_time_count,
+            overdue_count = s.overdue_count + EXCLUDED.overdue_count,
+            current_streak = CASE WHEN v_on_time THEN s.current_streak + 1 ELSE 0 END,
+            best_streak = GREATEST(s.best_streak,
+                                   CASE WHEN v_on_time THEN s.current_streak + 1 ELSE 0 END),
+            last_completed_at = EXCLUDED.last_completed_at;
+    ELSIF OLD.individual_status = 'completed' THEN
+        v_on_time := v_due_date IS NULL OR OLD.completed_at IS NULL
+                     OR OLD.completed_at <= v_due_date;
+        UPDATE chore_stats SET
+            completed_count = GREATEST(completed_count - 1, 0),
+            on_time_count = GREATEST(on_time_count - v_on_time::int, 0),
+            overdue_count = GREATEST(overdue_count - (NOT v_on_time)::int, 0),
+            current_streak = CASE WHEN v_on_time THEN GREATEST(current_streak - 1, 0)
+                                  ELSE current_streak END
+        WHERE group_id = v_group_id AND profile_id = NEW.profile_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS choreassignee_stats ON ChoreAssignee;
+CREATE TRIGGER choreassignee_stats AFTER UPDATE OF individual_status ON ChoreAssignee
+    FOR EACH ROW
+    WHEN (OLD.individual_status IS DISTINCT FROM NEW.individual_status)
+    EXECUTE FUNCTION choreassignee_stats();
@@ -0,0 +1,44 @@
+-- Overdue chore digests. The overdue scanner (backend/db/chore_digests.py)
+-- collects each member's pending assignments whose chore is past due into
+-- their open digest until they have seen it, and marks every assignment it
+-- reports. Tracking assignments rather than a due date watermark also
+-- catches chores created already overdue, moved into the past, or
+-- materialized from a template whose start had passed.
+
+CREATE TABLE IF NOT EXISTS chore_digest (
+    digest_id SERIAL PRIMARY KEY,
+    profile_id INTEGER NOT NULL,
+    -- [{chore_id, group_id, name, due_date}, ...] in the order they fell due
+    chores JSONB NOT NULL DEFAULT '[]',
+    overdue_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    seen_at TIMESTAMP,
+    FOREIGN KEY (profile_id) REFERENCES Profile(profile_id) ON DELETE CASCADE
+);
+
+-- At most one open digest per member; the scanner appends to it
+CREATE UNIQUE INDEX IF NOT EXISTS idx_chore_digest_open
+    ON chore_digest(profile_id)
+    WHERE seen_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_chore_digest_profile
+    ON chore_digest(profile_id, created_at DESC);
+
+-- When the scanner put the assignment in a digest
+ALTER TABLE ChoreAssignee ADD COLUMN IF NOT EXISTS digested_at TIMESTAMP;
+
+-- Chores that fell due more than a week before the first scan are not
+-- news any more; leave them out of the first digests
+UPDATE ChoreAssignee ca
+SET digested_at = LOCALTIMESTAMP
+FROM Chore c
+WHERE c.chore_id = ca.chore_id
+  AND ca.individual_status = 'pending'
+  AND ca.digested_at IS NULL
+  AND c.due_date < LOCALTIMESTAMP - INTERVAL '7 days';
+
+-- Only pending assignments not yet reported; the scanner reads these
+CREATE INDEX IF NOT EXISTS idx_chore_assignee_undigested
+    ON ChoreAssignee(chore_id)
+    WHERE individual_status = 'pending' AND digested_at IS NULL;
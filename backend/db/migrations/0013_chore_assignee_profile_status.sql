@@ -0,0 +1,10 @@
+-- migrate: no-transaction
+-- A profile's chores are usually listed by status ("my pending chores").
+-- Keyed on (profile_id, individual_status) with chore_id, the assignments
+-- of one status are read from the index alone instead of filtering every
+-- assignment the profile ever had.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chore_assignee_profile_status
+    ON ChoreAssignee(profile_id, individual_status, chore_id);
+
+-- Superseded by the composite index above (same leading column)
+DROP INDEX CONCURRENTLY IF EXISTS idx_chore_assignee_profile;
@@ -0,0 +1,103 @@
+-- Versions for the cached detailed chore list of a group (scope 'chores',
+-- see 0006_scope_version.sql). The list shows the group's chores with
+-- their assignees' names and statuses, so it changes with Chore,
+-- ChoreAssignee and the names of assigned profiles.
+
+-- ==================== CHORES ====================
+
+CREATE OR REPLACE FUNCTION chore_bump_versions() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM bump_scope_version('chores', ARRAY(SELECT group_id FROM new_rows));
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM bump_scope_version('chores', ARRAY(SELECT group_id FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS chore_versions_insert ON Chore;
+CREATE TRIGGER chore_versions_insert AFTER INSERT ON Chore
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION chore_bump_versions();
+
+DROP TRIGGER IF EXISTS chore_versions_update ON Chore;
+CREATE TRIGGER chore_versions_update AFTER UPDATE ON Chore
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION chore_bump_versions();
+
+DROP TRIGGER IF EXISTS chore_versions_delete ON Chore;
+CREATE TRIGGER chore_versions_delete AFTER DELETE ON Chore
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION chore_bump_versions();
+
+-- ==================== ASSIGNMENTS ====================
+-- Assignees removed along with their chore no longer join Chore; the
+-- chore's own delete already bumped the group. The list only shows an
+-- assignment's profile and status, so updates that leave those alone
+-- (e.g. the overdue scanner setting digested_at) keep the version.
+-- Transition tables can't be combined with UPDATE OF, hence the join.
+
+CREATE OR REPLACE FUNCTION choreassignee_bump_versions() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM bump_scope_version('chores', ARRAY(
+            SELECT c.group_id FROM new_rows n JOIN Chore c ON c.chore_id = n.chore_id
+        ));
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM bump_scope_version('chores', ARRAY(
+            SELECT DISTINCT c.group_id
+            FROM new_rows n
+            FULL JOIN old_rows o
+                   ON o.profile_id = n.profile_id AND o.chore_id = n.chore_id
+            JOIN Chore c ON c.chore_id IN (n.chore_id, o.chore_id)
+            WHERE n.profile_id IS NULL
+               OR o.profile_id IS NULL
+               OR n.individual_status IS DISTINCT FROM o.individual_status
+        ));
+    ELSE
+        PERFORM bump_scope_version('chores', ARRAY(
+            SELECT c.group_id FROM old_rows o JOIN Chore c ON c.chore_id = o.chore_id
+        ));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS choreassignee_versions_insert ON ChoreAssignee;
+CREATE TRIGGER choreassignee_versions_insert AFTER INSERT ON ChoreAssignee
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION choreassignee_bump_versions();
+
+DROP TRIGGER IF EXISTS choreassignee_versions_update ON ChoreAssignee;
+CREATE TRIGGER choreassignee_versions_update AFTER UPDATE ON ChoreAssignee
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION choreassignee_bump_versions();
+
+DROP TRIGGER IF EXISTS choreassignee_versions_delete ON ChoreAssignee;
+CREATE TRIGGER choreassignee_versions_delete AFTER DELETE ON ChoreAssignee
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION choreassignee_bump_versions();
+
+-- ==================== PROFILES ====================
+-- Renaming a profile changes the lists of the groups it has chores in
+
+CREATE OR REPLACE FUNCTION profile_bump_chore_versions() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM bump_scope_version('chores', ARRAY(
+        SELECT DISTINCT c.group_id
+        FROM new_rows n
+        JOIN old_rows o ON o.profile_id = n.profile_id
+        JOIN ChoreAssignee ca ON ca.profile_id = n.profile_id
+        JOIN Chore c ON c.chore_id = ca.chore_id
+        WHERE n.profile_name IS DISTINCT FROM o.profile_name
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS profile_chore_versions_update ON Profile;
+CREATE TRIGGER profile_chore_versions_update AFTER UPDATE ON Profile
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION profile_bump_chore_versions();
@@ -0,0 +1,3 @@
+-- Calendar feed tokens carry this version and are only accepted while it
+-- matches, so rotating it revokes every feed URL handed out before.
+ALTER TABLE Profile ADD COLUMN IF NOT EXISTS feed_token_version INTEGER NOT NULL DEFAULT 1;
@@ -76,7 +76,19 @@ class EventBase(BaseModel):
     group_id: Optional[int] = None
 
 class EventCreate(EventBase):
-    pass
+    # Optional recurrence rule; the start/end above are the first occurrence
+    recurrence_freq: Optional[str] = Field(None, pattern="^(daily|weekly|monthly)$")
+    recurrence_interval: int = Field(1, ge=1)
+    recurrence_count: Optional[int] = Field(None, ge=1)
+    recurrence_until: Optional[datetime] = None
+    recurrence_exdates: List[datetime] = []
+
+class EventBulkDelete(BaseModel):
+    # Either event_ids, or group_id with a start/end window
+    event_ids: Optional[List[int]] = Field(None, max_length=10000)
+    group_id: Optional[int] = None
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
 
 class Event(EventBase):
     event_id: int
@@ -164,6 +176,7 @@ class ChoreCreate(BaseModel):
     name: str
     due_date: Optional[datetime] = None
     notes: Optional[str] = None
+    effort: int = Field(1, ge=1, le=10)
 
 
 class Chore(BaseModel):
@@ -174,6 +187,56 @@ class Chore(BaseModel):
     assigned_date: datetime
     due_date: Optional[datetime] = None
     notes: Optional[str] = None
+    template_id: Optional[int] = None
+    effort: int = 1
+
+
+class ChoreCreateWithAssignees(ChoreCreate):
+    """Model for a chore created together with its assignees"""
+    assignee_ids: List[int] = []
+
+
+class ChoreBulkCreate(BaseModel):
+    """Model for creating many chores at once"""
+    chores: List[ChoreCreateWithAssignees] = Field(..., min_length=1, max_length=1000)
+
+
+class ChoreCreated(Chore):
+    """Model for a chore returned by bulk creation"""
+    assignee_ids: List[int] = []
+
+
+class ChoreTemplateCreate(BaseModel):
+    """Model for creating a recurring chore"""
+    name: str = Field(..., max_length=100)
+    notes: Optional[str] = None
+    frequency: str = Field(..., pattern="^(daily|weekly|monthly)$")
+    repeat_interval: int = Field(1, ge=1)
+    starts_on: datetime
+    ends_on: Optional[datetime] = None
+    rotation: str = Field("round_robin", pattern="^(round_robin|least_loaded|random_fair)$")
+    assignees_per_occurrence: int = Field(1, ge=1)
+    # Rotation pool in order; empty means every group member
+    member_ids: List[int] = []
+    effort: int = Field(1, ge=1, le=10)
+
+
+class ChoreTemplate(ChoreTemplateCreate):
+    """Model for a recurring chore"""
+    template_id: int
+    group_id: int
+    materialized_until: Optional[datetime] = None
+    is_active: bool
+    created_at: datetime
+
+
+class ChoreAutoAssign(BaseModel):
+    """Model for assigning chores by workload"""
+    # Chores to assign; empty means every chore of the group short of assignees
+    chore_ids: Optional[List[int]] = None
+    assignees_per_chore: int = Field(1, ge=1)
+    # Members who may be picked; empty means the whole group
+    candidate_ids: Optional[List[int]] = None
 
 
 class ChoreAssignee(BaseModel):
@@ -198,6 +261,18 @@ class ChoreStatusUpdate(BaseModel):
     """Model for updating chore status"""
     status: str 
 
+
+class ChoreStatusChange(BaseModel):
+    """Model for one status change in a batch"""
+    chore_id: int
+    profile_id: int
+    status: str = Field(..., pattern="^(pending|completed|toggle)$")
+
+
+class ChoreBatchStatusUpdate(BaseModel):
+    """Model for changing many chore statuses at once"""
+    changes: List[ChoreStatusChange] = Field(..., min_length=1, max_length=1000)
+
 # ============================================
 # EXPENSE LIST MODELS
 # ============================================
@@ -259,6 +334,10 @@ class ExpenseItem(BaseModel):
     class Config:
         from_attributes = True
 
+class CalendarSyncRetry(BaseModel):
+    """Dead calendar outbox rows to requeue; all of them when omitted"""
+    outbox_ids: Optional[List[int]] = Field(None, max_length=1000)
+
 # ============================================
 # EXPENSE SPLIT MODELS
 # ============================================
@@ -331,7 +410,7 @@ class ListItem(BaseModel):
     list_id: int
     item_quantity: Optional[int] = 1
     added_by: int
-    date_added: datetime
+    date_added: Optional[datetime] = None
     bought: bool
 
 class CreateShoppingList(BaseModel):
@@ -340,7 +419,7 @@ class CreateShoppingList(BaseModel):
 class ShoppingListWithItems(BaseModel):
     list_id: int
     list_name: str
-    date_created: datetime
+    date_created: Optional[datetime] = None
     date_closed: Optional[datetime] = None
     group_id: int
     items: List[ListItem] = []
@@ -350,7 +429,14 @@ class AddItem(BaseModel):
     item_quantity: Optional[int] = 1
     added_by: int
 
+class AddItems(BaseModel):
+    items: List[AddItem] = Field(..., min_length=1, max_length=1000)
+
 class UpdateItem(BaseModel):
     item_name: Optional[str] = None
     item_quantity: Optional[int] = None
-    bought: Optional[bool] = None
\ No newline at end of file
+    bought: Optional[bool] = None
+
+class MarkItemsBought(BaseModel):
+    item_ids: List[int] = Field(..., min_length=1, max_length=1000)
+    bought: bool = True
\ No newline at end of file
@@ -0,0 +1,203 @@
+"""
+Recurrence rules for user events.
+
+A recurring event is stored once with its first occurrence
+(event_datetime_start/end) and a rule: frequency, interval, and optionally
+a count, an until bound and exception dates. Occurrences are expanded per
+query window; expansions are memoized since the same month views are
+requested over and over.
+"""
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from dateutil.relativedelta import relativedelta
+
+FREQUENCIES = ("daily", "weekly", "monthly")
+
+# Safety cap on occurrences returned for one event in one window
+MAX_OCCURRENCES = 1000
+
+_FIXED_STEPS = {"daily": timedelta(days=1), "weekly": timedelta(weeks=1)}
+
+
+def _occurrence(start: datetime, freq: str, interval: int, index: int) -> datetime:
+    """Start of the index-th occurrence, computed from the first so monthly
+    rules keep their day of month (clamped in shorter months)"""
+    if freq == "monthly":
+        return start + relativedelta(months=interval * index)
+    return start + _FIXED_STEPS[freq] * (interval * index)
+
+
+def _first_index_near(start: datetime, freq: str, interval: int, when: datetime) -> int:
+    """An occurrence index at or just before `when`, to skip ahead cheaply"""
+    if when <= start:
+        return 0
+    if freq == "monthly":
+        months = (when.year - start.year) * 12 + when.month - start.month
+        return max(months // interval - 1, 0)
+    return max(int((when - start) / (_FIXED_STEPS[freq] * interval)) - 1, 0)
+
+
+def iter_occurrences(
+    start: datetime,
+    freq: str,
+    interval: int = 1,
+    after: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Iterator[datetime]:
+    """
+    Starts of a rule's occurrences later than `after` and no later than
+    `until` (unbounded if None)
+    """
+    index = _first_index_near(start, freq, interval, after) if after is not None else 0
+    while True:
+        occurrence = _occurrence(start, freq, interval, index)
+        if until is not None and occurrence > until:
+            return
+        index += 1
+        if after is None or occurrence > after:
+            yield occurrence
+
+
+def recurrence_end(
+    start: datetime,
+    end: Optional[datetime],
+    freq: str,
+    interval: int = 1,
+    count: Optional[int] = None,
+    until: Optional[datetime] = None,
+) -> Optional[datetime]:
+    """End of the last occurrence of a series, or None if it never ends"""
+    duration = (end - start) if end and end > start else timedelta(0)
+    if count is not None:
+        last = _occurrence(start, freq, interval, count - 1)
+        if until is None or last <= until:
+            return last + duration
+    if until is None:
+        return None
+
+    index = _first_index_near(start, freq, interval, until)
+    while _occurrence(start, freq, interval, index + 1) <= until:
+        index += 1
+    return _occurrence(start, freq, interval, index) + duration
+
+
+@lru_cache(maxsize=4096)
+def _expand(
+    start: datetime,
+    duration: timedelta,
+    freq: str,
+    interval: int,
+    count: Optional[int],
+    until: Optional[datetime],
+    exdates: Tuple[datetime, ...],
+    window_start: Optional[datetime],
+    window_end: Optional[datetime],
+) -> Tuple[Tuple[datetime, datetime], ...]:
+    occurrences = []
+    excluded = set(exdates)
+    index = 0
+    if window_start is not None:
+        index = _first_index_near(start, freq, interval, window_start - duration)
+
+    while len(occurrences) < MAX_OCCURRENCES:
+        if count is not None and index >= count:
+            break
+        occurrence_start = _occurrence(start, freq, interval, index)
+        if until is not None and occurrence_start > until:
+            break
+        if window_end is not None and occurrence_start > window_end:
+            break
+        index += 1
+
+        occurrence_end = occurrence_start + duration
+        if window_start is not None and occurrence_end < window_start:
+            continue
+        if occurrence_start in excluded:
+            continue
+        occurrences.append((occurrence_start, occurrence_end))
+
+    return tuple(occurrences)
+
+
+def expand_occurrences(
+    event: dict,
+    window_start: Optional[datetime] = None,
+    window_end: Optional[datetime] = None,
+) -> List[Tuple[datetime, datetime]]:
+    """
+    (start, end) of each occurrence of a recurring event row that overlaps
+    the window (inclusive, like the event_period queries). Events without
+    an end are instants.
+    """
+    start = event["event_datetime_start"]
+    end = event.get("event_datetime_end")
+    if start.tzinfo is not None:
+        # Windows parsed without an offset are taken to be UTC
+        if window_start is not None and window_start.tzinfo is None:
+            window_start = window_start.replace(tzinfo=timezone.utc)
+        if window_end is not None and window_end.tzinfo is None:
+            window_end = window_end.replace(tzinfo=timezone.utc)
+    duration = (end - start) if end and end > start else timedelta(0)
+    return list(_expand(
+        start,
+        duration,
+        event["recurrence_freq"],
+        event.get("recurrence_interval") or 1,
+        event.get("recurrence_count"),
+        event.get("recurrence_until"),
+        tuple(sorted(event.get("recurrence_exdates") or ())),
+        window_start,
+        window_end,
+    ))
+
+
+def expand_rows(
+    rows: Sequence[dict],
+    window_start: Optional[datetime] = None,
+    window_end: Optional[datetime] = None,
+) -> List[dict]:
+    """
+    Replace each recurring event row by one copy per occurrence in the
+    window (with that occurrence's start and end) and return all rows
+    ordered by start
+    """
+    expanded = []
+    for row in rows:
+        if not row.get("recurrence_freq"):
+            expanded.append(row)
+            continue
+        for occurrence_start, occurrence_end in expand_occurrences(row, window_start, window_end):
+            occurrence = dict(row)
+            occurrence["event_datetime_start"] = occurrence_start
+            if row.get("event_datetime_end"):
+                occurrence["event_datetime_end"] = occurrence_end
+            expanded.append(occurrence)
+    expanded.sort(key=lambda row: row["event_datetime_start"])
+    return expanded
+
+
+def to_rrule(event: dict) -> str:
+    """RFC 5545 RRULE value for a recurring event row"""
+    freq = event["recurrence_freq"]
+    interval = event.get("recurrence_interval") or 1
+    count = event.get("recurrence_count")
+    until = event.get("recurrence_until")
+
+    parts = [f"FREQ={freq.upper()}"]
+    if interval > 1:
+        parts.append(f"INTERVAL={interval}")
+    # COUNT and UNTIL may not both appear; keep whichever ends the series first
+    if count and until:
+        if _occurrence(event["event_datetime_start"], freq, interval, count - 1) <= until:
+            until = None
+        else:
+            count = None
+    if count:
+        parts.append(f"COUNT={count}")
+    if until:
+        if until.tzinfo is None:
+            until = until.replace(tzinfo=timezone.utc)
+        parts.append(f"UNTIL={until.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}")
+    return ";".join(parts)
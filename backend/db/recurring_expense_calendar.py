@@ -1,163 +1,358 @@
+import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
+from typing import Iterator, List, Optional
 from dateutil.relativedelta import relativedelta
 from backend.db.connection import get_connection
-from psycopg2.extras import RealDictCursor
+from backend.db.tracing import traced
+from psycopg2.extras import RealDictCursor, execute_values
 
-def create_calendar_events_for_recurring_expense(item_id: int, expense_data: dict):
+logger = logging.getLogger(__name__)
+
+# Safety cap on occurrences generated per expense
+MAX_OCCURRENCES = 100
+
+# Outbox rows are marked dead after this many failed attempts and wait
+# for retry_calendar_outbox
+MAX_OUTBOX_ATTEMPTS = 5
+
+# ============================================================
+# OUTBOX
+# ============================================================
+
+def queue_calendar_sync(cur, event_type: str, item_id: int) -> None:
+    """
+    Record that an expense's calendar events need creating or deleting.
+    Must be called with the cursor of the transaction that changes the
+    expense so the two commit (or roll back) together.
+    """
+    cur.execute("""
+        INSERT INTO calendar_outbox (event_type, item_id)
+        VALUES (%s, %s)
+    """, (event_type, item_id))
+
+
+@traced
+def process_calendar_outbox(batch_size: int = 500) -> int:
+    """
+    Drain the calendar outbox in batches until it is empty or a row fails
+    (failed rows are retried on the next run until they are dead).
+    Returns the number of outbox rows applied.
+    """
+    applied = 0
+    while True:
+        claimed, failed = _process_outbox_batch(batch_size)
+        applied += claimed - failed
+        if claimed < batch_size or failed:
+            return applied
+
+
+def _process_outbox_batch(batch_size: int, outbox_ids: List[int] = None):
     """
-    Create calendar events for a recurring expense.
-    Called after an expense is created.
+    Claim up to batch_size outbox rows (or the given outbox_ids) and apply
+    them in a single transaction. If the batch fails, each row is retried
+    on its own so one bad expense can't hold up the others.
+    Returns (rows claimed, rows failed).
     """
-    if not expense_data.get('is_recurring'):
-        return
-    
     conn = get_connection()
     cur = conn.cursor(cursor_factory=RealDictCursor)
-    
+    rows = []
     try:
-        # Get expense details including group info and date_created
-        cur.execute("""
-            SELECT e.*, el.group_id, p.profile_name as paid_by_name
-            FROM expense_item e
-            JOIN expense_list el ON e.list_id = el.list_id
-            JOIN profile p ON e.paid_by_id = p.profile_id
-            WHERE e.item_id = %s
-        """, (item_id,))
-        expense = cur.fetchone()
-        
-        if not expense:
-            print(f"❌ Expense {item_id} not found")
-            return
-        
-        print(f"📅 Creating calendar events for expense: {expense['item_name']}")
-        
-        # Get all group members to add them as participants
+        id_filter = "AND outbox_id = ANY(%s)" if outbox_ids else ""
+        params = []
+        if outbox_ids:
+            params.append(outbox_ids)
+        params.append(batch_size)
+
+        cur.execute(f"""
+            SELECT outbox_id, event_type, item_id
+            FROM calendar_outbox
+            WHERE status = 'pending'
+              {id_filter}
+            ORDER BY outbox_id
+            LIMIT %s
+            FOR UPDATE SKIP LOCKED
+        """, params)
+        rows = cur.fetchall()
+        if not rows:
+            conn.rollback()
+            return 0, 0
+
+        _apply_outbox_rows(cur, rows)
+
         cur.execute("""
-            SELECT profile_id
-            FROM groupprofile
-            WHERE group_id = %s
-        """, (expense['group_id'],))
-        group_members = [row['profile_id'] for row in cur.fetchall()]
-        
-        if not group_members:
-            print(f"⚠️ No group members found for group {expense['group_id']}")
-            return
-        
-        # Calculate recurring dates
-        frequency = expense['recurring_frequency']
-        
-        # Use date_created from the fetched expense (it's now available)
-        start_date = expense['date_created']
-        if isinstance(start_date, datetime):
-            current_date = start_date
-        else:
-            current_date = datetime.combine(start_date, datetime.min.time())
-        
-        # Convert end_date to datetime if it's a date object
-        if expense['recurring_end_date']:
-            if isinstance(expense['recurring_end_date'], datetime):
-                end_date = expense['recurring_end_date']
-            else:
-                # It's a date object, convert to datetime
-                end_date = datetime.combine(expense['recurring_end_date'], datetime.min.time())
-        else:
-            end_date = current_date + timedelta(days=365)  # Default 1 year
-        
-        events_created = 0
-        
-        print(f"📊 Creating events from {current_date} to {end_date} with frequency: {frequency}")
-        
-        while current_date <= end_date and events_created < 100:  # Max 100 events to prevent infinite loops
-            # Create event for this occurrence
-            event_name = f"{expense['item_name']} - ${float(expense['item_total_cost']):.2f}"
-            event_notes = f"Recurring expense paid by {expense['paid_by_name']}"
-            if expense['notes']:
-                event_notes += f"\n\n{expense['notes']}"
-            
-            # Insert event with group_id
-            cur.execute("""
-                INSERT INTO event (
-                    event_name,
-                    event_datetime_start,
-                    event_datetime_end,
-                    event_notes,
-                    event_location,
-                    group_id
-                )
-                VALUES (%s, %s, %s, %s, %s, %s)
-                RETURNING event_id
-            """, (
-                event_name,
-                current_date,
-                current_date + timedelta(hours=1),  # 1 hour duration
-                event_notes,
-                f"EXPENSE:{item_id}",
-                expense['group_id']
-            ))
-            
-            event_id = cur.fetchone()['event_id']
-            
-            # Add all group members to the event
-            for member_id in group_members:
-                cur.execute("""
-                    INSERT INTO profileevent (profile_id, event_id)
-                    VALUES (%s, %s)
-                    ON CONFLICT DO NOTHING
-                """, (member_id, event_id))
-            
-            events_created += 1
-            
-            # Calculate next occurrence
-            if frequency == 'daily':
-                current_date += timedelta(days=1)
-            elif frequency == 'weekly':
-                current_date += timedelta(weeks=1)
-            elif frequency == 'monthly':
-                current_date += relativedelta(months=1)
-            elif frequency == 'yearly':
-                current_date += relativedelta(years=1)
-            else:
-                print(f"⚠️ Unknown frequency: {frequency}")
-                break  # Unknown frequency
-        
+            DELETE FROM calendar_outbox WHERE outbox_id = ANY(%s)
+        """, ([row['outbox_id'] for row in rows],))
         conn.commit()
-        print(f"✅ Created {events_created} calendar events for recurring expense {item_id}")
-        
+        return len(rows), 0
+
     except Exception as e:
         conn.rollback()
-        print(f"❌ Error creating calendar events for recurring expense: {e}")
-        import traceback
-        traceback.print_exc()
-        raise
+        if len(rows) > 1:
+            logger.warning("Calendar outbox batch of %d failed, retrying rows individually: %s", len(rows), e)
+            failed = sum(_process_outbox_batch(1, [row['outbox_id']])[1] for row in rows)
+            return len(rows), failed
+
+        if rows:
+            logger.exception("Calendar outbox row %s failed: %s", rows[0]['outbox_id'], e)
+            cur.execute("""
+                UPDATE calendar_outbox
+                SET attempts = attempts + 1,
+                    last_error = %s,
+                    status = CASE WHEN attempts + 1 >= %s THEN 'dead' ELSE status END
+                WHERE outbox_id = %s
+                RETURNING status
+            """, (str(e), MAX_OUTBOX_ATTEMPTS, rows[0]['outbox_id']))
+            if cur.fetchone()['status'] == 'dead':
+                logger.error(
+                    "Calendar outbox row %s (%s of expense %s) is dead after %d attempts; "
+                    "retry it with POST /api/expenses/calendar-sync/retry",
+                    rows[0]['outbox_id'], rows[0]['event_type'], rows[0]['item_id'], MAX_OUTBOX_ATTEMPTS,
+                )
+            conn.commit()
+        return len(rows), len(rows)
     finally:
         cur.close()
         conn.close()
 
 
-def delete_calendar_events_for_expense(item_id: int):
+@traced
+def get_calendar_outbox_status(limit: int = 50) -> dict:
     """
-    Delete all calendar events associated with an expense.
-    Called when an expense is deleted.
+    Snapshot of the calendar outbox for debugging: row counts per status,
+    the age of the oldest pending row, and the most recent rows that have
+    failed at least once (dead rows first)
     """
     conn = get_connection()
-    cur = conn.cursor()
-    
+    cur = conn.cursor(cursor_factory=RealDictCursor)
     try:
-        # Find events created for this expense
         cur.execute("""
-            DELETE FROM event
-            WHERE event_location = %s
-        """, (f"EXPENSE:{item_id}",))
-        
-        deleted_count = cur.rowcount
+            SELECT
+                count(*) FILTER (WHERE status = 'pending') AS pending,
+                count(*) FILTER (WHERE status = 'dead') AS dead,
+                min(date_created) FILTER (WHERE status = 'pending') AS oldest_pending
+            FROM calendar_outbox
+        """)
+        status = dict(cur.fetchone())
+
+        cur.execute("""
+            SELECT outbox_id, event_type, item_id, status, attempts, last_error, date_created
+            FROM calendar_outbox
+            WHERE attempts > 0
+            ORDER BY status = 'dead' DESC, outbox_id DESC
+            LIMIT %s
+        """, (limit,))
+        status['failing'] = [dict(row) for row in cur.fetchall()]
+        status['max_attempts'] = MAX_OUTBOX_ATTEMPTS
+        return status
+    finally:
+        cur.close()
+        conn.close()
+
+
+@traced
+def retry_calendar_outbox(outbox_ids: Optional[List[int]] = None) -> int:
+    """
+    Put dead outbox rows (all of them, or only outbox_ids) back in the
+    queue with their attempts reset.
+    Returns the number of rows requeued.
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+    try:
+        id_filter = "AND outbox_id = ANY(%s)" if outbox_ids is not None else ""
+        cur.execute(f"""
+            UPDATE calendar_outbox
+            SET status = 'pending', attempts = 0
+            WHERE status = 'dead'
+              {id_filter}
+        """, (outbox_ids,) if outbox_ids is not None else None)
+        requeued = cur.rowcount
         conn.commit()
-        print(f"✅ Deleted {deleted_count} calendar events for expense {item_id}")
-        
-    except Exception as e:
+        if requeued:
+            logger.info("Requeued %d dead calendar outbox rows", requeued)
+        return requeued
+    except Exception:
         conn.rollback()
-        print(f"❌ Error deleting calendar events: {e}")
-        import traceback
-        traceback.print_exc()
+        raise
     finally:
         cur.close()
-        conn.close()
\ No newline at end of file
+        conn.close()
+
+
+def _apply_outbox_rows(cur, rows: List[dict]) -> None:
+    """
+    Bring the calendar in line with the current state of every expense in
+    the batch: existing events are removed, then events are recreated for
+    expenses whose latest change was a creation and that still exist.
+    """
+    latest_event = {}
+    for row in rows:
+        latest_event[row['item_id']] = row['event_type']
+
+    item_ids = list(latest_event)
+    cur.execute("""
+        DELETE FROM event
+        WHERE source_type = 'expense' AND source_id = ANY(%s)
+    """, (item_ids,))
+    deleted_count = cur.rowcount
+
+    to_create = [item_id for item_id, event_type in latest_event.items()
+                 if event_type == 'expense_created']
+    created_count = _create_expense_events(cur, to_create) if to_create else 0
+
+    logger.info(
+        "Calendar outbox: %d rows, %d events deleted, %d events created",
+        len(rows), deleted_count, created_count,
+    )
+
+# ============================================================
+# EVENT GENERATION
+# ============================================================
+
+def expense_occurrences(expense: dict) -> Iterator[datetime]:
+    """Yield the start of every calendar occurrence of a recurring expense"""
+    frequency = expense['recurring_frequency']
+
+    start_date = expense['date_created']
+    if isinstance(start_date, datetime):
+        current_date = start_date
+    else:
+        current_date = datetime.combine(start_date, datetime.min.time())
+
+    # Convert end_date to datetime if it's a date object
+    if expense['recurring_end_date']:
+        if isinstance(expense['recurring_end_date'], datetime):
+            end_date = expense['recurring_end_date']
+        else:
+            end_date = datetime.combine(expense['recurring_end_date'], datetime.min.time())
+    else:
+        end_date = current_date + timedelta(days=365)  # Default 1 year
+
+    count = 0
+    while current_date <= end_date and count < MAX_OCCURRENCES:
+        yield current_date
+        count += 1
+
+        if frequency == 'daily':
+            current_date += timedelta(days=1)
+        elif frequency == 'weekly':
+            current_date += timedelta(weeks=1)
+        elif frequency == 'monthly':
+            current_date += relativedelta(months=1)
+        elif frequency == 'yearly':
+            current_date += relativedelta(years=1)
+        else:
+            logger.warning("Unknown recurring frequency: %s", frequency)
+            return
+
+
+def expense_event_text(expense: dict):
+    """Calendar title and notes for an occurrence of a recurring expense"""
+    event_name = f"{expense['item_name']} - ${float(expense['item_total_cost']):.2f}"
+    event_notes = f"Recurring expense paid by {expense['paid_by_name']}"
+    if expense['notes']:
+        event_notes += f"\n\n{expense['notes']}"
+    return event_name, event_notes
+
+
+@traced
+def get_recurring_expenses(group_ids: List[int]) -> List[dict]:
+    """Live recurring expenses of the given groups, for rendering occurrences on the fly"""
+    conn = get_connection()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+    try:
+        cur.execute("""
+            SELECT e.item_id, e.item_name, e.item_total_cost, e.notes,
+                   e.date_created, e.recurring_frequency, e.recurring_end_date,
+                   el.group_id, p.profile_name as paid_by_name
+            FROM expense_item e
+            JOIN expense_list el ON e.list_id = el.list_id
+            JOIN profile p ON e.paid_by_id = p.profile_id
+            WHERE el.group_id = ANY(%s)
+              AND e.is_recurring = TRUE
+              AND e.is_deleted = FALSE
+            ORDER BY e.item_id
+        """, (list(group_ids),))
+        return [dict(row) for row in cur.fetchall()]
+    finally:
+        cur.close()
+        conn.close()
+
+
+def _create_expense_events(cur, item_ids: List[int]) -> int:
+    """Insert the calendar events for many recurring expenses at once"""
+    cur.execute("""
+        SELECT e.*, el.group_id, p.profile_name as paid_by_name
+        FROM expense_item e
+        JOIN expense_list el ON e.list_id = el.list_id
+        JOIN profile p ON e.paid_by_id = p.profile_id
+        WHERE e.item_id = ANY(%s)
+          AND e.is_recurring = TRUE
+          AND e.is_deleted = FALSE
+    """, (item_ids,))
+    expenses = cur.fetchall()
+    if not expenses:
+        return 0
+
+    # Every group member is a participant in the group's expense events
+    cur.execute("""
+        SELECT group_id, profile_id
+        FROM groupprofile
+        WHERE group_id = ANY(%s)
+    """, (list({expense['group_id'] for expense in expenses}),))
+    members_by_group = defaultdict(list)
+    for row in cur.fetchall():
+        members_by_group[row['group_id']].append(row['profile_id'])
+
+    event_rows = []
+    for expense in expenses:
+        if not members_by_group[expense['group_id']]:
+            logger.warning("No group members found for group %s", expense['group_id'])
+            continue
+
+        event_name, event_notes = expense_event_text(expense)
+
+        for occurrence in expense_occurrences(expense):
+            event_rows.append((
+                event_name,
+                occurrence,
+                occurrence + timedelta(hours=1),  # 1 hour duration
+                event_notes,
+                f"EXPENSE:{expense['item_id']}",  # still used by the frontend
+                expense['group_id'],
+                'expense',
+                expense['item_id'],
+            ))
+
+    if not event_rows:
+        return 0
+
+    created = execute_values(cur, """
+        INSERT INTO event (
+            event_name,
+            event_datetime_start,
+            event_datetime_end,
+            event_notes,
+            event_location,
+            group_id,
+            source_type,
+            source_id
+        )
+        VALUES %s
+        RETURNING event_id, group_id
+    """, event_rows, page_size=1000, fetch=True)
+
+    profile_ids, event_ids = [], []
+    for event in created:
+        for member_id in members_by_group[event['group_id']]:
+            profile_ids.append(member_id)
+            event_ids.append(event['event_id'])
+
+    cur.execute("""
+        INSERT INTO profileevent (profile_id, event_id)
+        SELECT * FROM unnest(%s::int[], %s::int[])
+        ON CONFLICT DO NOTHING
+    """, (profile_ids, event_ids))
+
+    return len(created)
@@ -0,0 +1,71 @@
+"""
+Assignment policies for chores.
+
+Each policy picks who is assigned the next chore (or occurrence of a
+recurring chore) from a pool of profile ids, updating the state it is
+given so consecutive calls keep rotating. Nothing here touches the
+database, so a whole batch can be assigned in memory before anything is
+written.
+"""
+import heapq
+import random
+from typing import Collection, Dict, List, Sequence, Tuple
+
+POLICIES = ("round_robin", "least_loaded", "random_fair")
+
+
+def round_robin(pool: Sequence[int], index: int, count: int) -> Tuple[List[int], int]:
+    """
+    The next `count` members of the pool in order, starting at `index`.
+    Returns them and the index to continue from.
+    """
+    if not pool:
+        return [], index
+    count = min(count, len(pool))
+    picked = [pool[(index + offset) % len(pool)] for offset in range(count)]
+    return picked, (index + count) % len(pool)
+
+
+class WorkloadBalancer:
+    """
+    Hands chores to the members with the least accumulated workload.
+
+    Members sit in a min-heap keyed by (workload, profile_id), so picking
+    the least loaded member and charging it a chore's effort is
+    O(log members) rather than a scan over everyone's history.
+    """
+
+    def __init__(self, workloads: Dict[int, int]):
+        self.workloads = dict(workloads)
+        self._heap = [(load, profile_id) for profile_id, load in self.workloads.items()]
+        heapq.heapify(self._heap)
+
+    def assign(self, effort: int, count: int = 1, exclude: Collection[int] = ()) -> List[int]:
+        """
+        The `count` least loaded members not in `exclude` (ties go to the
+        lower id), each charged `effort`
+        """
+        picked, skipped = [], []
+        while self._heap and len(picked) < count:
+            entry = heapq.heappop(self._heap)
+            (skipped if entry[1] in exclude else picked).append(entry)
+
+        for load, profile_id in picked:
+            self.workloads[profile_id] = load + effort
+            heapq.heappush(self._heap, (load + effort, profile_id))
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+        return [profile_id for _, profile_id in picked]
+
+
+def random_fair(pool: Sequence[int], counts: Dict[int, int], count: int,
+                rng: random.Random = random) -> List[int]:
+    """
+    `count` members drawn at random among those who have taken this chore
+    the fewest times, so over a full cycle everyone takes it equally
+    often. `counts` is updated with the new assignments.
+    """
+    picked = sorted(pool, key=lambda profile_id: (counts.get(profile_id, 0), rng.random()))[:count]
+    for profile_id in picked:
+        counts[profile_id] = counts.get(profile_id, 0) + 1
+    return picked
@@ -0,0 +1,103 @@
+import functools
+
+import psycopg2.extensions
+from psycopg2.extras import RealDictCursor
+from opentelemetry import trace
+
+# No-op until backend.app.tracing installs a tracer provider
+tracer = trace.get_tracer("homebase.db")
+
+# Statements longer than this are truncated in span attributes
+MAX_STATEMENT_LENGTH = 2000
+
+
+def traced(func):
+    """
+    Wrap a query function in a span named after its module and function,
+    e.g. "expense_queries.create_expense_item"
+    """
+    span_name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with tracer.start_as_current_span(span_name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _operation(query) -> str:
+    """First keyword of a statement, read from a short prefix only"""
+    if isinstance(query, (bytes, str)):
+        prefix = query[:64]
+        if isinstance(prefix, bytes):
+            prefix = prefix.decode("utf-8", "replace")
+        words = prefix.split(None, 1)
+        if words:
+            return words[0].upper()
+    return "SQL"
+
+
+def _statement_text(cursor, query) -> str:
+    if not isinstance(query, (bytes, str)):
+        # psycopg2.sql.Composable
+        query = query.as_string(cursor)
+    # Collapse whitespace in a bounded prefix rather than the whole statement
+    query = query[:MAX_STATEMENT_LENGTH * 4]
+    if isinstance(query, bytes):
+        query = query.decode("utf-8", "replace")
+    return " ".join(query.split())[:MAX_STATEMENT_LENGTH]
+
+
+class TracedCursorMixin:
+    """Emit one client span per executed SQL statement"""
+
+    def execute(self, query, vars=None):
+        with tracer.start_as_current_span(
+            f"SQL {_operation(query)}", kind=trace.SpanKind.CLIENT
+        ) as span:
+            # Only render the statement when someone is listening; queries
+            # built by execute_values can be megabytes
+            if span.is_recording():
+                span.set_attribute("db.system", "postgresql")
+                span.set_attribute("db.statement", _statement_text(self, query))
+            result = super().execute(query, vars)
+            if span.is_recording():
+                span.set_attribute("db.rowcount", self.rowcount)
+            return result
+
+    def executemany(self, query, vars_list):
+        with tracer.start_as_current_span(
+            "SQL executemany", kind=trace.SpanKind.CLIENT
+        ) as span:
+            if span.is_recording():
+                span.set_attribute("db.system", "postgresql")
+                span.set_attribute("db.statement", _statement_text(self, query))
+            return super().executemany(query, vars_list)
+
+
+class TracedCursor(TracedCursorMixin, psycopg2.extensions.cursor):
+    pass
+
+
+class TracedRealDictCursor(TracedCursorMixin, RealDictCursor):
+    pass
+
+
+_TRACED_FACTORIES = {
+    None: TracedCursor,
+    psycopg2.extensions.cursor: TracedCursor,
+    RealDictCursor: TracedRealDictCursor,
+}
+
+
+class TracedConnection(psycopg2.extensions.connection):
+    """
+    Connection whose cursors are traced, including cursors opened with an
+    explicit cursor_factory=RealDictCursor
+    """
+
+    def cursor(self, *args, **kwargs):
+        factory = kwargs.get("cursor_factory") or self.cursor_factory
+        kwargs["cursor_factory"] = _TRACED_FACTORIES.get(factory, factory)
+        return super().cursor(*args, **kwargs)
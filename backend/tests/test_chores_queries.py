@@ -0,0 +1,23 @@
+from datetime import datetime
+
+import pytest
+
+from backend.db.chores_queries import decode_chore_cursor, encode_chore_cursor
+
+
+def test_chore_cursor_round_trips():
+    cursor = encode_chore_cursor({"chore_id": 12, "due_date": datetime(2025, 3, 1, 18, 30)})
+    assert cursor == "2025-03-01T18:30:00,12"
+    assert decode_chore_cursor(cursor) == ("2025-03-01T18:30:00", 12)
+
+
+def test_chores_without_a_due_date_sort_last():
+    cursor = encode_chore_cursor({"chore_id": 5, "due_date": None})
+    assert cursor == "infinity,5"
+    assert decode_chore_cursor(cursor) == ("infinity", 5)
+
+
+@pytest.mark.parametrize("value", ["", "infinity", "tomorrow,5", "2025-03-01T18:30:00,x", "infinity,5,6"])
+def test_malformed_chore_cursors_raise_value_error(value):
+    with pytest.raises(ValueError):
+        decode_chore_cursor(value)
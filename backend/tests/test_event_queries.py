@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.db.event_queries import decode_calendar_cursor, encode_calendar_cursor
+
+
+def test_calendar_cursor_round_trips_at_full_precision():
+    start = datetime(2025, 3, 1, 9, 30, 15, 123456, tzinfo=timezone.utc)
+    cursor = encode_calendar_cursor(start, 42)
+    assert cursor == "2025-03-01T09:30:15.123456Z,42"
+    assert decode_calendar_cursor(cursor) == (start, 42)
+
+
+def test_calendar_cursor_is_normalized_to_utc():
+    start = datetime(2025, 3, 1, 11, 0, tzinfo=timezone(timedelta(hours=2)))
+    cursor = encode_calendar_cursor(start, 7)
+    assert cursor == "2025-03-01T09:00:00.000000Z,7"
+    decoded, event_id = decode_calendar_cursor(cursor)
+    assert decoded == start and decoded.tzinfo == timezone.utc and event_id == 7
+
+
+@pytest.mark.parametrize("value", [
+    "",
+    "2025-03-01T09:00:00.000000Z",
+    "2025-03-01T09:00:00Z,7",
+    "2025-03-01T09:00:00.000000Z,seven",
+    "2025-03-01T09:00:00.000000Z,7,8",
+])
+def test_malformed_calendar_cursors_raise_value_error(value):
+    with pytest.raises(ValueError):
+        decode_calendar_cursor(value)
@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta, timezone
+
+from backend.app.ics import (
+    MAX_LINE_OCTETS,
+    escape_text,
+    fold_line,
+    format_datetime,
+    render_calendar,
+    render_event,
+)
+
+STAMP = "20250301T000000Z"
+
+
+def unfold(text: str) -> str:
+    return text.replace("\r\n ", "")
+
+
+def test_escape_text():
+    assert escape_text("a\\b;c,d\ne\r\nf") == "a\\\\b\\;c\\,d\\ne\\nf"
+
+
+def test_short_lines_are_not_folded():
+    assert fold_line("SUMMARY:Dinner") == "SUMMARY:Dinner\r\n"
+
+
+def test_long_lines_fold_within_the_octet_limit():
+    line = "DESCRIPTION:" + "x" * 200
+    folded = fold_line(line)
+    physical = folded[:-2].split("\r\n")
+    assert all(len(part.encode("utf-8")) <= MAX_LINE_OCTETS for part in physical)
+    assert all(part.startswith(" ") for part in physical[1:])
+    assert unfold(folded) == line + "\r\n"
+
+
+def test_folding_never_splits_a_multibyte_character():
+    line = "SUMMARY:" + "é☃" * 60
+    folded = fold_line(line)
+    for part in folded[:-2].split("\r\n"):
+        assert len(part.encode("utf-8")) <= MAX_LINE_OCTETS
+        part.encode("utf-8").decode("utf-8")
+    assert unfold(folded) == line + "\r\n"
+
+
+def test_format_datetime_converts_to_utc_and_treats_naive_as_utc():
+    eastern = timezone(timedelta(hours=-5))
+    assert format_datetime(datetime(2025, 3, 1, 9, 30, tzinfo=eastern)) == "20250301T143000Z"
+    assert format_datetime(datetime(2025, 3, 1, 9, 30)) == "20250301T093000Z"
+
+
+def test_render_event_with_recurrence():
+    start = datetime(2025, 3, 1, 9, tzinfo=timezone.utc)
+    text = render_event({
+        "uid": "event-1@homebase",
+        "summary": "Rent, March",
+        "start": start,
+        "end": start + timedelta(hours=1),
+        "rrule": "FREQ=WEEKLY;COUNT=3",
+        "exdates": [start + timedelta(weeks=1)],
+        "location": "Home",
+    }, STAMP)
+    assert text.split("\r\n")[:-1] == [
+        "BEGIN:VEVENT",
+        "UID:event-1@homebase",
+        f"DTSTAMP:{STAMP}",
+        "DTSTART:20250301T090000Z",
+        "DTEND:20250301T100000Z",
+        "RRULE:FREQ=WEEKLY;COUNT=3",
+        "EXDATE:20250308T090000Z",
+        "SUMMARY:Rent\\, March",
+        "LOCATION:Home",
+        "END:VEVENT",
+    ]
+
+
+def test_render_event_leaves_out_an_empty_end():
+    start = datetime(2025, 3, 1, 9, tzinfo=timezone.utc)
+    text = render_event({"uid": "u", "summary": "Reminder", "start": start, "end": start}, STAMP)
+    assert "DTEND" not in text
+    assert "RRULE" not in text
+
+
+def test_render_calendar_wraps_events():
+    start = datetime(2025, 3, 1, 9, tzinfo=timezone.utc)
+    chunks = list(render_calendar("Flat; shared", [
+        {"uid": "a", "summary": "A", "start": start},
+        {"uid": "b", "summary": "B", "start": start},
+    ]))
+    assert len(chunks) == 4
+    assert chunks[0].startswith("BEGIN:VCALENDAR\r\nVERSION:2.0\r\n")
+    assert "X-WR-CALNAME:Flat\\; shared\r\n" in chunks[0]
+    assert chunks[1].startswith("BEGIN:VEVENT\r\nUID:a\r\n")
+    assert chunks[-1] == "END:VCALENDAR\r\n"
+    assert all(line for line in "".join(chunks).split("\r\n")[:-1])
@@ -0,0 +1,89 @@
+import random
+from datetime import datetime, timedelta
+
+from backend.db.intervals import (
+    BusyBlock,
+    FreeSlot,
+    IntervalTree,
+    free_slots,
+    merge_intervals,
+    overlapping_pairs,
+)
+
+T0 = datetime(2025, 3, 1, 9)
+
+
+def at(hours: float) -> datetime:
+    return T0 + timedelta(hours=hours)
+
+
+def test_merge_joins_overlapping_and_touching_intervals():
+    blocks = merge_intervals([
+        (at(2), at(3), "b"),
+        (at(0), at(1), "a"),
+        (at(1), at(2), "c"),  # touches both neighbours
+        (at(5), at(6), "a"),
+    ])
+    assert blocks == [
+        BusyBlock(at(0), at(3), ["a", "b", "c"]),
+        BusyBlock(at(5), at(6), ["a"]),
+    ]
+
+
+def test_merge_keeps_a_block_open_past_a_contained_interval():
+    blocks = merge_intervals([(at(0), at(4), 1), (at(1), at(2), 2), (at(3), at(5), 3)])
+    assert blocks == [BusyBlock(at(0), at(5), [1, 2, 3])]
+
+
+def test_merge_ignores_empty_and_inverted_intervals():
+    assert merge_intervals([(at(1), at(1), "x"), (at(2), at(1), "y")]) == []
+
+
+def test_free_slots_between_blocks_and_window_edges():
+    busy = [BusyBlock(at(1), at(2), [1]), BusyBlock(at(3), at(4), [2])]
+    assert free_slots(busy, at(0), at(5)) == [
+        FreeSlot(at(0), at(1)),
+        FreeSlot(at(2), at(3)),
+        FreeSlot(at(4), at(5)),
+    ]
+
+
+def test_free_slots_honours_min_duration_and_clips_to_window():
+    busy = [BusyBlock(at(-1), at(1), [1]), BusyBlock(at(1.5), at(6), [2])]
+    assert free_slots(busy, at(0), at(5), timedelta(hours=1)) == []
+    assert free_slots(busy, at(0), at(5), timedelta(minutes=30)) == [FreeSlot(at(1), at(1.5))]
+
+
+def test_free_slots_of_an_empty_calendar_is_the_window():
+    assert free_slots([], at(0), at(8)) == [FreeSlot(at(0), at(8))]
+
+
+def test_tree_overlap_is_half_open():
+    tree = IntervalTree([(at(0), at(1), "a"), (at(1), at(2), "b")])
+    assert [iv[2] for iv in tree.overlapping(at(1), at(1.5))] == ["b"]
+    assert tree.overlapping(at(2), at(3)) == []
+
+
+def test_tree_matches_brute_force():
+    rng = random.Random(7)
+    intervals = []
+    for i in range(300):
+        start = rng.randrange(0, 1000)
+        intervals.append((start, start + rng.randrange(0, 50), i))
+    tree = IntervalTree(intervals)
+
+    for _ in range(200):
+        start = rng.randrange(-20, 1020)
+        end = start + rng.randrange(1, 80)
+        expected = {iv[2] for iv in intervals if iv[1] > iv[0] and iv[0] < end and start < iv[1]}
+        assert {iv[2] for iv in tree.overlapping(start, end)} == expected
+
+
+def test_overlapping_pairs_lists_each_pair_once():
+    pairs = overlapping_pairs([
+        (at(0), at(2), "a"),
+        (at(1), at(3), "b"),
+        (at(2), at(4), "c"),  # touches a, overlaps b
+        (at(5), at(6), "d"),
+    ])
+    assert pairs == [("a", "b"), ("b", "c")]
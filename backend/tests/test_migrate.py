@@ -0,0 +1,62 @@
+from backend.db.migrate import discover_migrations, split_statements
+
+
+def test_splits_on_semicolons():
+    assert split_statements("SELECT 1; SELECT 2;") == ["SELECT 1", "SELECT 2"]
+
+
+def test_keeps_a_trailing_statement_without_semicolon():
+    assert split_statements("SELECT 1;\nSELECT 2") == ["SELECT 1", "SELECT 2"]
+
+
+def test_skips_empty_statements():
+    assert split_statements(";;\n  ;SELECT 1;;") == ["SELECT 1"]
+
+
+def test_ignores_semicolons_in_string_literals():
+    sql = "INSERT INTO t VALUES ('a;b'); SELECT 'it''s; fine';"
+    assert split_statements(sql) == [
+        "INSERT INTO t VALUES ('a;b')",
+        "SELECT 'it''s; fine'",
+    ]
+
+
+def test_ignores_semicolons_in_comments():
+    sql = "-- first; still a comment\nSELECT 1; -- trailing; comment\nSELECT 2;"
+    assert split_statements(sql) == ["SELECT 1", "SELECT 2"]
+
+
+def test_keeps_dollar_quoted_bodies_whole():
+    body = """CREATE FUNCTION f() RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE t SET x = 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql"""
+    assert split_statements(body + ";\nSELECT 1;") == [body, "SELECT 1"]
+
+
+def test_keeps_tagged_dollar_quotes_whole():
+    sql = "DO $body$ BEGIN PERFORM 1; PERFORM $$x;$$; END $body$; SELECT 1"
+    assert split_statements(sql) == [
+        "DO $body$ BEGIN PERFORM 1; PERFORM $$x;$$; END $body$",
+        "SELECT 1",
+    ]
+
+
+def test_migration_marker_line_is_dropped_as_a_comment():
+    sql = "-- migrate: no-transaction\nCREATE INDEX CONCURRENTLY i ON t(x);\n"
+    assert split_statements(sql) == ["CREATE INDEX CONCURRENTLY i ON t(x)"]
+
+
+def test_migrations_are_numbered_without_gaps():
+    versions = [migration.version for migration in discover_migrations()]
+    assert versions == list(range(1, len(versions) + 1))
+
+
+def test_no_transaction_migrations_split_into_statements():
+    for migration in discover_migrations():
+        if not migration.transactional:
+            statements = split_statements(migration.sql)
+            assert statements, migration.name
+            assert all(not statement.startswith("--") for statement in statements)
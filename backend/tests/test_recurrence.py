@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+from backend.db.recurrence import (
+    expand_occurrences,
+    expand_rows,
+    iter_occurrences,
+    recurrence_end,
+    to_rrule,
+)
+
+UTC = timezone.utc
+
+
+def series(start, end=None, freq="weekly", **rule):
+    event = {"event_datetime_start": start, "event_datetime_end": end, "recurrence_freq": freq}
+    event.update({f"recurrence_{key}": value for key, value in rule.items()})
+    return event
+
+
+def starts(occurrences):
+    return [start for start, _ in occurrences]
+
+
+def test_monthly_keeps_the_day_of_month_and_clamps_short_months():
+    start = datetime(2025, 1, 31, 18)
+    assert list(islice(iter_occurrences(start, "monthly"), 4)) == [
+        datetime(2025, 1, 31, 18),
+        datetime(2025, 2, 28, 18),
+        datetime(2025, 3, 31, 18),
+        datetime(2025, 4, 30, 18),
+    ]
+
+
+def test_iter_occurrences_after_is_exclusive_and_until_inclusive():
+    start = datetime(2025, 3, 1, 9)
+    occurrences = list(iter_occurrences(
+        start, "daily", 2,
+        after=datetime(2025, 3, 5, 9),
+        until=datetime(2025, 3, 11, 9),
+    ))
+    assert occurrences == [datetime(2025, 3, 7, 9), datetime(2025, 3, 9, 9), datetime(2025, 3, 11, 9)]
+
+
+def test_recurrence_end():
+    start, end = datetime(2025, 3, 1, 9), datetime(2025, 3, 1, 10)
+    assert recurrence_end(start, end, "weekly") is None
+    assert recurrence_end(start, end, "weekly", count=3) == datetime(2025, 3, 15, 10)
+    assert recurrence_end(start, end, "weekly", until=datetime(2025, 3, 20)) == datetime(2025, 3, 15, 10)
+    # Whichever bound ends the series first wins
+    assert recurrence_end(start, end, "weekly", count=10, until=datetime(2025, 3, 9)) == datetime(2025, 3, 8, 10)
+    assert recurrence_end(start, None, "monthly", count=2) == datetime(2025, 4, 1, 9)
+
+
+def test_expansion_overlaps_the_window_inclusively():
+    start = datetime(2025, 3, 1, 9, tzinfo=UTC)
+    event = series(start, start + timedelta(hours=2), "daily")
+    occurrences = expand_occurrences(
+        event,
+        datetime(2025, 3, 3, 11, tzinfo=UTC),  # end of the 3rd's occurrence
+        datetime(2025, 3, 5, 9, tzinfo=UTC),  # start of the 5th's
+    )
+    assert starts(occurrences) == [
+        datetime(2025, 3, 3, 9, tzinfo=UTC),
+        datetime(2025, 3, 4, 9, tzinfo=UTC),
+        datetime(2025, 3, 5, 9, tzinfo=UTC),
+    ]
+    assert all(end - start == timedelta(hours=2) for start, end in occurrences)
+
+
+def test_expansion_honours_count_until_and_exdates():
+    start = datetime(2025, 3, 1, 9, tzinfo=UTC)
+    counted = series(start, freq="weekly", count=3, exdates=[start + timedelta(weeks=1)])
+    assert starts(expand_occurrences(counted)) == [start, start + timedelta(weeks=2)]
+
+    bounded = series(start, freq="daily", interval=3, until=start + timedelta(days=7))
+    assert starts(expand_occurrences(bounded)) == [start + timedelta(days=d) for d in (0, 3, 6)]
+
+
+def test_naive_windows_are_taken_as_utc_for_aware_series():
+    start = datetime(2025, 3, 1, 9, tzinfo=UTC)
+    occurrences = expand_occurrences(series(start, freq="daily"), datetime(2025, 3, 2), datetime(2025, 3, 3))
+    assert starts(occurrences) == [datetime(2025, 3, 2, 9, tzinfo=UTC)]
+
+
+def test_window_skip_ahead_matches_full_expansion():
+    start = datetime(2024, 1, 31, 20, tzinfo=UTC)
+    for freq, interval in (("daily", 1), ("daily", 5), ("weekly", 2), ("monthly", 1), ("monthly", 3)):
+        event = series(start, start + timedelta(hours=6), freq, interval=interval, count=400)
+        everything = expand_occurrences(event)
+        window_start = datetime(2025, 2, 28, 23, tzinfo=UTC)
+        window_end = datetime(2025, 6, 1, tzinfo=UTC)
+        expected = [(s, e) for s, e in everything if e >= window_start and s <= window_end]
+        assert expand_occurrences(event, window_start, window_end) == expected, (freq, interval)
+
+
+def test_expand_rows_interleaves_series_with_plain_events():
+    plain = {"event_id": 1, "event_datetime_start": datetime(2025, 3, 2, 12), "recurrence_freq": None}
+    weekly = dict(series(datetime(2025, 3, 1, 9), datetime(2025, 3, 1, 10), "daily", count=3), event_id=2)
+    rows = expand_rows([weekly, plain])
+    assert [(row["event_id"], row["event_datetime_start"].day) for row in rows] == [(2, 1), (2, 2), (1, 2), (2, 3)]
+    assert rows[-1]["event_datetime_end"] == datetime(2025, 3, 3, 10)
+
+
+def test_to_rrule():
+    start = datetime(2025, 3, 1, 9, tzinfo=UTC)
+    assert to_rrule(series(start, freq="weekly")) == "FREQ=WEEKLY"
+    assert to_rrule(series(start, freq="daily", interval=2, count=5)) == "FREQ=DAILY;INTERVAL=2;COUNT=5"
+    # COUNT and UNTIL may not both appear: keep the one that ends first
+    assert to_rrule(series(start, freq="daily", count=3, until=start + timedelta(days=10))) == "FREQ=DAILY;COUNT=3"
+    assert (to_rrule(series(start, freq="daily", count=30, until=datetime(2025, 3, 4, 9, tzinfo=UTC)))
+            == "FREQ=DAILY;UNTIL=20250304T090000Z")
@@ -0,0 +1,58 @@
+import random
+from collections import Counter
+
+from backend.db.rotation import WorkloadBalancer, random_fair, round_robin
+
+
+def test_round_robin_continues_where_it_left_off():
+    pool = [3, 5, 8]
+    picked, index = round_robin(pool, 0, 2)
+    assert (picked, index) == ([3, 5], 2)
+    picked, index = round_robin(pool, index, 2)
+    assert (picked, index) == ([8, 3], 1)
+
+
+def test_round_robin_never_picks_anyone_twice():
+    assert round_robin([3, 5, 8], 1, 10) == ([5, 8, 3], 1)
+    assert round_robin([], 4, 2) == ([], 4)
+
+
+def test_balancer_picks_least_loaded_with_ties_to_lower_id():
+    balancer = WorkloadBalancer({1: 5, 2: 0, 3: 0})
+    assert balancer.assign(effort=3) == [2]
+    assert balancer.assign(effort=3) == [3]
+    assert balancer.assign(effort=1, count=2) == [2, 3]
+    assert balancer.workloads == {1: 5, 2: 4, 3: 4}
+
+
+def test_balancer_exclude_leaves_members_available_later():
+    balancer = WorkloadBalancer({1: 0, 2: 1})
+    assert balancer.assign(effort=5, exclude={1}) == [2]
+    assert balancer.workloads == {1: 0, 2: 6}
+    assert balancer.assign(effort=1) == [1]
+
+
+def test_balancer_with_nobody_available():
+    assert WorkloadBalancer({}).assign(effort=1) == []
+    assert WorkloadBalancer({1: 0}).assign(effort=1, exclude={1}) == []
+
+
+def test_random_fair_evens_out_over_each_cycle():
+    pool, counts = [1, 2, 3, 4], {}
+    rng = random.Random(7)
+    cycle = []
+    for _ in range(len(pool)):
+        cycle += random_fair(pool, counts, 1, rng)
+    assert sorted(cycle) == pool
+    assert counts == {1: 1, 2: 1, 3: 1, 4: 1}
+
+
+def test_random_fair_prefers_members_who_took_it_least():
+    counts = {1: 2, 2: 0, 3: 1}
+    assert random_fair([1, 2, 3], counts, 2, random.Random(0)) == [2, 3]
+    assert counts == {1: 2, 2: 1, 3: 2}
+
+    counts = Counter()
+    for _ in range(30):
+        random_fair([1, 2, 3], counts, 2, random.Random(1))
+    assert set(counts.values()) == {20}